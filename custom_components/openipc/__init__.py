@@ -3,12 +3,13 @@ import asyncio
 import logging
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.core import Event, HomeAssistant
 from homeassistant.helpers import device_registry as dr
 
-from .const import DOMAIN
+from .const import DOMAIN, DATA_CONFIG, DATA_COORDINATORS, DATA_ENTITY_INDEX
 from .coordinator import OpenIPCDataUpdateCoordinator
+from .helpers import index_coordinator, unindex_coordinator
 from .services import async_register_services
 from .api_ha import async_register_api
 
@@ -24,9 +25,16 @@ PLATFORMS = [
     Platform.SELECT,
 ]
 
+def _async_init_domain_data(hass: HomeAssistant) -> dict:
+    """Create hass.data[DOMAIN] with its sections."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    domain_data.setdefault(DATA_COORDINATORS, {})
+    domain_data.setdefault(DATA_ENTITY_INDEX, {})
+    return domain_data
+
 async def async_setup(hass: HomeAssistant, config: dict):
     """Set up the OpenIPC component from YAML configuration."""
-    hass.data.setdefault(DOMAIN, {})
+    _async_init_domain_data(hass)
     
     # Читаем конфигурацию из YAML для Telegram
     if DOMAIN in config:
@@ -35,7 +43,7 @@ async def async_setup(hass: HomeAssistant, config: dict):
             "telegram_bot_token": conf.get("telegram_bot_token"),
             "telegram_chat_id": conf.get("telegram_chat_id"),
         }
-        hass.data[DOMAIN]["config"] = telegram_config
+        hass.data[DOMAIN][DATA_CONFIG] = telegram_config
         _LOGGER.info("✅ Telegram config loaded from YAML: bot_token=%s, chat_id=%s",
                     "✅" if telegram_config["telegram_bot_token"] else "❌",
                     telegram_config["telegram_chat_id"] or "❌")
@@ -46,29 +54,54 @@ async def async_setup(hass: HomeAssistant, config: dict):
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up OpenIPC from a config entry."""
-    hass.data.setdefault(DOMAIN, {})
+    _async_init_domain_data(hass)
     
     # Create coordinator for data updates
     coordinator = OpenIPCDataUpdateCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
     
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    # При остановке HA записи не выгружаются - сессию опроса закрываем сами
+    async def _async_close_on_stop(event: Event) -> None:
+        await coordinator.async_close()
+    
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_close_on_stop)
+    )
     
-    # Register services (они будут зарегистрированы только один раз)
-    await async_register_services(hass)
+    # Запись считается настраиваемой с этого момента: неудачный setup другой
+    # записи не должен удалить сервисы, пока идет ее первый опрос
+    coordinators = hass.data[DOMAIN][DATA_COORDINATORS]
+    coordinators[entry.entry_id] = coordinator
     
-    # Register API endpoints for addon
-    await async_register_api(hass)
+    # Первый опрос камеры идет параллельно с регистрацией сервисов (они будут
+    # зарегистрированы только один раз) и API эндпоинтов для addon
+    try:
+        await asyncio.gather(
+            coordinator.async_config_entry_first_refresh(),
+            async_register_services(hass),
+            async_register_api(hass),
+        )
+    except Exception:
+        # Неудачный setup (ConfigEntryNotReady и т.п.) не должен оставлять открытую сессию опроса
+        await coordinator.async_close()
+        coordinators.pop(entry.entry_id, None)
+        # unload для неудачного setup не вызывается - сервисы без записей удаляем здесь
+        if not coordinators:
+            from .services import async_remove_services
+            await async_remove_services(hass)
+        raise
     _LOGGER.info("✅ OpenIPC API endpoints registered")
     
-    # Set up all platforms
+    index_coordinator(hass, coordinator)
+    
+    # Set up all platforms (сущностям нужны данные первого опроса)
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
     return True
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    coordinator = hass.data[DOMAIN].get(entry.entry_id)
+    coordinators = hass.data[DOMAIN][DATA_COORDINATORS]
+    coordinator = coordinators.get(entry.entry_id)
     
     # Останавливаем QR-сканер
     if coordinator and hasattr(coordinator, 'qr_scanner') and coordinator.qr_scanner:
@@ -76,10 +109,13 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinators.pop(entry.entry_id)
+        if coordinator:
+            unindex_coordinator(hass, coordinator)
+            await coordinator.async_close()
     
     # Если это была последняя запись, удаляем сервисы
-    if not hass.data[DOMAIN] or (len(hass.data[DOMAIN]) == 1 and "config" in hass.data[DOMAIN]):
+    if not coordinators:
         from .services import async_remove_services
         await async_remove_services(hass)
     
@@ -105,10 +141,7 @@ async def async_get_cameras(hass: HomeAssistant) -> list:
     """Получить список всех камер OpenIPC."""
     cameras = []
     
-    for entry_id, coordinator in hass.data[DOMAIN].items():
-        if entry_id == "config":
-            continue
-        
+    for entry_id, coordinator in hass.data[DOMAIN][DATA_COORDINATORS].items():
         if hasattr(coordinator, 'host'):
             # Получаем модель из данных
             model = "Unknown"
@@ -1,18 +1,50 @@
 """API calls to OpenIPC cameras."""
+import asyncio
 import logging
+import re
 import aiohttp
 from typing import Optional, Dict, Any
 
+from homeassistant.util.json import json_loads
+
 _LOGGER = logging.getLogger(__name__)
 
+# Строка Prometheus: имя, необязательные {лейблы} и значение; комментарии (#) не совпадают
+_METRIC_RE = re.compile(r'[ \t]*([A-Za-z_:][\w:]*)(?:\{([^}]*)\})?[ \t]+(\S+)')
+_LABEL_RE = re.compile(r'([^,=\s]+)\s*=\s*"([^"]*)"')
+
+def _conditional_headers(coordinator, url):
+    """Return request headers, with If-None-Match when the last response had an ETag."""
+    cached = coordinator._etag_cache.get(url)
+    if cached is None:
+        return coordinator.headers
+    return {**coordinator.headers, "If-None-Match": cached[0]}
+
+def _not_modified(coordinator, url):
+    """Return the result cached for a 304 response."""
+    cached = coordinator._etag_cache.get(url)
+    return cached[1] if cached is not None else {}
+
+def _remember(coordinator, url, response, result):
+    """Cache the parsed result under the response ETag, if any."""
+    etag = response.headers.get("ETag")
+    if etag:
+        coordinator._etag_cache[url] = (etag, result)
+    else:
+        coordinator._etag_cache.pop(url, None)
+    return result
+
 async def get_json_config(coordinator):
     """Get JSON configuration from camera."""
     url = f"http://{coordinator.host}:{coordinator.port}/api/v1/config.json"
     try:
-        async with coordinator.session.get(url, auth=coordinator.auth, timeout=5) as response:
+        async with coordinator.poll_session.get(url, headers=_conditional_headers(coordinator, url), timeout=5) as response:
+            if response.status == 304:
+                return _not_modified(coordinator, url)
             if response.status == 200:
                 try:
-                    return await response.json()
+                    # orjson (json_loads HA) разбирает байты напрямую, без декодирования в str
+                    return _remember(coordinator, url, response, json_loads(await response.read()))
                 except ValueError as e:
                     _LOGGER.debug(f"Failed to parse JSON from {url}: {e}")
                     return {}
@@ -25,18 +57,20 @@ async def get_json_config(coordinator):
     except asyncio.TimeoutError:
         _LOGGER.debug(f"Timeout getting {url}")
         return {}
-    except Exception as e:
-        _LOGGER.debug(f"Unexpected error getting {url}: {e}")
-        return {}
 
 async def get_metrics(coordinator):
     """Get Prometheus metrics from camera."""
     url = f"http://{coordinator.host}:{coordinator.port}/metrics"
     try:
-        async with coordinator.session.get(url, auth=coordinator.auth, timeout=5) as response:
+        async with coordinator.poll_session.get(url, headers=_conditional_headers(coordinator, url), timeout=5) as response:
+            if response.status == 304:
+                return _not_modified(coordinator, url)
             if response.status == 200:
-                text = await response.text()
-                return _parse_metrics_text(text)
+                # Разбираем построчно по мере получения, без буфера всего ответа
+                metrics = {}
+                async for line in response.content:
+                    _parse_metric_line(line.decode('utf-8', 'replace'), metrics)
+                return _remember(coordinator, url, response, metrics)
             else:
                 _LOGGER.debug(f"HTTP {response.status} from {url}")
             return {}
@@ -46,8 +80,9 @@ async def get_metrics(coordinator):
     except asyncio.TimeoutError:
         _LOGGER.debug(f"Timeout getting metrics")
         return {}
-    except Exception as e:
-        _LOGGER.debug(f"Unexpected error getting metrics: {e}")
+    except ValueError as e:
+        # StreamReader отдает ValueError на слишком длинной строке
+        _LOGGER.debug(f"Invalid metrics response: {e}")
         return {}
 
 async def get_camera_status(coordinator):
@@ -61,91 +96,63 @@ async def send_command(coordinator, command, params=None):
     if params:
         url += f"?{params}"
     try:
-        async with coordinator.session.get(url, auth=coordinator.auth, timeout=5) as response:
+        async with coordinator.poll_session.get(url, headers=coordinator.headers, timeout=5) as response:
             return response.status == 200
-    except aiohttp.ClientError:
-        return False
-    except asyncio.TimeoutError:
-        return False
-    except Exception:
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
         return False
 
 async def _fetch_url(coordinator, url):
     """Fetch URL with error handling."""
     try:
-        async with coordinator.session.get(url, auth=coordinator.auth, timeout=5) as response:
+        async with coordinator.poll_session.get(url, headers=_conditional_headers(coordinator, url), timeout=5) as response:
+            if response.status == 304:
+                return _not_modified(coordinator, url)
             if response.status == 200:
                 # Пробуем разные кодировки
                 try:
                     text = await response.text(encoding='utf-8')
-                    return {"raw": text, "status": response.status}
                 except UnicodeDecodeError:
-                    try:
-                        text = await response.text(encoding='latin-1')
-                        return {"raw": text, "status": response.status}
-                    except:
-                        return {"raw": "", "status": response.status}
+                    # latin-1 декодирует любые байты
+                    text = await response.text(encoding='latin-1')
+                return _remember(coordinator, url, response, {"raw": text, "status": response.status})
             return {"status": response.status}
     except aiohttp.ClientError:
         return {"status": 0, "error": "connection_error"}
     except asyncio.TimeoutError:
         return {"status": 0, "error": "timeout"}
-    except Exception:
+    except ValueError:
         return {"status": 0, "error": "unknown"}
 
-def _parse_metrics_text(text):
-    """Parse Prometheus metrics format."""
-    metrics = {}
-    lines = text.strip().split('\n')
+def _parse_metric_line(line, metrics):
+    """Parse one Prometheus metrics line into the metrics dict."""
+    match = _METRIC_RE.match(line)
+    if match is None:
+        return
+    name, labels_part, value_part = match.groups()
+    try:
+        value = float(value_part)
+    except ValueError:
+        return
     
-    for line in lines:
-        line = line.strip()
-        if not line or line.startswith('#'):
-            continue
-        
-        # Парсим метрики с лейблами
-        if '{' in line and '}' in line:
-            try:
-                name_part = line[:line.index('{')]
-                labels_part = line[line.index('{')+1:line.index('}')]
-                value_part = line[line.index('}')+1:].strip()
-                
-                labels = {}
-                for label in labels_part.split(','):
-                    if '=' in label:
-                        k, v = label.split('=', 1)
-                        labels[k.strip()] = v.strip().strip('"')
-                
-                try:
-                    value = float(value_part)
-                except ValueError:
-                    continue
-                
-                if name_part not in metrics:
-                    metrics[name_part] = {}
-                
-                if len(labels) == 1 and 'device' in labels:
-                    metrics[name_part][labels['device']] = value
-                else:
-                    label_key = ','.join([f"{k}={v}" for k, v in labels.items()])
-                    if name_part not in metrics:
-                        metrics[name_part] = {}
-                    metrics[name_part][label_key] = value
-            except Exception as e:
-                _LOGGER.debug(f"Error parsing metric line '{line}': {e}")
-                continue
-        else:
-            # Простые метрики без лейблов
-            parts = line.split()
-            if len(parts) >= 2:
-                name = parts[0]
-                try:
-                    value = float(parts[1])
-                    metrics[name] = value
-                except ValueError:
-                    continue
+    if not labels_part:
+        # Простые метрики без лейблов
+        metrics[name] = value
+        return
+    
+    bucket = metrics.get(name)
+    if not isinstance(bucket, dict):
+        bucket = metrics[name] = {}
+    
+    # Частый случай {device="..."} - без разбора лейблов
+    if labels_part.startswith('device="') and labels_part.endswith('"') and ',' not in labels_part:
+        bucket[labels_part[8:-1]] = value
+        return
     
-    return metrics
+    labels = _LABEL_RE.findall(labels_part)
+    if len(labels) == 1 and labels[0][0] == 'device':
+        bucket[labels[0][1]] = value
+    else:
+        bucket[','.join(f"{k}={v}" for k, v in labels)] = value
 
 # ==================== API для интеграции с аддоном ====================
 
@@ -32,14 +32,11 @@ class OpenIPCCamerasView(HomeAssistantView):
 
 async def async_get_cameras(hass: HomeAssistant) -> list:
     """Получить список всех камер OpenIPC."""
-    from . import DOMAIN
+    from .const import DOMAIN, DATA_COORDINATORS
     
     cameras = []
     
-    for entry_id, coordinator in hass.data[DOMAIN].items():
-        if entry_id == "config":
-            continue
-        
+    for entry_id, coordinator in hass.data[DOMAIN][DATA_COORDINATORS].items():
         if hasattr(coordinator, 'host'):
             # Получаем модель из данных
             model = "Unknown"
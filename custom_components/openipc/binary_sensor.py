@@ -6,11 +6,11 @@ from homeassistant.components.binary_sensor import (
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity import EntityCategory
 
-from .const import DOMAIN, BINARY_SENSOR_TYPES, DEVICE_TYPE_BEWARD
+from .const import DOMAIN, DATA_COORDINATORS, BINARY_SENSOR_TYPES, DEVICE_TYPE_BEWARD
 
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up OpenIPC binary sensors."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = hass.data[DOMAIN][DATA_COORDINATORS][entry.entry_id]
     device_type = entry.data.get("device_type", "openipc")
     
     entities = []
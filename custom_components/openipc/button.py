@@ -3,6 +3,7 @@ import logging
 import asyncio
 import aiohttp
 from datetime import datetime
+from functools import partial
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -10,6 +11,7 @@ from homeassistant.helpers.entity import EntityCategory
 
 from .const import (
     DOMAIN, 
+    DATA_COORDINATORS,
     API_REBOOT, 
     RECORD_START, 
     RECORD_STOP,
@@ -35,9 +37,43 @@ RECORDING_PRESETS = {
     "10m": 600,
 }
 
+async def _async_record_timed(coordinator, duration, save_to_ha, method="snapshots"):
+    """Record for the given duration on the camera SD card or to HA media."""
+    await coordinator.async_start_timed_recording(duration, save_to_ha=save_to_ha, method=method)
+
+async def _async_record_telegram(coordinator, duration, method):
+    """Record for the given duration and send the video to Telegram."""
+    await coordinator.async_record_and_send_telegram(
+        duration,
+        method=method,
+        caption=f"📹 Запись с камеры {coordinator.entry.data.get('name')}\n⏱ {duration} секунд"
+    )
+
+# Варианты кнопок записи по таймеру: (суффикс имени, префикс id, иконка, куда пишем, действие)
+TIMED_RECORD_VARIANTS = (
+    ("(Camera SD)", "record_sd", "mdi:sd", "camera SD",
+     partial(_async_record_timed, save_to_ha=False)),
+    ("(HA Media)", "record_ha", "mdi:home-assistant", "HA Media (snapshots)",
+     partial(_async_record_timed, save_to_ha=True, method="snapshots")),
+    ("(RTSP)", "record_rtsp", "mdi:video", "HA Media (RTSP)",
+     partial(_async_record_timed, save_to_ha=True, method="rtsp")),
+    ("+ Telegram", "telegram", "mdi:telegram", "Telegram",
+     partial(_async_record_telegram, method="snapshots")),
+    ("+ Telegram (RTSP)", "telegram_rtsp", "mdi:telegram", "Telegram (RTSP)",
+     partial(_async_record_telegram, method="rtsp")),
+)
+
+# Готовые спецификации кнопок записи (имя, id, длительность, иконка, куда пишем, действие) -
+# не зависят от камеры, поэтому f-строки вычисляются один раз при импорте
+BUTTON_SPECS = tuple(
+    (f"Record {name} {suffix}", f"{id_prefix}_{name}", duration, icon, target, action)
+    for suffix, id_prefix, icon, target, action in TIMED_RECORD_VARIANTS
+    for name, duration in RECORDING_PRESETS.items()
+)
+
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up OpenIPC buttons."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = hass.data[DOMAIN][DATA_COORDINATORS][entry.entry_id]
     device_type = entry.data.get(CONF_DEVICE_TYPE, "openipc")
     
     entities = []
@@ -49,67 +85,10 @@ async def async_setup_entry(hass, entry, async_add_entities):
         OpenIPCButton(coordinator, entry, "Stop Recording", "record_stop", RECORD_STOP, "mdi:stop"),
     ])
     
-    # Кнопки для записи на SD карту камеры
-    for name, duration in RECORDING_PRESETS.items():
-        entities.append(
-            OpenIPCRecordTimerButton(
-                coordinator, entry, 
-                f"Record {name} (Camera SD)", 
-                f"record_sd_{name}", 
-                duration,
-                "mdi:sd"
-            )
-        )
-    
-    # Кнопки для записи в Home Assistant media
-    for name, duration in RECORDING_PRESETS.items():
-        entities.append(
-            OpenIPCHARecordButton(
-                coordinator, entry,
-                f"Record {name} (HA Media)",
-                f"record_ha_{name}",
-                duration,
-                "mdi:home-assistant"
-            )
-        )
-    
-    # Кнопки для RTSP записи в HA media
-    for name, duration in RECORDING_PRESETS.items():
-        entities.append(
-            OpenIPCRTSPRecordButton(
-                coordinator, entry,
-                f"Record {name} (RTSP)",
-                f"record_rtsp_{name}",
-                duration,
-                "mdi:video"
-            )
-        )
-    
-    # Кнопки для записи и отправки в Telegram
-    for name, duration in RECORDING_PRESETS.items():
-        entities.append(
-            OpenIPCTelegramRecordButton(
-                coordinator, entry,
-                f"Record {name} + Telegram",
-                f"telegram_{name}",
-                duration,
-                "mdi:telegram",
-                method="snapshots"
-            )
-        )
-    
-    # Кнопки для RTSP записи и отправки в Telegram
-    for name, duration in RECORDING_PRESETS.items():
-        entities.append(
-            OpenIPCTelegramRecordButton(
-                coordinator, entry,
-                f"Record {name} + Telegram (RTSP)",
-                f"telegram_rtsp_{name}",
-                duration,
-                "mdi:telegram",
-                method="rtsp"
-            )
-        )
+    # Кнопки записи по таймеру - спецификации посчитаны при импорте
+    entities.extend(
+        OpenIPCTimedRecordButton(coordinator, entry, *spec) for spec in BUTTON_SPECS
+    )
     
     # QR-код кнопки для всех камер
     entities.extend([
@@ -173,6 +152,7 @@ class OpenIPCButton(CoordinatorEntity, ButtonEntity):
         super().__init__(coordinator)
         self.coordinator = coordinator
         self.entry = entry
+        self._camera_name = entry.data.get("name", "OpenIPC Camera")
         self.button_id = button_id
         self.api_command = api_command
         self._attr_name = f"{entry.data.get('name', 'OpenIPC')} {name}"
@@ -181,7 +161,7 @@ class OpenIPCButton(CoordinatorEntity, ButtonEntity):
 
     async def async_press(self) -> None:
         """Handle the button press."""
-        _LOGGER.debug("Pressing button %s for camera %s", self.button_id, self.entry.data.get('name'))
+        _LOGGER.debug("Pressing button %s for camera %s", self.button_id, self._camera_name)
         
         if self.button_id == "record_start":
             await self.coordinator.async_start_recording()
@@ -193,166 +173,37 @@ class OpenIPCButton(CoordinatorEntity, ButtonEntity):
     @property
     def device_info(self):
         """Return device info."""
-        parsed = self.coordinator.data.get("parsed", {})
-        return {
-            "identifiers": {(DOMAIN, self.entry.entry_id)},
-            "name": self.entry.data.get("name", "OpenIPC Camera"),
-            "manufacturer": "OpenIPC",
-            "model": parsed.get("model", "Camera"),
-            "sw_version": parsed.get("firmware", "Unknown"),
-        }
+        return self.coordinator.device_info()
 
 
-class OpenIPCRecordTimerButton(CoordinatorEntity, ButtonEntity):
-    """Button for timed recording on camera SD card."""
+class OpenIPCTimedRecordButton(CoordinatorEntity, ButtonEntity):
+    """Button for timed recording (camera SD, HA media or Telegram)."""
 
-    def __init__(self, coordinator, entry, name, button_id, duration, icon):
+    def __init__(self, coordinator, entry, name, button_id, duration, icon, target, action):
         """Initialize the button."""
         super().__init__(coordinator)
         self.coordinator = coordinator
         self.entry = entry
+        self._camera_name = entry.data.get("name", "OpenIPC Camera")
         self.button_id = button_id
         self.duration = duration
+        self.target = target
+        self._action = action
         self._attr_name = f"{entry.data.get('name', 'OpenIPC')} {name}"
         self._attr_unique_id = f"{entry.entry_id}_{button_id}"
         self._attr_icon = icon
 
     async def async_press(self) -> None:
         """Handle the button press."""
-        _LOGGER.info("Starting %d second recording on camera SD for %s", 
-                     self.duration, self.entry.data.get('name'))
+        _LOGGER.info("Starting %d second recording to %s for %s", 
+                     self.duration, self.target, self._camera_name)
         
-        await self.coordinator.async_start_timed_recording(self.duration, save_to_ha=False)
+        await self._action(self.coordinator, self.duration)
 
     @property
     def device_info(self):
         """Return device info."""
-        parsed = self.coordinator.data.get("parsed", {})
-        return {
-            "identifiers": {(DOMAIN, self.entry.entry_id)},
-            "name": self.entry.data.get("name", "OpenIPC Camera"),
-            "manufacturer": "OpenIPC",
-            "model": parsed.get("model", "Camera"),
-            "sw_version": parsed.get("firmware", "Unknown"),
-        }
-
-
-class OpenIPCHARecordButton(CoordinatorEntity, ButtonEntity):
-    """Button for recording to Home Assistant media folder using snapshots."""
-
-    def __init__(self, coordinator, entry, name, button_id, duration, icon):
-        """Initialize the button."""
-        super().__init__(coordinator)
-        self.coordinator = coordinator
-        self.entry = entry
-        self.button_id = button_id
-        self.duration = duration
-        self._attr_name = f"{entry.data.get('name', 'OpenIPC')} {name}"
-        self._attr_unique_id = f"{entry.entry_id}_{button_id}"
-        self._attr_icon = icon
-
-    async def async_press(self) -> None:
-        """Handle the button press."""
-        _LOGGER.info("Starting %d second recording to HA Media for %s (snapshots)", 
-                     self.duration, self.entry.data.get('name'))
-        
-        await self.coordinator.async_start_timed_recording(
-            self.duration, 
-            save_to_ha=True, 
-            method="snapshots"
-        )
-
-    @property
-    def device_info(self):
-        """Return device info."""
-        parsed = self.coordinator.data.get("parsed", {})
-        return {
-            "identifiers": {(DOMAIN, self.entry.entry_id)},
-            "name": self.entry.data.get("name", "OpenIPC Camera"),
-            "manufacturer": "OpenIPC",
-            "model": parsed.get("model", "Camera"),
-            "sw_version": parsed.get("firmware", "Unknown"),
-        }
-
-
-class OpenIPCRTSPRecordButton(CoordinatorEntity, ButtonEntity):
-    """Button for recording to Home Assistant media folder using RTSP stream."""
-
-    def __init__(self, coordinator, entry, name, button_id, duration, icon):
-        """Initialize the button."""
-        super().__init__(coordinator)
-        self.coordinator = coordinator
-        self.entry = entry
-        self.button_id = button_id
-        self.duration = duration
-        self._attr_name = f"{entry.data.get('name', 'OpenIPC')} {name}"
-        self._attr_unique_id = f"{entry.entry_id}_{button_id}"
-        self._attr_icon = icon
-
-    async def async_press(self) -> None:
-        """Handle the button press."""
-        _LOGGER.info("Starting %d second recording to HA Media for %s (RTSP)", 
-                     self.duration, self.entry.data.get('name'))
-        
-        await self.coordinator.async_start_timed_recording(
-            self.duration, 
-            save_to_ha=True, 
-            method="rtsp"
-        )
-
-    @property
-    def device_info(self):
-        """Return device info."""
-        parsed = self.coordinator.data.get("parsed", {})
-        return {
-            "identifiers": {(DOMAIN, self.entry.entry_id)},
-            "name": self.entry.data.get("name", "OpenIPC Camera"),
-            "manufacturer": "OpenIPC",
-            "model": parsed.get("model", "Camera"),
-            "sw_version": parsed.get("firmware", "Unknown"),
-        }
-
-
-class OpenIPCTelegramRecordButton(CoordinatorEntity, ButtonEntity):
-    """Button for recording and sending to Telegram."""
-
-    def __init__(self, coordinator, entry, name, button_id, duration, icon, method="snapshots"):
-        """Initialize the button."""
-        super().__init__(coordinator)
-        self.coordinator = coordinator
-        self.entry = entry
-        self.button_id = button_id
-        self.duration = duration
-        self.method = method
-        self._attr_name = f"{entry.data.get('name', 'OpenIPC')} {name}"
-        self._attr_unique_id = f"{entry.entry_id}_{button_id}"
-        self._attr_icon = icon
-
-    async def async_press(self) -> None:
-        """Handle the button press."""
-        _LOGGER.info("Recording %d seconds and sending to Telegram for %s", 
-                     self.duration, self.entry.data.get('name'))
-        
-        if hasattr(self.coordinator, 'async_record_and_send_telegram'):
-            await self.coordinator.async_record_and_send_telegram(
-                self.duration, 
-                method=self.method,
-                caption=f"📹 Запись с камеры {self.entry.data.get('name')}\n⏱ {self.duration} секунд"
-            )
-        else:
-            _LOGGER.error("Telegram recording method not available")
-
-    @property
-    def device_info(self):
-        """Return device info."""
-        parsed = self.coordinator.data.get("parsed", {})
-        return {
-            "identifiers": {(DOMAIN, self.entry.entry_id)},
-            "name": self.entry.data.get("name", "OpenIPC Camera"),
-            "manufacturer": "OpenIPC",
-            "model": parsed.get("model", "Camera"),
-            "sw_version": parsed.get("firmware", "Unknown"),
-        }
+        return self.coordinator.device_info()
 
 
 # ==================== QR Code Buttons ====================
@@ -365,6 +216,7 @@ class OpenIPCQRScanButton(CoordinatorEntity, ButtonEntity):
         super().__init__(coordinator)
         self.coordinator = coordinator
         self.entry = entry
+        self._camera_name = entry.data.get("name", "OpenIPC Camera")
         self.duration = duration
         self._attr_name = f"{entry.data.get('name', 'OpenIPC')} QR Scan ({duration_label})"
         self._attr_unique_id = f"{entry.entry_id}_qr_scan_{duration}"
@@ -373,7 +225,7 @@ class OpenIPCQRScanButton(CoordinatorEntity, ButtonEntity):
 
     async def async_press(self) -> None:
         """Handle the button press."""
-        _LOGGER.info(f"📸 Manual QR scan triggered for {self.entry.data.get('name')} ({self.duration}s)")
+        _LOGGER.info("📸 Manual QR scan triggered for %s (%ss)", self._camera_name, self.duration)
         
         if hasattr(self.coordinator, 'qr_scanner'):
             await self.coordinator.qr_scanner.async_activate(
@@ -386,7 +238,7 @@ class OpenIPCQRScanButton(CoordinatorEntity, ButtonEntity):
                 "persistent_notification",
                 "create",
                 {
-                    "title": f"📸 QR Scan Activated - {self.entry.data.get('name')}",
+                    "title": f"📸 QR Scan Activated - {self._camera_name}",
                     "message": f"QR сканирование включено на {self.duration} секунд",
                     "notification_id": f"openipc_qr_scan_{self.entry.entry_id}"
                 }
@@ -398,7 +250,7 @@ class OpenIPCQRScanButton(CoordinatorEntity, ButtonEntity):
         parsed = self.coordinator.data.get("parsed", {})
         return {
             "identifiers": {(DOMAIN, self.entry.entry_id)},
-            "name": self.entry.data.get("name", "OpenIPC Camera"),
+            "name": self._camera_name,
             "manufacturer": "OpenIPC",
             "model": parsed.get("model", "Camera"),
         }
@@ -412,6 +264,7 @@ class OpenIPCQRModeButton(CoordinatorEntity, ButtonEntity):
         super().__init__(coordinator)
         self.coordinator = coordinator
         self.entry = entry
+        self._camera_name = entry.data.get("name", "OpenIPC Camera")
         self._mode = mode
         self._attr_name = f"{entry.data.get('name', 'OpenIPC')} QR {name}"
         self._attr_unique_id = f"{entry.entry_id}_qr_mode_{mode}"
@@ -429,14 +282,14 @@ class OpenIPCQRModeButton(CoordinatorEntity, ButtonEntity):
                 "disabled": QRMode.DISABLED
             }
             self.coordinator.qr_scanner.mode = mode_map.get(self._mode, QRMode.DISABLED)
-            _LOGGER.info(f"QR mode set to {self._mode} for {self.entry.data.get('name')}")
+            _LOGGER.info("QR mode set to %s for %s", self._mode, self._camera_name)
             
             # Показываем уведомление
             await self.hass.services.async_call(
                 "persistent_notification",
                 "create",
                 {
-                    "title": f"📸 QR Mode Changed - {self.entry.data.get('name')}",
+                    "title": f"📸 QR Mode Changed - {self._camera_name}",
                     "message": f"Режим QR сканирования изменен на: {self._mode}",
                     "notification_id": f"openipc_qr_mode_{self.entry.entry_id}"
                 }
@@ -448,7 +301,7 @@ class OpenIPCQRModeButton(CoordinatorEntity, ButtonEntity):
         parsed = self.coordinator.data.get("parsed", {})
         return {
             "identifiers": {(DOMAIN, self.entry.entry_id)},
-            "name": self.entry.data.get("name", "OpenIPC Camera"),
+            "name": self._camera_name,
             "manufacturer": "OpenIPC",
             "model": parsed.get("model", "Camera"),
         }
@@ -462,6 +315,7 @@ class OpenIPCQRStopButton(CoordinatorEntity, ButtonEntity):
         super().__init__(coordinator)
         self.coordinator = coordinator
         self.entry = entry
+        self._camera_name = entry.data.get("name", "OpenIPC Camera")
         self._attr_name = f"{entry.data.get('name', 'OpenIPC')} QR Stop"
         self._attr_unique_id = f"{entry.entry_id}_qr_stop"
         self._attr_icon = "mdi:stop"
@@ -469,7 +323,7 @@ class OpenIPCQRStopButton(CoordinatorEntity, ButtonEntity):
 
     async def async_press(self) -> None:
         """Handle the button press."""
-        _LOGGER.info(f"🛑 QR scanning stopped for {self.entry.data.get('name')}")
+        _LOGGER.info("🛑 QR scanning stopped for %s", self._camera_name)
         
         if hasattr(self.coordinator, 'qr_scanner'):
             await self.coordinator.qr_scanner.async_deactivate()
@@ -478,7 +332,7 @@ class OpenIPCQRStopButton(CoordinatorEntity, ButtonEntity):
                 "persistent_notification",
                 "create",
                 {
-                    "title": f"🛑 QR Scan Stopped - {self.entry.data.get('name')}",
+                    "title": f"🛑 QR Scan Stopped - {self._camera_name}",
                     "message": "QR сканирование остановлено",
                     "notification_id": f"openipc_qr_stop_{self.entry.entry_id}"
                 }
@@ -490,7 +344,7 @@ class OpenIPCQRStopButton(CoordinatorEntity, ButtonEntity):
         parsed = self.coordinator.data.get("parsed", {})
         return {
             "identifiers": {(DOMAIN, self.entry.entry_id)},
-            "name": self.entry.data.get("name", "OpenIPC Camera"),
+            "name": self._camera_name,
             "manufacturer": "OpenIPC",
             "model": parsed.get("model", "Camera"),
         }
@@ -506,6 +360,7 @@ class BewardOpenDoorButton(CoordinatorEntity, ButtonEntity):
         super().__init__(coordinator)
         self.coordinator = coordinator
         self.entry = entry
+        self._camera_name = entry.data.get("name", "Beward Doorbell")
         self.relay_id = relay_id
         self._attr_name = f"{entry.data.get('name', 'Beward')} Open {name_suffix}"
         self._attr_unique_id = f"{entry.entry_id}_beward_open_door_{relay_id}"
@@ -524,7 +379,7 @@ class BewardOpenDoorButton(CoordinatorEntity, ButtonEntity):
         """Return device info."""
         return {
             "identifiers": {(DOMAIN, self.entry.entry_id)},
-            "name": self.entry.data.get("name", "Beward Doorbell"),
+            "name": self._camera_name,
             "manufacturer": "Beward",
             "model": "DS07P-LP",
         }
@@ -538,6 +393,7 @@ class BewardLNPRListButton(CoordinatorEntity, ButtonEntity):
         super().__init__(coordinator)
         self.coordinator = coordinator
         self.entry = entry
+        self._camera_name = entry.data.get("name", "Beward Doorbell")
         self._attr_name = f"{entry.data.get('name', 'Beward')} Get Plates List"
         self._attr_unique_id = f"{entry.entry_id}_beward_lnpr_list"
         self._attr_icon = "mdi:format-list-numbered"
@@ -549,7 +405,7 @@ class BewardLNPRListButton(CoordinatorEntity, ButtonEntity):
             _LOGGER.error("Beward device not available")
             return
         
-        _LOGGER.info("📋 Getting LNPR whitelist from %s", self.entry.data.get('name'))
+        _LOGGER.info("📋 Getting LNPR whitelist from %s", self._camera_name)
         
         try:
             url = f"http://{self.coordinator.beward.host}{LNPR_LIST}"
@@ -575,7 +431,7 @@ class BewardLNPRListButton(CoordinatorEntity, ButtonEntity):
                         "persistent_notification",
                         "create",
                         {
-                            "title": f"LNPR Whitelist - {self.entry.data.get('name')}",
+                            "title": f"LNPR Whitelist - {self._camera_name}",
                             "message": message,
                             "notification_id": f"openipc_lnpr_list_{self.entry.entry_id}"
                         }
@@ -590,7 +446,7 @@ class BewardLNPRListButton(CoordinatorEntity, ButtonEntity):
         """Return device info."""
         return {
             "identifiers": {(DOMAIN, self.entry.entry_id)},
-            "name": self.entry.data.get("name", "Beward Doorbell"),
+            "name": self._camera_name,
             "manufacturer": "Beward",
             "model": "DS07P-LP",
         }
@@ -604,6 +460,7 @@ class BewardLNPREmptyButton(CoordinatorEntity, ButtonEntity):
         super().__init__(coordinator)
         self.coordinator = coordinator
         self.entry = entry
+        self._camera_name = entry.data.get("name", "Beward Doorbell")
         self._attr_name = f"{entry.data.get('name', 'Beward')} Clear Plates List"
         self._attr_unique_id = f"{entry.entry_id}_beward_lnpr_clear"
         self._attr_icon = "mdi:delete-sweep"
@@ -615,7 +472,7 @@ class BewardLNPREmptyButton(CoordinatorEntity, ButtonEntity):
             _LOGGER.error("Beward device not available")
             return
         
-        _LOGGER.info("🧹 Clearing LNPR whitelist for %s", self.entry.data.get('name'))
+        _LOGGER.info("🧹 Clearing LNPR whitelist for %s", self._camera_name)
         
         try:
             url = f"http://{self.coordinator.beward.host}{LNPR_CLEAR}"
@@ -625,7 +482,7 @@ class BewardLNPREmptyButton(CoordinatorEntity, ButtonEntity):
                         "persistent_notification",
                         "create",
                         {
-                            "title": f"✅ LNPR - {self.entry.data.get('name')}",
+                            "title": f"✅ LNPR - {self._camera_name}",
                             "message": "Список разрешенных номеров успешно очищен",
                             "notification_id": f"openipc_lnpr_clear_{self.entry.entry_id}"
                         }
@@ -640,7 +497,7 @@ class BewardLNPREmptyButton(CoordinatorEntity, ButtonEntity):
         """Return device info."""
         return {
             "identifiers": {(DOMAIN, self.entry.entry_id)},
-            "name": self.entry.data.get("name", "Beward Doorbell"),
+            "name": self._camera_name,
             "manufacturer": "Beward",
             "model": "DS07P-LP",
         }
@@ -654,6 +511,7 @@ class BewardLNPREventsButton(CoordinatorEntity, ButtonEntity):
         super().__init__(coordinator)
         self.coordinator = coordinator
         self.entry = entry
+        self._camera_name = entry.data.get("name", "Beward Doorbell")
         self._attr_name = f"{entry.data.get('name', 'Beward')} Export LNPR Events"
         self._attr_unique_id = f"{entry.entry_id}_beward_lnpr_export"
         self._attr_icon = "mdi:export"
@@ -665,7 +523,7 @@ class BewardLNPREventsButton(CoordinatorEntity, ButtonEntity):
             _LOGGER.error("Beward device not available")
             return
         
-        _LOGGER.info("📊 Exporting LNPR events from %s", self.entry.data.get('name'))
+        _LOGGER.info("📊 Exporting LNPR events from %s", self._camera_name)
         
         from datetime import datetime, timedelta
         
@@ -689,7 +547,7 @@ class BewardLNPREventsButton(CoordinatorEntity, ButtonEntity):
                         "persistent_notification",
                         "create",
                         {
-                            "title": f"📊 LNPR Events - {self.entry.data.get('name')}",
+                            "title": f"📊 LNPR Events - {self._camera_name}",
                             "message": f"✅ Экспорт завершен\n\n"
                                       f"📁 Файл: {filename}\n"
                                       f"📅 Период: {start_str} - {end_str}\n"
@@ -707,7 +565,7 @@ class BewardLNPREventsButton(CoordinatorEntity, ButtonEntity):
         """Return device info."""
         return {
             "identifiers": {(DOMAIN, self.entry.entry_id)},
-            "name": self.entry.data.get("name", "Beward Doorbell"),
+            "name": self._camera_name,
             "manufacturer": "Beward",
             "model": "DS07P-LP",
         }
@@ -721,6 +579,7 @@ class BewardLNPREventsClearButton(CoordinatorEntity, ButtonEntity):
         super().__init__(coordinator)
         self.coordinator = coordinator
         self.entry = entry
+        self._camera_name = entry.data.get("name", "Beward Doorbell")
         self._attr_name = f"{entry.data.get('name', 'Beward')} Clear LNPR Events"
         self._attr_unique_id = f"{entry.entry_id}_beward_lnpr_events_clear"
         self._attr_icon = "mdi:delete"
@@ -732,7 +591,7 @@ class BewardLNPREventsClearButton(CoordinatorEntity, ButtonEntity):
             _LOGGER.error("Beward device not available")
             return
         
-        _LOGGER.info("🧹 Clearing LNPR events log for %s", self.entry.data.get('name'))
+        _LOGGER.info("🧹 Clearing LNPR events log for %s", self._camera_name)
         
         try:
             url = f"http://{self.coordinator.beward.host}{LNPR_CLEAR_LOG}"
@@ -742,7 +601,7 @@ class BewardLNPREventsClearButton(CoordinatorEntity, ButtonEntity):
                         "persistent_notification",
                         "create",
                         {
-                            "title": f"✅ LNPR - {self.entry.data.get('name')}",
+                            "title": f"✅ LNPR - {self._camera_name}",
                             "message": "Журнал событий LNPR успешно очищен",
                             "notification_id": f"openipc_lnpr_events_clear_{self.entry.entry_id}"
                         }
@@ -757,7 +616,7 @@ class BewardLNPREventsClearButton(CoordinatorEntity, ButtonEntity):
         """Return device info."""
         return {
             "identifiers": {(DOMAIN, self.entry.entry_id)},
-            "name": self.entry.data.get("name", "Beward Doorbell"),
+            "name": self._camera_name,
             "manufacturer": "Beward",
             "model": "DS07P-LP",
         }
@@ -773,6 +632,7 @@ class VivotekRebootButton(CoordinatorEntity, ButtonEntity):
         super().__init__(coordinator)
         self.coordinator = coordinator
         self.entry = entry
+        self._camera_name = entry.data.get("name", "Vivotek Camera")
         self._attr_name = f"{entry.data.get('name', 'Vivotek')} Reboot"
         self._attr_unique_id = f"{entry.entry_id}_vivotek_reboot"
         self._attr_icon = "mdi:restart"
@@ -790,7 +650,7 @@ class VivotekRebootButton(CoordinatorEntity, ButtonEntity):
         """Return device info."""
         return {
             "identifiers": {(DOMAIN, self.entry.entry_id)},
-            "name": self.entry.data.get("name", "Vivotek Camera"),
+            "name": self._camera_name,
             "manufacturer": "Vivotek",
             "model": "SD9364-EHL",
         }
@@ -806,6 +666,7 @@ class BaseVivotekPTZButton(CoordinatorEntity, ButtonEntity):
         super().__init__(coordinator)
         self.coordinator = coordinator
         self.entry = entry
+        self._camera_name = entry.data.get("name", "Vivotek Camera")
         self._attr_name = f"{entry.data.get('name', 'Vivotek')} {name}"
         self._attr_unique_id = f"{entry.entry_id}_{button_id}"
         self._attr_icon = icon
@@ -815,7 +676,7 @@ class BaseVivotekPTZButton(CoordinatorEntity, ButtonEntity):
         """Return device info."""
         return {
             "identifiers": {(DOMAIN, self.entry.entry_id)},
-            "name": self.entry.data.get("name", "Vivotek Camera"),
+            "name": self._camera_name,
             "manufacturer": "Vivotek",
             "model": "SD9364-EHL",
         }
@@ -980,7 +841,7 @@ class VivotekPTZSetPresetButton(BaseVivotekPTZButton):
                 preset_id += 1
             if preset_id <= 256:
                 await self.coordinator.vivotek.ptz.async_set_preset(preset_id, f"Preset {preset_id}")
-                _LOGGER.info(f"✅ Set preset {preset_id} for {self.entry.data.get('name')}")
+                _LOGGER.info("✅ Set preset %s for %s", preset_id, self._camera_name)
 
 
 class VivotekPTZRefreshButton(BaseVivotekPTZButton):
@@ -992,4 +853,4 @@ class VivotekPTZRefreshButton(BaseVivotekPTZButton):
     async def async_press(self) -> None:
         if self.coordinator.vivotek and self.coordinator.vivotek.ptz:
             await self.coordinator.vivotek.ptz.async_get_presets()
-            _LOGGER.info(f"🔄 Refreshed PTZ presets for {self.entry.data.get('name')}")
\ No newline at end of file
+            _LOGGER.info("🔄 Refreshed PTZ presets for %s", self._camera_name)
\ No newline at end of file
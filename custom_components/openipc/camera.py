@@ -8,6 +8,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN, 
+    DATA_COORDINATORS,
     IMAGE_JPEG, 
     RTSP_STREAM_MAIN, 
     RTSP_STREAM_SUB,
@@ -23,7 +24,7 @@ _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up OpenIPC camera."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = hass.data[DOMAIN][DATA_COORDINATORS][entry.entry_id]
     device_type = entry.data.get(CONF_DEVICE_TYPE, DEVICE_TYPE_OPENIPC)
     
     if device_type == DEVICE_TYPE_BEWARD:
@@ -3,6 +3,7 @@ import logging
 import voluptuous as vol
 import aiohttp
 import asyncio
+import errno
 import socket
 
 from homeassistant import config_entries, exceptions
@@ -63,6 +64,21 @@ VIVOTEK_ENDPOINTS = [
     "/cgi-bin/camctrl/camctrl.cgi",            # Vivotek PTZ control
 ]
 
+# Сколько эндпоинтов validate_input опрашивает одновременно (слабые камеры)
+ENDPOINT_PROBE_CONCURRENCY = 3
+
+# Ошибки соединения, после которых остальные порты и эндпоинты не проверяем
+_UNREACHABLE_ERRNOS = frozenset({
+    errno.ECONNREFUSED,
+    errno.EHOSTUNREACH,
+    errno.ENETUNREACH,
+    errno.ETIMEDOUT,
+})
+
+# Главная страница: медленный ответ не считается недоступностью, таймаут
+# установления соединения - считается
+MAIN_PAGE_TIMEOUT = aiohttp.ClientTimeout(total=5, connect=3)
+
 # Схема данных для основной формы настройки
 DATA_SCHEMA = vol.Schema(
     {
@@ -81,20 +97,78 @@ DATA_SCHEMA = vol.Schema(
     }
 )
 
-async def check_host_availability(host, port):
-    """Check if host is reachable."""
-    try:
-        # Пробуем разрешить DNS имя
-        await asyncio.get_event_loop().getaddrinfo(host, port)
-        
-        # Пробуем открыть сокет
-        reader, writer = await asyncio.open_connection(host, port)
-        writer.close()
-        await writer.wait_closed()
-        return True
-    except Exception as err:
-        _LOGGER.debug("Host %s not available on port %s: %s", host, port, err)
-        return False
+def _host_unreachable(err: aiohttp.ClientConnectorError) -> bool:
+    """Return True if the connection error means the host itself cannot be reached."""
+    os_error = err.os_error
+    return isinstance(os_error, socket.gaierror) or os_error.errno in _UNREACHABLE_ERRNOS
+
+async def _async_probe_endpoint(session, auth, data, device_type, port, endpoint):
+    """Probe one endpoint, return the entry info if it identifies the camera."""
+    url = f"http://{data[CONF_HOST]}:{port}{endpoint}"
+    _LOGGER.debug("Trying endpoint: %s", url)
+    
+    async with session.get(url, auth=auth, timeout=5, allow_redirects=True) as response:
+        _LOGGER.debug("Endpoint %s returned status %s, Content-Type: %s", 
+                     endpoint, response.status, response.headers.get('Content-Type', ''))
+
+        if response.status == 200:
+            content_type = response.headers.get('Content-Type', '').lower()
+
+            # Для Beward - проверяем специфичные признаки
+            if device_type == DEVICE_TYPE_BEWARD:
+                # Если получили изображение с image.cgi
+                if endpoint == "/cgi-bin/image.cgi" and 'image' in content_type:
+                    _LOGGER.info("✅ Beward camera confirmed via image endpoint")
+                    return {"title": data[CONF_NAME], "unique_id": f"beward_{data[CONF_HOST]}"}
+
+                # Проверяем login.asp
+                if endpoint == "/login.asp" or 'login.asp' in str(response.url):
+                    _LOGGER.info("✅ Beward camera confirmed via login.asp")
+                    return {"title": data[CONF_NAME], "unique_id": f"beward_{data[CONF_HOST]}"}
+
+                # Проверяем HTML страницу на наличие признаков Beward
+                if 'text/html' in content_type:
+                    text = await response.text()
+                    if any(x in text for x in ['Beward', 'intercom', 'door', 'домофон']):
+                        _LOGGER.info("✅ Beward camera confirmed via HTML content")
+                        return {"title": data[CONF_NAME], "unique_id": f"beward_{data[CONF_HOST]}"}
+
+            # Для Vivotek
+            elif device_type == DEVICE_TYPE_VIVOTEK:
+                if endpoint == "/cgi-bin/hello":
+                    text = await response.text()
+                    if 'hello' in text.lower():
+                        _LOGGER.info("✅ Vivotek camera confirmed via hello endpoint")
+                        return {"title": data[CONF_NAME], "unique_id": f"vivotek_{data[CONF_HOST]}"}
+
+                if 'image' in content_type or 'mjpeg' in content_type:
+                    _LOGGER.info("✅ Vivotek camera confirmed via %s", endpoint)
+                    return {"title": data[CONF_NAME], "unique_id": f"vivotek_{data[CONF_HOST]}"}
+
+                if 'text/html' in content_type:
+                    text = await response.text()
+                    if 'VIVOTEK' in text:
+                        _LOGGER.info("✅ Vivotek camera confirmed via HTML")
+                        return {"title": data[CONF_NAME], "unique_id": f"vivotek_{data[CONF_HOST]}"}
+
+            # Для OpenIPC
+            else:
+                if endpoint == '/metrics' or 'json' in content_type:
+                    try:
+                        text = await response.text()
+                        if any(x in text for x in ['openipc', 'majestic', 'node_']):
+                            return {"title": data[CONF_NAME], "unique_id": f"openipc_{data[CONF_HOST]}"}
+                    except:
+                        pass
+
+                if endpoint == '/cgi-bin/status.cgi' and 'text/html' in content_type:
+                    text = await response.text()
+                    if 'Uptime' in text or 'CPU' in text:
+                        return {"title": data[CONF_NAME], "unique_id": f"openipc_{data[CONF_HOST]}"}
+
+        elif response.status == 401:
+            raise InvalidAuth("Authentication failed")
+    return None
 
 async def validate_input(hass: HomeAssistant, data):
     """Validate the user input allows us to connect."""
@@ -104,24 +178,20 @@ async def validate_input(hass: HomeAssistant, data):
     _LOGGER.debug("Attempting to validate connection to %s:%s as %s", 
                   data[CONF_HOST], data[CONF_PORT], data.get(CONF_DEVICE_TYPE, DEVICE_TYPE_OPENIPC))
     
-    # Сначала проверяем базовую доступность хоста
-    host_available = await check_host_availability(data[CONF_HOST], data[CONF_PORT])
-    if not host_available:
-        raise CannotConnect(f"Cannot connect to camera at {data[CONF_HOST]}:{data[CONF_PORT]}")
-    
     # Определяем тип устройства
     device_type = data.get(CONF_DEVICE_TYPE, DEVICE_TYPE_OPENIPC)
     
-    # Пробуем разные порты, если указанный не работает (для диагностики)
-    ports_to_try = [data[CONF_PORT], 80, 8080, 443, 554]
+    # Пробуем разные порты, если указанный не работает (для диагностики);
+    # указанный пользователем порт идет первым
+    ports_to_try = dict.fromkeys([data[CONF_PORT], 80, 8080, 443, 554])
     
     # Сначала пробуем зайти на главную страницу для определения типа
-    for port in set(ports_to_try):
+    for port in ports_to_try:
         try:
             url = f"http://{data[CONF_HOST]}:{port}/"
             _LOGGER.debug("Trying main page: %s", url)
             
-            async with session.get(url, auth=auth, timeout=5, allow_redirects=True) as response:
+            async with session.get(url, auth=auth, timeout=MAIN_PAGE_TIMEOUT, allow_redirects=True) as response:
                 _LOGGER.debug("Main page returned status %s, final URL: %s", 
                              response.status, response.url)
                 
@@ -176,6 +246,19 @@ async def validate_input(hass: HomeAssistant, data):
                         data[CONF_PORT] = port
                         return {"title": data[CONF_NAME], "unique_id": f"vivotek_{data[CONF_HOST]}"}
                         
+        except aiohttp.ConnectionTimeoutError as err:
+            # Хост не принимает соединение вовсе (выключен/blackhole); таймаут чтения
+            # после соединения уходит в общую ветку и дальше к пробам эндпоинтов
+            if port == data[CONF_PORT]:
+                raise CannotConnect(f"Timeout connecting to camera at {data[CONF_HOST]}:{port}") from err
+            _LOGGER.debug("Main page check on port %d timed out", port)
+            continue
+        except aiohttp.ClientConnectorError as err:
+            # Отдельной TCP-проверки хоста нет: недоступность видна уже по первому запросу
+            if port == data[CONF_PORT] and _host_unreachable(err):
+                raise CannotConnect(f"Cannot connect to camera at {data[CONF_HOST]}:{port}") from err
+            _LOGGER.debug("Main page check on port %d failed: %s", port, err)
+            continue
         except Exception as err:
             _LOGGER.debug("Main page check on port %d failed: %s", port, err)
             continue
@@ -195,106 +278,49 @@ async def validate_input(hass: HomeAssistant, data):
         endpoints_to_try = OPENIPC_ENDPOINTS + ["/", "/index.html"]
         _LOGGER.debug("Trying OpenIPC endpoints")
     
-    # Пробуем эндпоинты
-    last_error = None
-    for endpoint in endpoints_to_try:
+    # Пробуем эндпоинты одновременно (не больше ENDPOINT_PROBE_CONCURRENCY сразу),
+    # первый опознавший камеру ответ отменяет остальные запросы
+    semaphore = asyncio.Semaphore(ENDPOINT_PROBE_CONCURRENCY)
+    
+    async def probe(endpoint):
+        async with semaphore:
+            try:
+                return await _async_probe_endpoint(session, auth, data, device_type, port, endpoint), None
+            except asyncio.TimeoutError as err:
+                _LOGGER.debug("Timeout for %s", endpoint)
+                return None, err
+            except Exception as err:
+                _LOGGER.debug("Error for %s: %s", endpoint, err)
+                return None, err
+    
+    tasks = [
+        asyncio.create_task(probe(endpoint))
+        for endpoint in endpoints_to_try
         # Пропускаем RTSP эндпоинты для HTTP проверки
-        if endpoint.startswith('/av') or endpoint.endswith('.sdp'):
-            continue
-            
-        url = f"http://{data[CONF_HOST]}:{port}{endpoint}"
-        _LOGGER.debug("Trying endpoint: %s", url)
-        
-        try:
-            async with session.get(url, auth=auth, timeout=5, allow_redirects=True) as response:
-                _LOGGER.debug("Endpoint %s returned status %s, Content-Type: %s", 
-                             endpoint, response.status, response.headers.get('Content-Type', ''))
-                
-                if response.status == 200:
-                    content_type = response.headers.get('Content-Type', '').lower()
-                    
-                    # Для Beward - проверяем специфичные признаки
-                    if device_type == DEVICE_TYPE_BEWARD:
-                        # Если получили изображение с image.cgi
-                        if endpoint == "/cgi-bin/image.cgi" and 'image' in content_type:
-                            _LOGGER.info("✅ Beward camera confirmed via image endpoint")
-                            return {"title": data[CONF_NAME], "unique_id": f"beward_{data[CONF_HOST]}"}
-                        
-                        # Проверяем login.asp
-                        if endpoint == "/login.asp" or 'login.asp' in str(response.url):
-                            _LOGGER.info("✅ Beward camera confirmed via login.asp")
-                            return {"title": data[CONF_NAME], "unique_id": f"beward_{data[CONF_HOST]}"}
-                        
-                        # Проверяем HTML страницу на наличие признаков Beward
-                        if 'text/html' in content_type:
-                            text = await response.text()
-                            if any(x in text for x in ['Beward', 'intercom', 'door', 'домофон']):
-                                _LOGGER.info("✅ Beward camera confirmed via HTML content")
-                                return {"title": data[CONF_NAME], "unique_id": f"beward_{data[CONF_HOST]}"}
-                    
-                    # Для Vivotek
-                    elif device_type == DEVICE_TYPE_VIVOTEK:
-                        if endpoint == "/cgi-bin/hello":
-                            text = await response.text()
-                            if 'hello' in text.lower():
-                                _LOGGER.info("✅ Vivotek camera confirmed via hello endpoint")
-                                return {"title": data[CONF_NAME], "unique_id": f"vivotek_{data[CONF_HOST]}"}
-                        
-                        if 'image' in content_type or 'mjpeg' in content_type:
-                            _LOGGER.info("✅ Vivotek camera confirmed via %s", endpoint)
-                            return {"title": data[CONF_NAME], "unique_id": f"vivotek_{data[CONF_HOST]}"}
-                        
-                        if 'text/html' in content_type:
-                            text = await response.text()
-                            if 'VIVOTEK' in text:
-                                _LOGGER.info("✅ Vivotek camera confirmed via HTML")
-                                return {"title": data[CONF_NAME], "unique_id": f"vivotek_{data[CONF_HOST]}"}
-                    
-                    # Для OpenIPC
-                    else:
-                        if endpoint == '/metrics' or 'json' in content_type:
-                            try:
-                                text = await response.text()
-                                if any(x in text for x in ['openipc', 'majestic', 'node_']):
-                                    return {"title": data[CONF_NAME], "unique_id": f"openipc_{data[CONF_HOST]}"}
-                            except:
-                                pass
-                        
-                        if endpoint == '/cgi-bin/status.cgi' and 'text/html' in content_type:
-                            text = await response.text()
-                            if 'Uptime' in text or 'CPU' in text:
-                                return {"title": data[CONF_NAME], "unique_id": f"openipc_{data[CONF_HOST]}"}
-                    
-                elif response.status == 401:
-                    raise InvalidAuth("Authentication failed")
-                    
-        except aiohttp.ClientConnectorError as err:
-            last_error = f"Connection error: {err}"
-            _LOGGER.debug("Connection error for %s: %s", endpoint, err)
-            continue
-        except asyncio.TimeoutError:
-            last_error = "Timeout"
-            _LOGGER.debug("Timeout for %s", endpoint)
-            continue
-        except aiohttp.ClientResponseError as err:
-            last_error = f"HTTP error: {err.status}"
-            _LOGGER.debug("HTTP error for %s: %s", endpoint, err)
-            continue
-        except Exception as err:
-            last_error = str(err)
-            _LOGGER.debug("Error for %s: %s", endpoint, err)
-            continue
+        if not (endpoint.startswith('/av') or endpoint.endswith('.sdp'))
+    ]
+    last_error = None
+    try:
+        for future in asyncio.as_completed(tasks):
+            result, error = await future
+            if result:
+                return result
+            if error is not None:
+                last_error = error
+    finally:
+        for task in tasks:
+            task.cancel()
     
     # Если ничего не сработало, но хост доступен - возможно это Beward/Vivotek с нестандартными настройками
-    _LOGGER.warning("Could not determine camera type at %s, but host is reachable", data[CONF_HOST])
-    _LOGGER.warning("Last error: %s", last_error)
+    _LOGGER.warning("Could not determine camera type at %s, but host is reachable (last error: %r)",
+                    data[CONF_HOST], last_error)
     
     # Если пользователь выбрал конкретный тип, пробуем создать запись
     if device_type != DEVICE_TYPE_OPENIPC:
         _LOGGER.info("Creating entry as %s based on user selection", device_type)
         return {"title": data[CONF_NAME], "unique_id": f"{device_type}_{data[CONF_HOST]}"}
     
-    raise CannotConnect(f"Could not establish connection to camera at {data[CONF_HOST]}:{port}")
+    raise CannotConnect(f"Could not establish connection to camera at {data[CONF_HOST]}:{port}: {last_error!r}")
 
 class OpenIPCConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for OpenIPC."""
@@ -2,6 +2,13 @@
 from homeassistant.const import Platform
 
 DOMAIN = "openipc"
+
+# Разделы hass.data[DOMAIN]
+DATA_CONFIG = "config"
+DATA_COORDINATORS = "coordinators"
+DATA_ENTITY_INDEX = "entity_index"
+DATA_LAST_SCAN = "last_scan"
+DATA_SERVICES_REGISTERED = "services_registered"
 PLATFORMS = ["camera", "binary_sensor", "sensor", "switch", "button", "media_player", "select"]
 
 # Default values
@@ -184,6 +191,9 @@ SWITCH_TYPES = {
 DISCOVERY_PORT = 1900
 DISCOVERY_TIMEOUT = 5
 DISCOVERY_MAX_DEVICES = 10
+DISCOVERY_PROBE_CONCURRENCY = 64
+# Повторный scan_devices в течение этого времени (сек) отдает прошлый результат
+DISCOVERY_CACHE_TTL = 30
 
 # SSDP discovery
 SSDP_ST = "urn:schemas-upnp-org:device:Basic:1"
@@ -1,39 +1,34 @@
 """Coordinator for OpenIPC integration."""
 import asyncio
 import logging
-import time
 import re
 from datetime import timedelta
 
 import aiohttp
 import async_timeout
-from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT, CONF_USERNAME, CONF_PASSWORD
+from homeassistant.const import CONF_HOST, CONF_PORT, CONF_USERNAME, CONF_PASSWORD
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import (
     DOMAIN,
-    API_STATUS,
     DEFAULT_SCAN_INTERVAL,
     CONF_RTSP_PORT,
-    MAJESTIC_CONFIG,
-    METRICS_ENDPOINT,
-    RECORD_START,
-    RECORD_STOP,
-    RECORD_STATUS,
-    RECORD_MANUAL,
     CONF_DEVICE_TYPE,
     DEVICE_TYPE_BEWARD,
     DEVICE_TYPE_VIVOTEK,
-    LNPR_STATE,
-    LNPR_LIST,
 )
-from .recorder import OpenIPCRecorder
+from .parsers import parse_numerics
 from .addon import OpenIPCAddonManager
-from .osd_manager import OpenIPCOSDManager
 
 _LOGGER = logging.getLogger(__name__)
 
+_DOT_TO_UNDERSCORE = str.maketrans(".", "_")
+
+# Пул соединений для опроса камеры: 4 параллельных запроса обновления на один хост
+POLL_LIMIT_PER_HOST = 4
+POLL_KEEPALIVE_TIMEOUT = 30
+
 class OpenIPCDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching OpenIPC data."""
 
@@ -55,10 +50,21 @@ class OpenIPCDataUpdateCoordinator(DataUpdateCoordinator):
         
         self.session = async_get_clientsession(hass)
         self.auth = aiohttp.BasicAuth(self.username, self.password)
+        # Заголовок авторизации кодируем один раз для запросов опроса камеры
+        self.headers = {"Authorization": self.auth.encode()}
+        self._poll_session = None
+        self._closed = False
+        # url -> (ETag, разобранный ответ) для условных запросов опроса
+        self._etag_cache = {}
+        # (model, firmware) -> device_info, общий для всех сущностей камеры
+        self._device_info_cache = {}
         
         self._cache = {}
         self._cache_time = {}
         
+        # Импортируем здесь: recorder тянет ffmpeg/OSD код, нужный только при наличии камер
+        from .recorder import OpenIPCRecorder
+        
         camera_name = entry.data.get('name', 'OpenIPC Camera')
         self.recorder = OpenIPCRecorder(
             hass,
@@ -69,6 +75,13 @@ class OpenIPCDataUpdateCoordinator(DataUpdateCoordinator):
             camera_name
         )
         
+        # entity_id камеры, по которым сервисы находят этот координатор
+        self.camera_entity_ids = (
+            f"camera.{self.recorder.camera_name}",
+            f"camera.{self.host.translate(_DOT_TO_UNDERSCORE)}",
+            f"camera.{self.host}",
+        )
+        
         self.beward = None
         self.vivotek = None
         self.openipc_audio = None
@@ -117,6 +130,7 @@ class OpenIPCDataUpdateCoordinator(DataUpdateCoordinator):
         # OSD Manager для OpenIPC камер
         if not self.is_beward and not self.is_vivotek:
             try:
+                from .osd_manager import OpenIPCOSDManager
                 self.osd_manager = OpenIPCOSDManager(
                     hass,
                     self.host,
@@ -139,6 +153,55 @@ class OpenIPCDataUpdateCoordinator(DataUpdateCoordinator):
         self._recording_task = None
         self._recording_end_time = None
         self._ha_recording_task = None
+        # Последний сработавший endpoint записи по действию (start/stop/status)
+        self._recording_endpoints = {}
+
+    @property
+    def poll_session(self) -> aiohttp.ClientSession:
+        """Return the dedicated keep-alive session for polling this camera."""
+        if self._closed:
+            # После async_close новую сессию не открываем - ее уже некому закрыть
+            raise aiohttp.ClientConnectionError(f"Polling session for {self.host} is closed")
+        if self._poll_session is None or self._poll_session.closed:
+            self._poll_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=POLL_LIMIT_PER_HOST,
+                    keepalive_timeout=POLL_KEEPALIVE_TIMEOUT,
+                ),
+            )
+        return self._poll_session
+
+    def device_info(self) -> dict:
+        """Return the (cached) device info shared by the camera's entities."""
+        parsed = self.data.get("parsed", {}) if self.data else {}
+        key = (parsed.get("model"), parsed.get("firmware"))
+        cached = self._device_info_cache.get(key)
+        if cached is None:
+            cached = self._device_info_cache[key] = {
+                "identifiers": {(DOMAIN, self.entry.entry_id)},
+                "name": self.entry.data.get("name", "OpenIPC Camera"),
+                "manufacturer": "OpenIPC",
+                "model": parsed.get("model", "Camera"),
+                "sw_version": parsed.get("firmware", "Unknown"),
+            }
+        return cached
+
+    def _swap_cancel(self, attr: str) -> None:
+        """Detach the task stored in attr and cancel it if it is still running."""
+        task = getattr(self, attr)
+        setattr(self, attr, None)
+        # Задача может остановить запись сама (stop_after_delay) - себя не отменяем
+        if task is not None and not task.done() and task is not asyncio.current_task():
+            task.cancel()
+
+    async def async_close(self) -> None:
+        """Cancel recording timers and close the polling session."""
+        self._closed = True
+        self._swap_cancel("_recording_task")
+        self._swap_cancel("_ha_recording_task")
+        if self._poll_session is not None:
+            await self._poll_session.close()
+            self._poll_session = None
 
     async def _async_connect_beward(self):
         """Connect to Beward device."""
@@ -201,12 +264,32 @@ class OpenIPCDataUpdateCoordinator(DataUpdateCoordinator):
             async with async_timeout.timeout(10):
                 _LOGGER.debug("Attempting to fetch data from camera %s", self.host)
                 
-                config_data = await self._get_json_config()
-                metrics_data = await self._get_metrics()
-                status_data = await self._get_camera_status()
-                recording_status = await self.async_get_recording_status()
+                # Запросы к одной камере идут параллельно - задержка ~одного RTT вместо суммы
+                config_data, metrics_data, status_data, recording_status = await asyncio.gather(
+                    self._get_json_config(),
+                    self._get_metrics(),
+                    self._get_camera_status(),
+                    self.async_get_recording_status(),
+                    return_exceptions=True,
+                )
+                if isinstance(config_data, Exception):
+                    config_data = {}
+                if isinstance(metrics_data, Exception):
+                    metrics_data = {}
+                if isinstance(status_data, Exception):
+                    status_data = {}
+                if isinstance(recording_status, Exception):
+                    recording_status = None
                 
                 parsed_data = self._parse_camera_data(config_data, metrics_data, status_data)
+                _LOGGER.debug("Parsed data from %s: %s", self.host, parsed_data)
+                
+                # Сменилась модель/прошивка - старый device_info больше не нужен
+                previous = self.data.get("parsed", {}) if self.data else {}
+                if (previous.get("model"), previous.get("firmware")) != (
+                    parsed_data.get("model"), parsed_data.get("firmware")
+                ):
+                    self._device_info_cache.clear()
                 
                 if recording_status:
                     parsed_data["recording_status"] = recording_status.get("recording", False)
@@ -219,6 +302,7 @@ class OpenIPCDataUpdateCoordinator(DataUpdateCoordinator):
                     "status": status_data,
                     "recording": recording_status,
                     "parsed": parsed_data,
+                    "num": parse_numerics(parsed_data),
                     "available": True,
                     "last_update": self.hass.loop.time(),
                 }
@@ -268,12 +352,9 @@ class OpenIPCDataUpdateCoordinator(DataUpdateCoordinator):
         # Сохраняем модель для API
         if 'model' not in parsed and status and isinstance(status, dict) and 'raw' in status:
             # Парсим модель из HTML если есть
-            try:
-                model_match = re.search(r'Model[^>]*>([^<]+)', status['raw'], re.IGNORECASE)
-                if model_match:
-                    parsed['model'] = model_match.group(1).strip()
-            except:
-                pass
+            model_match = re.search(r'Model[^>]*>([^<]+)', status['raw'], re.IGNORECASE)
+            if model_match:
+                parsed['model'] = model_match.group(1).strip()
         
         return parsed
 
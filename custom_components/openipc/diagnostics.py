@@ -3,36 +3,52 @@ import logging
 
 _LOGGER = logging.getLogger(__name__)
 
+# Постоянные хвосты диагностических сообщений (строки для "\n".join)
+_RTSP_TROUBLESHOOTING = (
+    "",
+    "❌ No working RTSP paths found!",
+    "",
+    "**Troubleshooting:**",
+    "1. Check if camera is powered on",
+    "2. Verify RTSP port (default 554)",
+    "3. Check firewall settings",
+    "4. Try different stream paths in config",
+    "5. Verify RTSP is enabled in camera settings",
+)
+_TELEGRAM_TROUBLESHOOTING = (
+    "",
+    "**Troubleshooting:**",
+    "1. Configure Telegram bot via UI: Settings → Devices & Services → Add Integration → Telegram bot",
+    "2. Add bot token and chat_id to openipc section in configuration.yaml for direct API",
+    "",
+)
+
 async def diagnose_rtsp(coordinator):
     """Diagnose RTSP stream."""
     if hasattr(coordinator, 'recorder'):
         results = await coordinator.recorder.diagnose_rtsp()
         
-        message = "📹 **RTSP Diagnostic Results**\n\n"
+        lines = ["📹 **RTSP Diagnostic Results**", ""]
         working_paths = []
         
         for path, result in results.items():
             status = "✅" if result["success"] else "❌"
-            message += f"{status} `{path}`\n"
+            lines.append(f"{status} `{path}`")
             if result["success"]:
                 working_paths.append(path)
             elif result.get("error"):
-                message += f"   Error: {result['error'][:100]}\n"
+                lines.append(f"   Error: {result['error'][:100]}")
         
         if working_paths:
-            message += f"\n**Working paths:**\n"
-            for path in working_paths:
-                message += f"- `{path}`\n"
-            message += "\n**Recommended path for configuration:**\n"
-            message += f"`{working_paths[0]}`"
+            lines.append("")
+            lines.append("**Working paths:**")
+            lines.extend(f"- `{path}`" for path in working_paths)
+            lines.append("")
+            lines.append("**Recommended path for configuration:**")
+            lines.append(f"`{working_paths[0]}`")
         else:
-            message += "\n❌ No working RTSP paths found!\n"
-            message += "\n**Troubleshooting:**\n"
-            message += "1. Check if camera is powered on\n"
-            message += "2. Verify RTSP port (default 554)\n"
-            message += "3. Check firewall settings\n"
-            message += "4. Try different stream paths in config\n"
-            message += "5. Verify RTSP is enabled in camera settings"
+            lines.extend(_RTSP_TROUBLESHOOTING)
+        message = "\n".join(lines)
         
         await coordinator.hass.services.async_call(
             "persistent_notification",
@@ -53,19 +69,19 @@ async def diagnose_telegram(coordinator):
     if hasattr(coordinator, 'recorder'):
         results = await coordinator.recorder.diagnose_telegram()
         
-        message = f"📱 **Telegram Diagnostic Results for {coordinator.recorder.camera_name}**\n\n"
-        message += f"• telegram_bot.send_file: {'✅' if results.get('telegram_bot_service') else '❌'}\n"
-        message += f"• notify.telegram_notify: {'✅' if results.get('notify_service') else '❌'}\n"
-        message += f"• Bot token configured: {'✅' if results.get('bot_token_configured') else '❌'}\n"
-        message += f"• Chat ID configured: {'✅' if results.get('chat_id_configured') else '❌'}\n"
-        message += f"• Available services: {results.get('available_services', [])}\n"
-        
+        lines = [
+            f"📱 **Telegram Diagnostic Results for {coordinator.recorder.camera_name}**",
+            "",
+            f"• telegram_bot.send_file: {'✅' if results.get('telegram_bot_service') else '❌'}",
+            f"• notify.telegram_notify: {'✅' if results.get('notify_service') else '❌'}",
+            f"• Bot token configured: {'✅' if results.get('bot_token_configured') else '❌'}",
+            f"• Chat ID configured: {'✅' if results.get('chat_id_configured') else '❌'}",
+            f"• Available services: {results.get('available_services', [])}",
+        ]
         if results.get('test_message'):
-            message += f"• Test message: {results['test_message']}\n"
-        
-        message += "\n**Troubleshooting:**\n"
-        message += "1. Configure Telegram bot via UI: Settings → Devices & Services → Add Integration → Telegram bot\n"
-        message += "2. Add bot token and chat_id to openipc section in configuration.yaml for direct API\n"
+            lines.append(f"• Test message: {results['test_message']}")
+        lines.extend(_TELEGRAM_TROUBLESHOOTING)
+        message = "\n".join(lines)
         
         await coordinator.hass.services.async_call(
             "persistent_notification",
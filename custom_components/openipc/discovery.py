@@ -2,142 +2,354 @@
 import asyncio
 import logging
 import socket
+import struct
 import ipaddress
 from typing import List, Dict, Optional, Tuple
 import aiohttp
-import async_timeout
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 # Для mDNS (если доступно)
 try:
-    from zeroconf import Zeroconf, ServiceBrowser, ServiceListener
+    from zeroconf import IPVersion, ServiceStateChange
+    from zeroconf.asyncio import AsyncServiceBrowser, AsyncServiceInfo
     ZEROCONF_AVAILABLE = True
 except ImportError:
     ZEROCONF_AVAILABLE = False
 
 from .const import (
+    DOMAIN,
     DISCOVERY_PORT,
     DISCOVERY_TIMEOUT,
+    DISCOVERY_PROBE_CONCURRENCY,
     SSDP_ST,
     BROADCAST_PORTS,
     DISCOVERY_ENDPOINTS,
     OPENIPC_MAC_PREFIXES,
     MDNS_SERVICE,
+    MDNS_DEVICE_TYPE,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Ключ hass.data для общего экземпляра поиска (блокировка, проверки в работе, кеши)
+DATA_DISCOVERY = f"{DOMAIN}_discovery"
+
+# SSDP multicast group
+SSDP_GROUP = "239.255.255.250"
+
+# SSDP discovery message
+_SSDP_MSEARCH = "\r\n".join([
+    'M-SEARCH * HTTP/1.1',
+    'HOST: 239.255.255.250:1900',
+    'MAN: "ssdp:discover"',
+    'MX: 2',
+    f'ST: {SSDP_ST}',
+    ''
+]).encode('utf-8')
+
+# Время жизни кеша локального IP, секунды
+LOCAL_IP_CACHE_TTL = 60
+
+# Таймауты HTTP запросов при поиске камер, секунды
+PROBE_TIMEOUT = 1.5
+PROBE_ENDPOINT_TIMEOUT = aiohttp.ClientTimeout(total=1)
+
+# Сколько байт тела ответа читать при пробе эндпоинта
+PROBE_READ_BYTES = 256
+
+# Проверка найденных устройств: просим текст/JSON и читаем только начало ответа
+VERIFY_HEADERS = {
+    "Accept": "application/json,text/plain;q=0.9,*/*;q=0.1",
+    "Connection": "close",
+}
+VERIFY_READ_BYTES = 512
+
+# OUI (первые 8 символов MAC с двоеточиями) известных OpenIPC устройств
+_OPENIPC_OUIS = frozenset(prefix.upper()[:8] for prefix in OPENIPC_MAC_PREFIXES)
+
+
+# Raw ARP scan (Linux AF_PACKET)
+ETH_P_ARP = 0x0806
+ARP_FRAME_SIZE = 60
+RAW_ARP_TIMEOUT = 0.5
+_SIOCGIFADDR = 0x8915
+_SIOCGIFHWADDR = 0x8927
+_ARP_REQUEST = struct.Struct("!6s6sHHHBBH6s4s6s4s")
+_BROADCAST_MAC = b"\xff" * 6
+
+
+def _open_arp_socket(local_ip: str) -> Tuple[socket.socket, bytes]:
+    """Open a raw ARP socket on the interface owning local_ip (blocking)."""
+    import fcntl
+    
+    for _, ifname in socket.if_nameindex():
+        request = struct.pack("256s", ifname[:15].encode())
+        probe = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            if_addr = fcntl.ioctl(probe.fileno(), _SIOCGIFADDR, request)[20:24]
+            if socket.inet_ntoa(if_addr) != local_ip:
+                continue
+            hw_addr = fcntl.ioctl(probe.fileno(), _SIOCGIFHWADDR, request)[18:24]
+        except OSError:
+            continue
+        finally:
+            probe.close()
+        
+        sock = socket.socket(socket.AF_PACKET, socket.SOCK_RAW, socket.htons(ETH_P_ARP))
+        try:
+            sock.bind((ifname, ETH_P_ARP))
+            sock.setblocking(False)
+        except OSError:
+            sock.close()
+            raise
+        return sock, hw_addr
+    
+    raise OSError(f"no interface with address {local_ip}")
+
+
+def _build_arp_request(src_mac: bytes, src_ip: bytes, target_ip: bytes) -> bytes:
+    """Build a broadcast Ethernet ARP who-has frame."""
+    return _ARP_REQUEST.pack(
+        _BROADCAST_MAC, src_mac, ETH_P_ARP,
+        1, 0x0800, 6, 4, 1,
+        src_mac, src_ip, b"\x00" * 6, target_ip,
+    )
+
+
+def _parse_arp_reply(frame: bytes) -> Optional[Tuple[str, str]]:
+    """Return (ip, mac) from an Ethernet ARP reply frame."""
+    if len(frame) < 42:
+        return None
+    eth_type, = struct.unpack_from("!H", frame, 12)
+    opcode, = struct.unpack_from("!H", frame, 20)
+    if eth_type != ETH_P_ARP or opcode != 2:
+        return None
+    return socket.inet_ntoa(frame[28:32]), frame[22:28].hex(":").upper()
+
+
+class _SSDPProtocol(asyncio.DatagramProtocol):
+    """Collect SSDP responses into a queue."""
+
+    def __init__(self, queue: asyncio.Queue):
+        """Initialize protocol."""
+        self.queue = queue
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]) -> None:
+        """Queue received datagram."""
+        self.queue.put_nowait((data, addr))
+
+
 class OpenICPCDiscovery:
     """Class to discover OpenIPC cameras on the network."""
 
     def __init__(self, hass: HomeAssistant):
         """Initialize discovery."""
         self.hass = hass
-        self.session = async_get_clientsession(hass)
         self.discovered_devices = []
         self._scan_lock = asyncio.Lock()
+        self._probe_semaphore = asyncio.Semaphore(DISCOVERY_PROBE_CONCURRENCY)
+        self._local_ip_cache: Tuple[Optional[str], float] = (None, 0.0)
+        self._network_cache: Tuple[Optional[str], Optional[ipaddress.IPv4Network]] = (None, None)
+        self._probe_session: Optional[aiohttp.ClientSession] = None
+        self._active_scans = 0
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    def _get_probe_session(self) -> aiohttp.ClientSession:
+        """Return the discovery session with a connector tuned for probing."""
+        if self._probe_session is None or self._probe_session.closed:
+            self._probe_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=128,
+                    limit_per_host=2,
+                    ttl_dns_cache=60,
+                ),
+                timeout=aiohttp.ClientTimeout(total=PROBE_TIMEOUT),
+            )
+        return self._probe_session
+
+    async def async_close(self) -> None:
+        """Close the discovery session."""
+        if self._probe_session is not None:
+            await self._probe_session.close()
+            self._probe_session = None
 
     async def discover_all(self) -> List[Dict]:
         """Run all discovery methods and return unique devices."""
-        async with self._scan_lock:
-            self.discovered_devices = []
-            
-            # Run all discovery methods in parallel
-            tasks = [
-                self.ssdp_discovery(),
-                self.broadcast_discovery(),
-                self.arp_scan_discovery(),
-            ]
-            
-            # Add mDNS if available
-            if ZEROCONF_AVAILABLE:
-                tasks.append(self.mdns_discovery())
-            
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Process results
-            for result in results:
-                if isinstance(result, Exception):
-                    _LOGGER.debug("Discovery method failed: %s", result)
-                elif isinstance(result, list):
-                    self.discovered_devices.extend(result)
-            
-            # Remove duplicates by IP
-            unique_devices = {}
-            for device in self.discovered_devices:
-                ip = device.get("ip")
-                if ip and ip not in unique_devices:
-                    unique_devices[ip] = device
+        self._active_scans += 1
+        try:
+            # Блокировка нужна только на сбор кандидатов, проверка идемпотентна по IP
+            async with self._scan_lock:
+                unique_devices, arp_checks = await self._gather_candidates()
             
-            # Verify each device is actually an OpenIPC camera
-            verified_devices = []
-            for device in unique_devices.values():
-                if await self.verify_device(device):
-                    verified_devices.append(device)
+            # Verify all devices concurrently, reusing checks already in flight
+            results = await asyncio.gather(
+                *(
+                    arp_checks.get(ip) or self._verify_once(device)
+                    for ip, device in unique_devices.items()
+                ),
+                return_exceptions=True,
+            )
+            verified_devices = [device for device in results if isinstance(device, dict)]
             
             _LOGGER.info("Discovered %d OpenIPC cameras", len(verified_devices))
             return verified_devices
+        finally:
+            self._active_scans -= 1
+            if not self._active_scans:
+                await self.async_close()
+
+    async def _gather_candidates(self) -> Tuple[Dict[str, Dict], Dict[str, asyncio.Task]]:
+        """Run all discovery methods.
+        
+        Returns candidates keyed by IP and the verification tasks already
+        started for ARP hits.
+        """
+        # Устройства из ARP проверяем сразу, не дожидаясь остальных методов
+        arp_found = asyncio.Queue()
+        arp_checks = {}
+        
+        async def _verify_arp_hits():
+            while (device := await arp_found.get()) is not None:
+                if device["ip"] not in arp_checks:
+                    arp_checks[device["ip"]] = self._verify_once(device)
+        
+        arp_consumer = self.hass.async_create_task(_verify_arp_hits())
+        
+        # Run all discovery methods in parallel
+        tasks = [
+            self.ssdp_discovery(),
+            self.broadcast_discovery(),
+            self.arp_scan_discovery(arp_found),
+        ]
+        
+        # Add mDNS if available
+        if ZEROCONF_AVAILABLE:
+            tasks.append(self.mdns_discovery())
+        
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        arp_found.put_nowait(None)
+        await arp_consumer
+        
+        # Process results, removing duplicates by IP (first source wins)
+        unique_devices = {}
+        for result in results:
+            if isinstance(result, Exception):
+                _LOGGER.debug("Discovery method failed: %s", result)
+            elif isinstance(result, list):
+                for device in result:
+                    ip = device.get("ip")
+                    if ip:
+                        unique_devices.setdefault(ip, device)
+        self.discovered_devices = list(unique_devices.values())
+        return unique_devices, arp_checks
+
+    def _verify_once(self, device: Dict) -> asyncio.Task:
+        """Start verification of a device unless one is already running for its IP."""
+        ip = device["ip"]
+        task = self._inflight.get(ip)
+        if task is None:
+            task = self.hass.async_create_task(self._verify_device_result(device))
+            self._inflight[ip] = task
+            task.add_done_callback(lambda _: self._inflight.pop(ip, None))
+        return task
+
+    async def _verify_device_result(self, device: Dict) -> Optional[Dict]:
+        """Return the device if it is verified as an OpenIPC camera."""
+        if await self.verify_device(device):
+            return device
+        return None
 
     async def ssdp_discovery(self) -> List[Dict]:
         """Discover cameras via SSDP."""
         _LOGGER.debug("Starting SSDP discovery")
         discovered = []
         
-        # Create UDP socket for SSDP
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
-        sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 2)
-        sock.settimeout(2)
-        
-        # SSDP discovery message
-        message = "\r\n".join([
-            'M-SEARCH * HTTP/1.1',
-            'HOST: 239.255.255.250:1900',
-            'MAN: "ssdp:discover"',
-            'MX: 2',
-            f'ST: {SSDP_ST}',
-            ''
-        ]).encode('utf-8')
+        queue = asyncio.Queue()
+        transport = None
         
         try:
-            # Send discovery
-            sock.sendto(message, ('239.255.255.250', 1900))
+            # Неблокирующий UDP сокет через event loop
+            transport, _ = await self.hass.loop.create_datagram_endpoint(
+                lambda: _SSDPProtocol(queue),
+                family=socket.AF_INET,
+                local_addr=("0.0.0.0", 0),
+            )
+            sock = transport.get_extra_info("socket")
+            sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 2)
             
-            # Listen for responses
-            start_time = self.hass.loop.time()
-            while self.hass.loop.time() - start_time < 5:
+            # Send discovery from every IPv4 interface (Wi-Fi, Ethernet, Docker bridge...)
+            for source_ip in await self._get_source_ips():
                 try:
-                    data, addr = sock.recvfrom(1024)
-                    response = data.decode('utf-8', errors='ignore')
-                    
-                    # Check if it might be an OpenIPC camera
-                    if 'openipc' in response.lower() or 'camera' in response.lower():
-                        ip = addr[0]
-                        location = self._extract_location(response)
+                    iface = socket.inet_aton(source_ip)
+                    sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_IF, iface)
+                    transport.sendto(_SSDP_MSEARCH, (SSDP_GROUP, DISCOVERY_PORT))
+                except OSError as e:
+                    _LOGGER.debug("SSDP send via %s failed: %s", source_ip, e)
+                    continue
+                # Replies are unicast to our port, so the join is best effort
+                # (a second address on an already joined NIC gets EADDRINUSE)
+                try:
+                    sock.setsockopt(
+                        socket.IPPROTO_IP,
+                        socket.IP_ADD_MEMBERSHIP,
+                        socket.inet_aton(SSDP_GROUP) + iface,
+                    )
+                except OSError as e:
+                    _LOGGER.debug("SSDP group join via %s failed: %s", source_ip, e)
+            
+            # Listen for responses
+            try:
+                async with asyncio.timeout(5):
+                    while True:
+                        data, addr = await queue.get()
                         
-                        if location:
-                            device_info = {
-                                "ip": ip,
-                                "port": 80,
-                                "source": "ssdp",
-                                "location": location,
-                                "headers": self._parse_ssdp_response(response),
-                            }
-                            discovered.append(device_info)
-                            _LOGGER.debug("SSDP discovered: %s", ip)
+                        # Check if it might be an OpenIPC camera before decoding
+                        low = data.lower()
+                        if b'openipc' in low or b'camera' in low:
+                            response = data.decode('utf-8', errors='ignore')
+                            ip = addr[0]
+                            headers = self._parse_ssdp_response(response)
+                            location = headers.get('location')
                             
-                except socket.timeout:
-                    continue
-                except Exception as e:
-                    _LOGGER.debug("SSDP receive error: %s", e)
+                            if location:
+                                device_info = {
+                                    "ip": ip,
+                                    "port": 80,
+                                    "source": "ssdp",
+                                    "location": location,
+                                    "headers": headers,
+                                }
+                                discovered.append(device_info)
+                                _LOGGER.debug("SSDP discovered: %s", ip)
+            except asyncio.TimeoutError:
+                pass
                     
         except Exception as e:
             _LOGGER.debug("SSDP discovery error: %s", e)
         finally:
-            sock.close()
+            if transport:
+                transport.close()
         
         return discovered
 
+    async def _get_source_ips(self) -> List[str]:
+        """Return IPv4 addresses of enabled interfaces for multicast sends."""
+        try:
+            from homeassistant.components import network
+            
+            source_ips = [
+                str(ip)
+                for ip in await network.async_get_enabled_source_ips(self.hass)
+                if isinstance(ip, ipaddress.IPv4Address) and not ip.is_loopback
+            ]
+            if source_ips:
+                return source_ips
+        except Exception as e:
+            _LOGGER.debug("Cannot get network adapters: %s", e)
+        
+        local_ip = await self._get_local_ip()
+        return [local_ip] if local_ip else ["0.0.0.0"]
+
     async def broadcast_discovery(self) -> List[Dict]:
         """Discover cameras by probing common ports."""
         _LOGGER.debug("Starting broadcast discovery")
@@ -152,29 +364,100 @@ class OpenICPCDiscovery:
         if not network:
             return discovered
         
-        # Scan common camera IPs (first 20 addresses for speed)
-        hosts = list(network.hosts())[:20]
-        
-        # Create tasks for probing
-        tasks = []
-        for host in hosts:
-            ip = str(host)
-            if ip == local_ip:
-                continue
-            tasks.append(self._probe_host(ip))
+        # Scan the whole subnet, concurrency is bounded by the probe semaphore
+        tasks = [
+            self._probe_host(str(host))
+            for host in network.hosts()
+            if str(host) != local_ip
+        ]
         
         # Run probes
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
-        for result in results:
-            if isinstance(result, dict) and result.get("ip"):
-                discovered.append(result)
+        discovered.extend(
+            result for result in results
+            if isinstance(result, dict) and result.get("ip")
+        )
         
         return discovered
 
-    async def arp_scan_discovery(self) -> List[Dict]:
-        """Discover cameras via ARP scan (requires root on some systems)."""
+    async def arp_scan_discovery(self, found: Optional[asyncio.Queue] = None) -> List[Dict]:
+        """Discover cameras via ARP scan (requires root on some systems).
+        
+        Matching devices are also put into ``found`` as soon as they
+        answer, so the caller can start verifying them early.
+        """
         _LOGGER.debug("Starting ARP scan discovery")
+        
+        # Сначала ARP внутри процесса через raw сокет (нужен CAP_NET_RAW),
+        # при отсутствии прав или не на Linux - внешний arp-scan
+        try:
+            return await self._raw_arp_scan(found)
+        except (OSError, AttributeError) as e:
+            _LOGGER.debug("Raw ARP scan unavailable (%s), falling back to arp-scan", e)
+        
+        return await self._arp_scan_subprocess(found)
+
+    async def _raw_arp_scan(self, found: Optional[asyncio.Queue]) -> List[Dict]:
+        """Broadcast ARP who-has for the local /24 and collect replies."""
+        local_ip = await self._get_local_ip()
+        if not local_ip:
+            raise OSError("local IP address is unknown")
+        
+        network = self._get_network(local_ip)
+        if not network:
+            raise OSError(f"cannot determine network for {local_ip}")
+        
+        sock, src_mac = await self.hass.async_add_executor_job(_open_arp_socket, local_ip)
+        discovered = []
+        seen = set()
+        
+        def _on_readable():
+            while True:
+                try:
+                    frame = sock.recv(ARP_FRAME_SIZE)
+                except (BlockingIOError, InterruptedError):
+                    return
+                except OSError as err:
+                    _LOGGER.debug("ARP receive error: %s", err)
+                    return
+                
+                reply = _parse_arp_reply(frame)
+                if not reply:
+                    continue
+                ip, mac = reply
+                if ip in seen or mac[:8] not in _OPENIPC_OUIS:
+                    continue
+                seen.add(ip)
+                
+                device_info = {
+                    "ip": ip,
+                    "mac": mac,
+                    "port": 80,
+                    "source": "arp",
+                }
+                discovered.append(device_info)
+                if found is not None:
+                    found.put_nowait(device_info)
+                _LOGGER.debug("ARP discovered: %s (%s)", ip, mac)
+        
+        loop = self.hass.loop
+        loop.add_reader(sock.fileno(), _on_readable)
+        try:
+            src_ip = socket.inet_aton(local_ip)
+            for host in network.hosts():
+                if str(host) != local_ip:
+                    # При заполненном буфере отправки ждем, а не обрываем сканирование
+                    await loop.sock_sendall(sock, _build_arp_request(src_mac, src_ip, host.packed))
+            await asyncio.sleep(RAW_ARP_TIMEOUT)
+        finally:
+            loop.remove_reader(sock.fileno())
+            sock.close()
+        
+        return discovered
+
+    async def _arp_scan_subprocess(self, found: Optional[asyncio.Queue]) -> List[Dict]:
+        """Discover cameras with the external arp-scan tool."""
         discovered = []
         
         try:
@@ -182,28 +465,30 @@ class OpenICPCDiscovery:
             process = await asyncio.create_subprocess_exec(
                 "arp-scan", "--localnet", "--retry=1",
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+                stderr=asyncio.subprocess.DEVNULL
             )
-            stdout, stderr = await process.communicate()
             
-            if process.returncode == 0:
-                lines = stdout.decode().split('\n')
-                for line in lines:
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        ip = parts[0]
-                        mac = parts[1] if len(parts) > 1 else ""
-                        
-                        # Check if MAC matches known OpenIPC prefixes
-                        if any(mac.upper().startswith(prefix.upper()) for prefix in OPENIPC_MAC_PREFIXES):
-                            device_info = {
-                                "ip": ip,
-                                "mac": mac,
-                                "port": 80,
-                                "source": "arp",
-                            }
-                            discovered.append(device_info)
-                            _LOGGER.debug("ARP discovered: %s (%s)", ip, mac)
+            # Читаем вывод построчно по мере сканирования
+            async for raw_line in process.stdout:
+                parts = raw_line.decode('ascii', 'ignore').split()
+                if len(parts) >= 2:
+                    ip = parts[0]
+                    mac = parts[1]
+                    
+                    # Check if MAC matches known OpenIPC prefixes
+                    if mac[:8].upper() in _OPENIPC_OUIS:
+                        device_info = {
+                            "ip": ip,
+                            "mac": mac,
+                            "port": 80,
+                            "source": "arp",
+                        }
+                        discovered.append(device_info)
+                        if found is not None:
+                            found.put_nowait(device_info)
+                        _LOGGER.debug("ARP discovered: %s (%s)", ip, mac)
+            
+            await process.wait()
         except Exception as e:
             _LOGGER.debug("ARP scan failed: %s", e)
         
@@ -217,32 +502,45 @@ class OpenICPCDiscovery:
         _LOGGER.debug("Starting mDNS discovery")
         discovered = []
         
-        class OpenIPCListener(ServiceListener):
-            def __init__(self):
-                self.services = []
+        try:
+            from homeassistant.components.zeroconf import async_get_async_instance
             
-            def add_service(self, zc, type_, name):
-                info = zc.get_service_info(type_, name)
-                if info:
-                    self.services.append(info)
+            # Используем общий экземпляр zeroconf HA с уже прогретым кешем
+            aiozc = await async_get_async_instance(self.hass)
+            resolve_tasks = []
             
-            def update_service(self, zc, type_, name):
-                pass
+            async def _resolve(service_type: str, name: str):
+                info = AsyncServiceInfo(service_type, name)
+                if await info.async_request(aiozc.zeroconf, 3000):
+                    return info
+                return None
             
-            def remove_service(self, zc, type_, name):
-                pass
-        
-        try:
-            zeroconf = Zeroconf()
-            listener = OpenIPCListener()
-            browser = ServiceBrowser(zeroconf, MDNS_SERVICE, listener)
+            def _on_service_state_change(zeroconf, service_type, name, state_change):
+                if state_change is ServiceStateChange.Added:
+                    resolve_tasks.append(
+                        self.hass.async_create_task(_resolve(service_type, name))
+                    )
+            
+            browser = AsyncServiceBrowser(
+                aiozc.zeroconf,
+                [MDNS_SERVICE, MDNS_DEVICE_TYPE],
+                handlers=[_on_service_state_change],
+            )
             
             # Wait for responses
-            await asyncio.sleep(3)
+            try:
+                await asyncio.sleep(3)
+            finally:
+                await browser.async_cancel()
+            
+            services = await asyncio.gather(*resolve_tasks, return_exceptions=True)
             
-            for service in listener.services:
-                if service.addresses:
-                    ip = socket.inet_ntoa(service.addresses[0])
+            for service in services:
+                if not isinstance(service, AsyncServiceInfo):
+                    continue
+                addresses = service.parsed_addresses(IPVersion.V4Only)
+                if addresses:
+                    ip = addresses[0]
                     port = service.port
                     
                     # Check if it might be OpenIPC
@@ -257,8 +555,6 @@ class OpenICPCDiscovery:
                         discovered.append(device_info)
                         _LOGGER.debug("mDNS discovered: %s:%d", ip, port)
             
-            zeroconf.close()
-            
         except Exception as e:
             _LOGGER.debug("mDNS discovery error: %s", e)
         
@@ -266,25 +562,46 @@ class OpenICPCDiscovery:
 
     async def _probe_host(self, ip: str) -> Optional[Dict]:
         """Probe a single host for OpenIPC API."""
-        for port in BROADCAST_PORTS:
-            for endpoint in DISCOVERY_ENDPOINTS:
-                url = f"http://{ip}:{port}{endpoint}"
-                try:
-                    async with async_timeout.timeout(1):
-                        async with self.session.get(url) as response:
-                            if response.status == 200:
-                                # Try to verify it's OpenIPC
-                                text = await response.text()
-                                if 'openipc' in text.lower() or 'majestic' in text.lower():
-                                    _LOGGER.debug("Found OpenIPC at %s:%d via %s", ip, port, endpoint)
-                                    return {
-                                        "ip": ip,
-                                        "port": port,
-                                        "source": "probe",
-                                        "endpoint": endpoint,
-                                    }
-                except:
-                    continue
+        async with self._probe_semaphore:
+            # Все комбинации порт × эндпоинт проверяем одновременно
+            tasks = [
+                asyncio.create_task(self._probe_endpoint(ip, port, endpoint))
+                for port in BROADCAST_PORTS
+                for endpoint in DISCOVERY_ENDPOINTS
+            ]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    try:
+                        result = await next_done
+                    except (asyncio.TimeoutError, aiohttp.ClientError, OSError):
+                        continue
+                    if result:
+                        return result
+            finally:
+                for task in tasks:
+                    if not task.done():
+                        task.cancel()
+            return None
+
+    async def _probe_endpoint(self, ip: str, port: int, endpoint: str) -> Optional[Dict]:
+        """Probe a single host endpoint for OpenIPC API."""
+        url = f"http://{ip}:{port}{endpoint}"
+        try:
+            session = self._get_probe_session()
+            async with session.get(url, timeout=PROBE_ENDPOINT_TIMEOUT) as response:
+                if response.status == 200:
+                    # Try to verify it's OpenIPC by the beginning of the body only
+                    chunk = (await response.content.read(PROBE_READ_BYTES)).lower()
+                    if b'openipc' in chunk or b'majestic' in chunk:
+                        _LOGGER.debug("Found OpenIPC at %s:%d via %s", ip, port, endpoint)
+                        return {
+                            "ip": ip,
+                            "port": port,
+                            "source": "probe",
+                            "endpoint": endpoint,
+                        }
+        except (asyncio.TimeoutError, aiohttp.ClientError, OSError):
+            pass
         return None
 
     async def verify_device(self, device: Dict) -> bool:
@@ -292,37 +609,67 @@ class OpenICPCDiscovery:
         ip = device["ip"]
         port = device.get("port", 80)
         
-        # Try multiple endpoints to verify
+        # Try multiple endpoints to verify, cheapest and most selective first:
+        # the connector allows 2 requests per host, the rest wait and get cancelled
         verification_endpoints = [
-            (f"http://{ip}:{port}/cgi-bin/status.cgi", "openipc"),
-            (f"http://{ip}:{port}/metrics", "node_"),
-            (f"http://{ip}:{port}/api/v1/config.json", "majestic"),
+            (f"http://{ip}:{port}/metrics", b"node_"),
+            (f"http://{ip}:{port}/api/v1/config.json", b"majestic"),
+            (f"http://{ip}:{port}/cgi-bin/status.cgi", b"openipc"),
             (f"http://{ip}:{port}/image.jpg", None),  # Just check if returns image
         ]
         
-        for url, expected_text in verification_endpoints:
-            try:
-                async with async_timeout.timeout(2):
-                    async with self.session.get(url) as response:
-                        if response.status == 200:
-                            if expected_text:
-                                text = await response.text()
-                                if expected_text in text.lower():
-                                    device["verified_by"] = url
-                                    return True
-                            else:
-                                # For image.jpg, check content type
-                                content_type = response.headers.get('Content-Type', '')
-                                if 'image' in content_type:
-                                    device["verified_by"] = url
-                                    return True
-            except:
-                continue
+        tasks = [
+            asyncio.create_task(self._check_endpoint(url, expected_text))
+            for url, expected_text in verification_endpoints
+        ]
+        try:
+            async with asyncio.timeout(2.5):
+                for next_done in asyncio.as_completed(tasks):
+                    try:
+                        url = await next_done
+                    except (asyncio.TimeoutError, aiohttp.ClientError, OSError, ValueError):
+                        continue
+                    if url:
+                        device["verified_by"] = url
+                        return True
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
         
         return False
 
+    async def _check_endpoint(self, url: str, expected_text: Optional[bytes]) -> Optional[str]:
+        """Check a single verification endpoint, return its URL on success."""
+        async with self._get_probe_session().get(url, headers=VERIFY_HEADERS) as response:
+            if response.status == 200:
+                if expected_text:
+                    chunk = await response.content.read(VERIFY_READ_BYTES)
+                    if expected_text in chunk.lower():
+                        return url
+                else:
+                    # For image.jpg, check content type
+                    content_type = response.headers.get('Content-Type', '')
+                    if 'image' in content_type:
+                        return url
+        return None
+
     async def _get_local_ip(self) -> Optional[str]:
-        """Get local IP address."""
+        """Get local IP address (cached for LOCAL_IP_CACHE_TTL seconds)."""
+        local_ip, timestamp = self._local_ip_cache
+        now = self.hass.loop.time()
+        if local_ip and now - timestamp < LOCAL_IP_CACHE_TTL:
+            return local_ip
+        
+        local_ip = await self.hass.async_add_executor_job(self._blocking_get_local_ip)
+        self._local_ip_cache = (local_ip, now)
+        return local_ip
+
+    @staticmethod
+    def _blocking_get_local_ip() -> Optional[str]:
+        """Get local IP address via a temporary UDP socket (blocking)."""
         try:
             # Create temporary connection to get local IP
             sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
@@ -330,28 +677,34 @@ class OpenICPCDiscovery:
             local_ip = sock.getsockname()[0]
             sock.close()
             return local_ip
-        except:
+        except OSError:
             return None
 
     def _get_network(self, ip: str) -> Optional[ipaddress.IPv4Network]:
         """Get network from IP address (assumes /24)."""
+        cached_ip, network = self._network_cache
+        if cached_ip == ip:
+            return network
         try:
-            return ipaddress.IPv4Network(f"{ip}/24", strict=False)
-        except:
+            network = ipaddress.IPv4Network(f"{ip}/24", strict=False)
+        except ValueError:
             return None
-
-    def _extract_location(self, ssdp_response: str) -> Optional[str]:
-        """Extract LOCATION header from SSDP response."""
-        for line in ssdp_response.split('\n'):
-            if line.lower().startswith('location:'):
-                return line.split(':', 1)[1].strip()
-        return None
+        self._network_cache = (ip, network)
+        return network
 
     def _parse_ssdp_response(self, response: str) -> Dict:
         """Parse SSDP response headers."""
         headers = {}
-        for line in response.split('\n'):
-            if ':' in line:
-                key, value = line.split(':', 1)
+        for line in response.splitlines():
+            key, sep, value = line.partition(':')
+            if sep:
                 headers[key.strip().lower()] = value.strip()
-        return headers
\ No newline at end of file
+        return headers
+
+
+def async_get_discovery(hass: HomeAssistant) -> OpenICPCDiscovery:
+    """Return the discovery instance shared by all scans."""
+    discovery = hass.data.get(DATA_DISCOVERY)
+    if discovery is None:
+        discovery = hass.data[DATA_DISCOVERY] = OpenICPCDiscovery(hass)
+    return discovery
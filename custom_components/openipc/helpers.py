@@ -1,12 +1,51 @@
 """Helper functions for OpenIPC integration."""
 import logging
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_ENTITY_ID
+from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.helpers.entity_component import EntityComponent
 
-from .const import DOMAIN
+from .const import DOMAIN, DATA_COORDINATORS, DATA_ENTITY_INDEX
 
 _LOGGER = logging.getLogger(__name__)
 
+# Подсказка для ошибки "координатор не найден" - собирается один раз при импорте
+_USAGE_HELP_TEMPLATE = (
+    "Please use one of these formats:\n"
+    "  - camera.openipc_camera\n"
+    "  - camera.<host_with_underscores>\n"
+    "  - camera.<host_with_dots>"
+)
+
+def index_coordinator(hass: HomeAssistant, coordinator) -> None:
+    """Add a coordinator to the entity_id index."""
+    index = hass.data[DOMAIN][DATA_ENTITY_INDEX]
+    for key in coordinator.camera_entity_ids:
+        index[key] = coordinator
+
+def unindex_coordinator(hass: HomeAssistant, coordinator) -> None:
+    """Remove a coordinator from the entity_id index."""
+    index = hass.data[DOMAIN][DATA_ENTITY_INDEX]
+    for key in coordinator.camera_entity_ids:
+        if index.get(key) is coordinator:
+            del index[key]
+
+def extract_entity_id(call: ServiceCall):
+    """Return the single entity_id a service call targets."""
+    # HA переносит target.entity_id в call.data, отдельно target не проверяем
+    entity_id = call.data.get(CONF_ENTITY_ID)
+    if isinstance(entity_id, list):
+        return entity_id[0] if entity_id else None
+    return entity_id
+
+def extract_entity_ids(call: ServiceCall) -> list:
+    """Return all entity_ids a service call targets."""
+    entity_id = call.data.get(CONF_ENTITY_ID)
+    if not entity_id:
+        return []
+    if isinstance(entity_id, str):
+        return [entity_id]
+    return list(entity_id)
+
 async def find_coordinator_by_entity_id(hass: HomeAssistant, entity_id: str):
     """Find coordinator by entity_id - improved version."""
     _LOGGER.debug("🔍 Looking for coordinator with entity_id: %s", entity_id)
@@ -23,30 +62,19 @@ async def find_coordinator_by_entity_id(hass: HomeAssistant, entity_id: str):
     if not isinstance(entity_id, str):
         return None
     
-    # Ищем по всем записям в DOMAIN
-    for entry_id, coordinator in hass.data[DOMAIN].items():
-        if entry_id == "config":
-            continue
-        
+    # Точное совпадение - один поиск в индексе
+    domain_data = hass.data[DOMAIN]
+    coordinator = domain_data[DATA_ENTITY_INDEX].get(entity_id)
+    if coordinator is not None:
+        _LOGGER.debug("✅ Found coordinator by exact match: %s", coordinator.entry.entry_id)
+        return coordinator
+    
+    # Проверяем по частичному совпадению имени (например, switch.<camera>_ir)
+    for entry_id, coordinator in domain_data[DATA_COORDINATORS].items():
         if not hasattr(coordinator, 'recorder'):
             continue
         
-        camera_name = coordinator.recorder.camera_name
-        camera_host = coordinator.host
-        
-        # Проверяем различные варианты entity_id камеры
-        exact_ids = [
-            f"camera.{camera_name}",
-            f"camera.{camera_host.replace('.', '_')}",
-            f"camera.{camera_host}",
-        ]
-        
-        if entity_id in exact_ids:
-            _LOGGER.debug("✅ Found coordinator by exact match: %s", entry_id)
-            return coordinator
-        
-        # Проверяем по частичному совпадению имени
-        if camera_name in entity_id or camera_host in entity_id:
+        if coordinator.recorder.camera_name in entity_id or coordinator.host in entity_id:
             _LOGGER.debug("✅ Found coordinator by partial match: %s", entry_id)
             return coordinator
     
@@ -63,10 +91,7 @@ async def find_coordinator_by_entity_id(hass: HomeAssistant, entity_id: str):
             
             if device:
                 # Ищем координатор по идентификатору устройства
-                for entry_id, coordinator in hass.data[DOMAIN].items():
-                    if entry_id == "config":
-                        continue
-                    
+                for entry_id, coordinator in domain_data[DATA_COORDINATORS].items():
                     # Проверяем, принадлежит ли устройство этому координатору
                     if (DOMAIN, entry_id) in device.identifiers:
                         _LOGGER.debug("✅ Found coordinator via device registry: %s", entry_id)
@@ -74,38 +99,26 @@ async def find_coordinator_by_entity_id(hass: HomeAssistant, entity_id: str):
     except Exception as err:
         _LOGGER.debug("Error in device registry lookup: %s", err)
     
-    _LOGGER.error("❌ Coordinator not found for %s", entity_id)
+    _LOGGER.error("❌ Coordinator not found for %s. %s", entity_id, _USAGE_HELP_TEMPLATE)
     return None
 
-async def find_media_player(hass: HomeAssistant, entity_id: str):
-    """Find media player entity by entity_id."""
+def _find_entity(hass: HomeAssistant, domain: str, entity_id: str):
+    """Find entity of a domain by entity_id."""
     if not entity_id:
         return None
-    component: EntityComponent = hass.data.get("entity_components", {}).get("media_player")
+    component: EntityComponent = hass.data.get("entity_components", {}).get(domain)
     if component:
-        for entity in component.entities:
-            if entity.entity_id == entity_id:
-                return entity
+        return component.get_entity(entity_id)
     return None
 
+async def find_media_player(hass: HomeAssistant, entity_id: str):
+    """Find media player entity by entity_id."""
+    return _find_entity(hass, "media_player", entity_id)
+
 async def find_button(hass: HomeAssistant, entity_id: str):
     """Find button entity by entity_id."""
-    if not entity_id:
-        return None
-    component: EntityComponent = hass.data.get("entity_components", {}).get("button")
-    if component:
-        for entity in component.entities:
-            if entity.entity_id == entity_id:
-                return entity
-    return None
+    return _find_entity(hass, "button", entity_id)
 
 async def find_switch(hass: HomeAssistant, entity_id: str):
     """Find switch entity by entity_id."""
-    if not entity_id:
-        return None
-    component: EntityComponent = hass.data.get("entity_components", {}).get("switch")
-    if component:
-        for entity in component.entities:
-            if entity.entity_id == entity_id:
-                return entity
-    return None
\ No newline at end of file
+    return _find_entity(hass, "switch", entity_id)
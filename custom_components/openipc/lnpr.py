@@ -1,5 +1,8 @@
 """LNPR (License Plate Recognition) functions for Beward cameras."""
+import asyncio
 import logging
+
+import aiohttp
 import async_timeout
 
 _LOGGER = logging.getLogger(__name__)
@@ -59,6 +62,6 @@ async def check_plate_authorized(coordinator, plate: str) -> bool:
             if response.status == 200:
                 text = await response.text()
                 return plate in text
-    except:
+    except (aiohttp.ClientError, asyncio.TimeoutError):
         pass
     return False
\ No newline at end of file
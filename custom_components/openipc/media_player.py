@@ -24,7 +24,7 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 import homeassistant.util.dt as dt_util
 
-from .const import DOMAIN, CONF_DEVICE_TYPE, DEVICE_TYPE_BEWARD, DEVICE_TYPE_OPENIPC
+from .const import DOMAIN, DATA_COORDINATORS, CONF_DEVICE_TYPE, DEVICE_TYPE_BEWARD, DEVICE_TYPE_OPENIPC
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -45,7 +45,7 @@ ADDON_URL = "http://localhost:5000"
 
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up OpenIPC media players."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = hass.data[DOMAIN][DATA_COORDINATORS][entry.entry_id]
     device_type = entry.data.get(CONF_DEVICE_TYPE, DEVICE_TYPE_OPENIPC)
     
     entities = []
@@ -161,18 +161,24 @@ class OpenIPCMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         self._media_duration = None
         self._media_position = None
         self._media_position_updated_at = None
+        
+        self._device_info = None
+        self._device_info_parsed = None
 
     @property
     def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        parsed = self.coordinator.data.get("parsed", {})
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.entry.entry_id)},
-            name=self.entry.data.get(CONF_NAME, "OpenIPC Camera"),
-            manufacturer="OpenIPC",
-            model=parsed.get("model", "Camera"),
-            sw_version=parsed.get("firmware", "Unknown"),
-        )
+        """Return device info, rebuilt only when parsed data changes."""
+        parsed = self.coordinator.data.get("parsed", {}) if self.coordinator.data else {}
+        if self._device_info is None or parsed is not self._device_info_parsed:
+            self._device_info_parsed = parsed
+            self._device_info = DeviceInfo(
+                identifiers={(DOMAIN, self.entry.entry_id)},
+                name=self.entry.data.get(CONF_NAME, "OpenIPC Camera"),
+                manufacturer="OpenIPC",
+                model=parsed.get("model", "Camera"),
+                sw_version=parsed.get("firmware", "Unknown"),
+            )
+        return self._device_info
 
     @property
     def is_on(self) -> bool:
@@ -316,13 +322,11 @@ class BewardMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         self._media_duration = None
         self._media_position = None
         self._media_position_updated_at = None
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.entry.entry_id)},
-            name=self.entry.data.get(CONF_NAME, "Beward Doorbell"),
+        
+        # Информация об устройстве Beward статична
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=entry.data.get(CONF_NAME, "Beward Doorbell"),
             manufacturer="Beward",
             model="DS07P-LP",
         )
@@ -1,8 +1,13 @@
 """ONVIF client for PTZ control and event handling."""
 import asyncio
+import atexit
+import copy
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any, Callable
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
@@ -10,6 +15,10 @@ from homeassistant.helpers.aiohttp_client import async_get_clientsession
 try:
     from onvif import ONVIFCamera
     from onvif.exceptions import ONVIFError
+    from requests import Session
+    from requests.adapters import HTTPAdapter
+    from zeep.cache import SqliteCache
+    from zeep.transports import Transport
     ONVIF_AVAILABLE = True
 except ImportError:
     ONVIF_AVAILABLE = False
@@ -25,9 +34,229 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Единичные векторы (pan, tilt, zoom) для направлений PTZ
+PTZ_DIRECTIONS = {
+    'left': (-1.0, 0.0, 0.0),
+    'right': (1.0, 0.0, 0.0),
+    'up': (0.0, 1.0, 0.0),
+    'down': (0.0, -1.0, 0.0),
+    'left_up': (-1.0, 1.0, 0.0),
+    'right_up': (1.0, 1.0, 0.0),
+    'left_down': (-1.0, -1.0, 0.0),
+    'right_down': (1.0, -1.0, 0.0),
+    'zoom_in': (0.0, 0.0, 1.0),
+    'zoom_out': (0.0, 0.0, -1.0),
+}
+
+# Параметры long-poll запроса событий: камера держит запрос до прихода событий
+EVENT_PULL_TIMEOUT = timedelta(seconds=30)
+EVENT_PULL_LIMIT = 100
+
+# Продление PullPoint подписки: запрашиваемый срок и запас до его истечения
+EVENT_RENEW_TERMINATION = timedelta(minutes=10)
+EVENT_RENEW_MARGIN = 60
+EVENT_RENEW_MIN_DELAY = 10
+
+# Пул keep-alive соединений к камере для SOAP запросов PTZ/Media/Events
+ONVIF_POOL_CONNECTIONS = 10
+ONVIF_POOL_MAXSIZE = 20
+
+# Минимальный интервал между ContinuousMove: промежуточные команды джойстика отбрасываются
+PTZ_MIN_INTERVAL = 0.05
+
+# Отдельный пул для блокирующих SOAP вызовов: зависшая камера не занимает общий executor HA
+ONVIF_EXECUTOR_WORKERS = 8
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=ONVIF_EXECUTOR_WORKERS,
+    thread_name_prefix="onvif",
+)
+atexit.register(_EXECUTOR.shutdown, wait=False, cancel_futures=True)
+
+# Разобранный WSDL занимает мегабайты - один ONVIFCamera на камеру для всех клиентов
+_CAMERAS: Dict[tuple, Any] = {}
+_CAMERA_REFS: Dict[tuple, int] = {}
+_CAMERA_LOCK = asyncio.Lock()
+
+# Адрес PullPoint сервиса в xaddrs ONVIFCamera; меняем его под каждую подписку
+_PULLPOINT_NS = "http://www.onvif.org/ver10/events/wsdl/PullPointSubscription"
+_PULLPOINT_LOCK = threading.Lock()
+
+
+def _build_transport():
+    """Create a zeep transport with a pooled HTTP session and WSDL cache."""
+    session = Session()
+    adapter = HTTPAdapter(
+        pool_connections=ONVIF_POOL_CONNECTIONS,
+        pool_maxsize=ONVIF_POOL_MAXSIZE,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return Transport(session=session, cache=SqliteCache())
+
+
+async def _async_acquire_camera(hass: HomeAssistant, key: tuple):
+    """Return a shared ONVIFCamera for (host, port, username, password)."""
+    async with _CAMERA_LOCK:
+        cam = _CAMERAS.get(key)
+        if cam is None:
+            host, port, username, password = key
+            cam = await hass.loop.run_in_executor(
+                _EXECUTOR,
+                lambda: ONVIFCamera(
+                    host,
+                    port,
+                    username,
+                    password,
+                    "/etc/onvif/wsdl",  # Путь к WSDL файлам
+                    transport=_build_transport(),
+                )
+            )
+            _CAMERAS[key] = cam
+        _CAMERA_REFS[key] = _CAMERA_REFS.get(key, 0) + 1
+        return cam
+
+
+def _release_camera(key: tuple):
+    """Drop a reference to a shared ONVIFCamera."""
+    refs = _CAMERA_REFS.get(key, 0) - 1
+    if refs > 0:
+        _CAMERA_REFS[key] = refs
+    else:
+        _CAMERA_REFS.pop(key, None)
+        _CAMERAS.pop(key, None)
+
+
+def _create_pullpoint_service(cam, subscription):
+    """Create the PullPointSubscription service for a CreatePullPointSubscription response."""
+    # Ответ zeep содержит только SubscriptionReference/CurrentTime/TerminationTime -
+    # PullMessages и Renew вызываются на сервисе по адресу из SubscriptionReference
+    address = subscription.SubscriptionReference.Address._value_1
+    with _PULLPOINT_LOCK:
+        cam.xaddrs[_PULLPOINT_NS] = address
+        return cam.create_pullpoint_service()
+
+
+def _renew_delay(response) -> float:
+    """Return seconds until a subscription should be renewed."""
+    current = getattr(response, 'CurrentTime', None)
+    termination = getattr(response, 'TerminationTime', None)
+    try:
+        lifetime = (termination - current).total_seconds()
+    except TypeError:
+        lifetime = EVENT_RENEW_TERMINATION.total_seconds()
+    return max(lifetime - EVENT_RENEW_MARGIN, EVENT_RENEW_MIN_DELAY)
+
+
+class _LazyTimestamp:
+    """Event timestamp formatted to ISO only when requested."""
+
+    __slots__ = ("ts",)
+
+    def __init__(self, ts: float):
+        """Store the epoch timestamp."""
+        self.ts = ts
+
+    def isoformat(self) -> str:
+        """Return the timestamp in ISO format."""
+        return datetime.fromtimestamp(self.ts).isoformat()
+
+    __str__ = isoformat
+
+
+async def _async_noop(self, *args, **kwargs):
+    """Do nothing when the ONVIF library is missing."""
+    return False
+
+
+async def _async_noop_none(self, *args, **kwargs):
+    """Do nothing when the ONVIF library is missing."""
+    return None
+
+
+class _OnvifStub:
+    """No-op ONVIF client used when the ONVIF library is not installed."""
+
+    has_ptz = False
+    stream_uri = None
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        host: str,
+        port: int,
+        username: str,
+        password: str,
+        device_type: str,
+        camera_name: str,
+    ):
+        """Initialize the stub client."""
+        self.hass = hass
+        self.host = host
+        self.port = port
+        self.device_type = device_type
+        self.camera_name = camera_name
+        self._available = False
+        self._ptz_speed = DEFAULT_PTZ_SPEED
+        _LOGGER.warning(f"⚠️ ONVIF client in simulation mode for {camera_name}")
+
+    async def async_connect(self) -> bool:
+        """Pretend to connect."""
+        self._available = True
+        return True
+
+    async def async_disconnect(self):
+        """Pretend to disconnect."""
+        self._available = False
+
+    async def async_update_presets(self) -> Dict[str, str]:
+        """Return no presets."""
+        return {}
+
+    async_probe_ptz = _async_noop
+    async_ptz_move = _async_noop
+    async_ptz_stop = _async_noop
+    async_ptz_goto_preset = _async_noop
+    async_ptz_remove_preset = _async_noop
+    async_ptz_set_preset = _async_noop_none
+    async_get_ptz_status = _async_noop_none
+    async_subscribe_events = _async_noop_none
+
+    def register_event_callback(self, callback: Callable):
+        """Ignore event callbacks."""
+
+    def unregister_event_callback(self, callback: Callable):
+        """Ignore event callbacks."""
+
+    @property
+    def is_available(self) -> bool:
+        """Return True if the stub is connected."""
+        return self._available
+
+    @property
+    def presets(self) -> Dict[str, str]:
+        """Return no presets."""
+        return {}
+
+    @property
+    def ptz_speed(self) -> float:
+        """Return PTZ speed."""
+        return self._ptz_speed
+
+    @ptz_speed.setter
+    def ptz_speed(self, speed: float):
+        """Set PTZ speed."""
+        self._ptz_speed = max(0.0, min(1.0, speed))
+
+
 class OpenIPCOnvifClient:
     """ONVIF client for PTZ and event management."""
 
+    def __new__(cls, *args, **kwargs):
+        """Return a no-op stub when the ONVIF library is missing."""
+        if not ONVIF_AVAILABLE:
+            return _OnvifStub(*args, **kwargs)
+        return super().__new__(cls)
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -49,51 +278,83 @@ class OpenIPCOnvifClient:
         self.session = async_get_clientsession(hass)
         
         self._cam = None
+        self._cam_key = None
         self._ptz = None
         self._media = None
         self._events = None
         self._profile = None
         self._available = False
         
+        # PTZ и Events сервисы создаются при первом обращении
+        self._ptz_lock = asyncio.Lock()
+        self._events_lock = asyncio.Lock()
+        self._ptz_probed = False
+        self._events_probed = False
+        self._subscribed = False
+        self._subscription = None
+        self._renew_task = None
+        
+        # Значения для свойств, вычисляемые один раз при подключении/проверке
+        self._has_ptz: Optional[bool] = None
+        self._stream_uri: Optional[str] = None
+        
+        # Последняя команда движения (pan, tilt, zoom) и воркер, отправляющий ее на камеру
+        self._ptz_target = None
+        self._ptz_wake = asyncio.Event()
+        self._ptz_send_lock = asyncio.Lock()
+        self._ptz_worker = None
+        
+        # Шаблоны PTZ запросов: create_type обходит WSDL схему на каждый вызов
+        self._ptz_templates = {}
+        
         # PTZ speed (0.0 to 1.0) [citation:2]
         self._ptz_speed = DEFAULT_PTZ_SPEED
         
-        # Presets cache
+        # Presets cache; dirty - кэш еще не загружен с камеры целиком
         self._presets = {}
+        self._presets_dirty = True
         
         # Event callbacks
-        self._event_callbacks = []
+        self._event_callbacks: set[Callable] = set()
         
-        if ONVIF_AVAILABLE:
-            _LOGGER.info(f"✅ ONVIF client initialized for {camera_name} at {host}:{port}")
-        else:
-            _LOGGER.warning(f"⚠️ ONVIF client in simulation mode for {camera_name}")
+        _LOGGER.info(f"✅ ONVIF client initialized for {camera_name} at {host}:{port}")
 
     async def async_connect(self) -> bool:
         """Connect to camera via ONVIF."""
-        if not ONVIF_AVAILABLE:
-            self._available = True
-            return True
-
         try:
-            # Создаем ONVIF клиент в executor
-            self._cam = await self.hass.async_add_executor_job(
-                lambda: ONVIFCamera(
-                    self.host,
-                    self.port,
-                    self.username,
-                    self.password,
-                    "/etc/onvif/wsdl"  # Путь к WSDL файлам
+            # Берем общий ONVIF клиент (создается в executor при первом обращении)
+            if self._cam_key is None:
+                key = (self.host, self.port, self.username, self.password)
+                self._cam = await _async_acquire_camera(self.hass, key)
+                self._cam_key = key
+
+            # PTZ и Events сервисы создаем лениво - фиксированным камерам они не нужны
+            self._ptz = None
+            self._events = None
+            self._ptz_probed = False
+            self._events_probed = False
+            self._subscribed = False
+            self._subscription = None
+            if self._renew_task is not None:
+                self._renew_task.cancel()
+                self._renew_task = None
+            self._has_ptz = None
+            self._ptz_templates = {}
+            self._presets_dirty = True
+
+            # Events сервис не зависит от media - при наличии подписчиков создаем параллельно
+            if self._event_callbacks:
+                self._media, _ = await asyncio.gather(
+                    self._async_run(self._cam.create_media_service),
+                    self._async_ensure_events(),
+                )
+            else:
+                self._media = await self._async_run(
+                    self._cam.create_media_service
                 )
-            )
-
-            # Получаем сервисы
-            self._media = await self.hass.async_add_executor_job(
-                self._cam.create_media_service
-            )
             
             # Получаем профили
-            profiles = await self.hass.async_add_executor_job(
+            profiles = await self._async_run(
                 self._media.GetProfiles
             )
             
@@ -102,33 +363,15 @@ class OpenIPCOnvifClient:
                 return False
                 
             self._profile = profiles[0]
+            self._stream_uri = getattr(self._profile, 'StreamUri', None)
             _LOGGER.debug(f"Using media profile: {self._profile.Name}")
 
-            # Пытаемся получить PTZ сервис
-            try:
-                self._ptz = await self.hass.async_add_executor_job(
-                    self._cam.create_ptz_service
-                )
-                # Проверяем поддержку PTZ
-                if self._ptz:
-                    ptz_status = await self.async_get_ptz_status()
-                    _LOGGER.info(f"✅ PTZ supported, current position: {ptz_status}")
-            except Exception as err:
-                _LOGGER.info(f"ℹ️ PTZ not supported for this device: {err}")
-                self._ptz = None
-
-            # Пытаемся получить Event сервис
-            try:
-                self._events = await self.hass.async_add_executor_job(
-                    self._cam.create_events_service
-                )
-                await self.async_subscribe_events()
-            except Exception as err:
-                _LOGGER.info(f"ℹ️ Events not supported: {err}")
-                self._events = None
-
             self._available = True
             _LOGGER.info(f"✅ ONVIF connection successful for {self.camera_name}")
+
+            # Подписка на события нужна, только если кто-то их слушает
+            if self._event_callbacks:
+                await self.async_subscribe_events()
             return True
 
         except Exception as err:
@@ -136,78 +379,137 @@ class OpenIPCOnvifClient:
             self._available = False
             return False
 
+    async def _async_run(self, func, *args):
+        """Run a blocking SOAP call in the ONVIF executor."""
+        return await self.hass.loop.run_in_executor(_EXECUTOR, func, *args)
+
     async def async_disconnect(self):
         """Disconnect ONVIF client."""
         self._available = False
+        if self._ptz_worker is not None:
+            self._ptz_worker.cancel()
+            self._ptz_worker = None
+        if self._renew_task is not None:
+            self._renew_task.cancel()
+            self._renew_task = None
+        self._subscription = None
+        if self._cam_key is not None:
+            _release_camera(self._cam_key)
+            self._cam_key = None
+            self._cam = None
         _LOGGER.info(f"Disconnected ONVIF client for {self.camera_name}")
 
     # ========== PTZ Control ==========
 
+    async def _async_ensure_ptz(self):
+        """Create the PTZ service on first use."""
+        if self._ptz_probed or self._cam is None:
+            return self._ptz
+
+        async with self._ptz_lock:
+            if not self._ptz_probed:
+                try:
+                    self._ptz = await self._async_run(
+                        self._cam.create_ptz_service
+                    )
+                    _LOGGER.info(f"✅ PTZ supported for {self.camera_name}")
+                except Exception as err:
+                    _LOGGER.info(f"ℹ️ PTZ not supported for this device: {err}")
+                    self._ptz = None
+                self._ptz_probed = True
+                self._has_ptz = self._ptz is not None
+        return self._ptz
+
+    async def async_probe_ptz(self) -> bool:
+        """Return True if the camera exposes a PTZ service."""
+        if not self._available:
+            return False
+        return await self._async_ensure_ptz() is not None
+
+    def _ptz_request(self, name: str):
+        """Return a PTZ request object built from a cached template."""
+        template = self._ptz_templates.get(name)
+        if template is None:
+            template = self._ptz.create_type(name)
+            template.ProfileToken = self._profile.token
+            self._ptz_templates[name] = template
+        # Копия нужна, т.к. запросы уходят в executor параллельно
+        return copy.deepcopy(template)
+
     async def async_ptz_move(self, direction: str, speed: Optional[float] = None) -> bool:
         """Move PTZ camera."""
-        if not self._ptz or not self._available:
+        if not self._available or not await self._async_ensure_ptz():
             _LOGGER.warning("PTZ not available")
             return False
 
         speed = speed or self._ptz_speed
 
-        try:
-            # Создаем запрос на движение
-            request = self._ptz.create_type('ContinuousMove')
-            request.ProfileToken = self._profile.token
-            request.Velocity = {
-                'PanTilt': {
-                    'x': 0.0,
-                    'y': 0.0
-                },
-                'Zoom': {
-                    'x': 0.0
-                }
-            }
+        # Устанавливаем направление [citation:2]
+        ux, uy, uz = PTZ_DIRECTIONS.get(direction, (0.0, 0.0, 0.0))
 
-            # Устанавливаем направление [citation:2]
-            if direction in ['left', 'left_up', 'left_down']:
-                request.Velocity['PanTilt']['x'] = -speed
-            elif direction in ['right', 'right_up', 'right_down']:
-                request.Velocity['PanTilt']['x'] = speed
+        # Кладем только последнюю команду - воркер отправит ее, отбросив промежуточные
+        self._ptz_target = (ux * speed, uy * speed, uz * speed)
+        self._ptz_wake.set()
+        if self._ptz_worker is None or self._ptz_worker.done():
+            self._ptz_worker = self.hass.async_create_background_task(
+                self._async_ptz_worker(), f"onvif_ptz_{self.host}"
+            )
 
-            if direction in ['up', 'left_up', 'right_up']:
-                request.Velocity['PanTilt']['y'] = speed
-            elif direction in ['down', 'left_down', 'right_down']:
-                request.Velocity['PanTilt']['y'] = -speed
+        _LOGGER.debug(f"PTZ move: {direction} at speed {speed}")
+        return True
 
-            if direction == 'zoom_in':
-                request.Velocity['Zoom']['x'] = speed
-            elif direction == 'zoom_out':
-                request.Velocity['Zoom']['x'] = -speed
+    async def _async_ptz_worker(self):
+        """Send the most recent PTZ move to the camera."""
+        while self._available:
+            await self._ptz_wake.wait()
+            self._ptz_wake.clear()
+            target, self._ptz_target = self._ptz_target, None
+            if target is None:
+                continue
 
-            await self.hass.async_add_executor_job(
-                self._ptz.ContinuousMove,
-                request
-            )
+            x, y, zoom = target
+            try:
+                # Создаем запрос на движение
+                request = self._ptz_request('ContinuousMove')
+                request.Velocity = {
+                    'PanTilt': {
+                        'x': x,
+                        'y': y
+                    },
+                    'Zoom': {
+                        'x': zoom
+                    }
+                }
 
-            _LOGGER.debug(f"PTZ move: {direction} at speed {speed}")
-            return True
+                async with self._ptz_send_lock:
+                    await self._async_run(
+                        self._ptz.ContinuousMove,
+                        request
+                    )
 
-        except Exception as err:
-            _LOGGER.error(f"PTZ move failed: {err}")
-            return False
+            except Exception as err:
+                _LOGGER.error(f"PTZ move failed: {err}")
+
+            await asyncio.sleep(PTZ_MIN_INTERVAL)
 
     async def async_ptz_stop(self) -> bool:
         """Stop PTZ movement."""
-        if not self._ptz or not self._available:
+        if not self._available or not await self._async_ensure_ptz():
             return False
 
         try:
-            request = self._ptz.create_type('Stop')
-            request.ProfileToken = self._profile.token
+            request = self._ptz_request('Stop')
             request.PanTilt = True
             request.Zoom = True
 
-            await self.hass.async_add_executor_job(
-                self._ptz.Stop,
-                request
-            )
+            # Отменяем еще не отправленное движение; lock не дает Stop обогнать
+            # уже отправляемый ContinuousMove
+            self._ptz_target = None
+            async with self._ptz_send_lock:
+                await self._async_run(
+                    self._ptz.Stop,
+                    request
+                )
 
             _LOGGER.debug("PTZ stopped")
             return True
@@ -218,15 +520,14 @@ class OpenIPCOnvifClient:
 
     async def async_ptz_goto_preset(self, preset_token: str) -> bool:
         """Go to preset position."""
-        if not self._ptz or not self._available:
+        if not self._available or not await self._async_ensure_ptz():
             return False
 
         try:
-            request = self._ptz.create_type('GotoPreset')
-            request.ProfileToken = self._profile.token
+            request = self._ptz_request('GotoPreset')
             request.PresetToken = preset_token
 
-            await self.hass.async_add_executor_job(
+            await self._async_run(
                 self._ptz.GotoPreset,
                 request
             )
@@ -240,23 +541,27 @@ class OpenIPCOnvifClient:
 
     async def async_ptz_set_preset(self, preset_name: str) -> Optional[str]:
         """Set current position as preset."""
-        if not self._ptz or not self._available:
+        if not self._available or not await self._async_ensure_ptz():
             return None
 
         try:
-            request = self._ptz.create_type('SetPreset')
-            request.ProfileToken = self._profile.token
+            request = self._ptz_request('SetPreset')
             request.PresetName = preset_name
 
-            result = await self.hass.async_add_executor_job(
+            result = await self._async_run(
                 self._ptz.SetPreset,
                 request
             )
 
-            # Обновляем кэш пресетов
-            await self.async_update_presets()
+            # zeep разворачивает ответ из одного элемента в само значение токена
+            preset_token = getattr(result, 'PresetToken', result)
+
+            # Обновляем кэш пресетов без повторного GetPresets
+            if preset_token and not self._presets_dirty:
+                self._presets[preset_name] = preset_token
+            else:
+                await self.async_update_presets()
 
-            preset_token = result.PresetToken if hasattr(result, 'PresetToken') else None
             _LOGGER.info(f"Preset set: {preset_name} ({preset_token})")
             return preset_token
 
@@ -266,21 +571,26 @@ class OpenIPCOnvifClient:
 
     async def async_ptz_remove_preset(self, preset_token: str) -> bool:
         """Remove preset."""
-        if not self._ptz or not self._available:
+        if not self._available or not await self._async_ensure_ptz():
             return False
 
         try:
-            request = self._ptz.create_type('RemovePreset')
-            request.ProfileToken = self._profile.token
+            request = self._ptz_request('RemovePreset')
             request.PresetToken = preset_token
 
-            await self.hass.async_add_executor_job(
+            await self._async_run(
                 self._ptz.RemovePreset,
                 request
             )
 
             # Обновляем кэш
-            await self.async_update_presets()
+            if self._presets_dirty:
+                await self.async_update_presets()
+            else:
+                self._presets = {
+                    name: token for name, token in self._presets.items()
+                    if token != preset_token
+                }
 
             _LOGGER.info(f"Preset removed: {preset_token}")
             return True
@@ -291,14 +601,13 @@ class OpenIPCOnvifClient:
 
     async def async_update_presets(self) -> Dict[str, str]:
         """Get all presets."""
-        if not self._ptz or not self._available:
+        if not self._available or not await self._async_ensure_ptz():
             return {}
 
         try:
-            request = self._ptz.create_type('GetPresets')
-            request.ProfileToken = self._profile.token
+            request = self._ptz_request('GetPresets')
 
-            presets = await self.hass.async_add_executor_job(
+            presets = await self._async_run(
                 self._ptz.GetPresets,
                 request
             )
@@ -307,6 +616,7 @@ class OpenIPCOnvifClient:
             self._presets = {
                 p.Name: p.token for p in presets if hasattr(p, 'Name')
             }
+            self._presets_dirty = False
 
             _LOGGER.debug(f"Found {len(self._presets)} presets")
             return self._presets
@@ -317,26 +627,28 @@ class OpenIPCOnvifClient:
 
     async def async_get_ptz_status(self) -> Optional[Dict[str, float]]:
         """Get current PTZ position."""
-        if not self._ptz or not self._available:
+        if not self._available or not await self._async_ensure_ptz():
             return None
 
         try:
-            request = self._ptz.create_type('GetStatus')
-            request.ProfileToken = self._profile.token
+            request = self._ptz_request('GetStatus')
 
-            status = await self.hass.async_add_executor_job(
+            status = await self._async_run(
                 self._ptz.GetStatus,
                 request
             )
 
-            if hasattr(status, 'Position') and status.Position:
-                pos = status.Position
-                return {
-                    'pan': pos.PanTilt.x if hasattr(pos, 'PanTilt') else 0,
-                    'tilt': pos.PanTilt.y if hasattr(pos, 'PanTilt') else 0,
-                    'zoom': pos.Zoom.x if hasattr(pos, 'Zoom') else 0,
-                }
-            return None
+            pos = getattr(status, 'Position', None)
+            if not pos:
+                return None
+
+            pan_tilt = getattr(pos, 'PanTilt', None)
+            zoom = getattr(pos, 'Zoom', None)
+            return {
+                'pan': getattr(pan_tilt, 'x', 0),
+                'tilt': getattr(pan_tilt, 'y', 0),
+                'zoom': getattr(zoom, 'x', 0),
+            }
 
         except Exception as err:
             _LOGGER.error(f"Get PTZ status failed: {err}")
@@ -344,41 +656,99 @@ class OpenIPCOnvifClient:
 
     # ========== Event Handling ==========
 
+    async def _async_ensure_events(self):
+        """Create the Events service on first use."""
+        if self._events_probed or self._cam is None:
+            return self._events
+
+        async with self._events_lock:
+            if not self._events_probed:
+                try:
+                    self._events = await self._async_run(
+                        self._cam.create_events_service
+                    )
+                except Exception as err:
+                    _LOGGER.info(f"ℹ️ Events not supported: {err}")
+                    self._events = None
+                self._events_probed = True
+        return self._events
+
     async def async_subscribe_events(self):
         """Subscribe to ONVIF events."""
-        if not self._events or not self._available:
+        if self._subscribed or not self._available:
+            return
+        if not await self._async_ensure_events():
             return
+        self._subscribed = True
 
         try:
             # Создаем pull point subscription
-            subscription = await self.hass.async_add_executor_job(
+            subscription = await self._async_run(
                 self._events.CreatePullPointSubscription
             )
+            pullpoint = await self._async_run(
+                _create_pullpoint_service, self._cam, subscription
+            )
             
-            # Запускаем polling событий
-            self.hass.async_create_task(self._async_pull_events(subscription))
+            self._subscription = pullpoint
+
+            # Запускаем polling событий и продление подписки до истечения ее срока
+            self.hass.async_create_task(self._async_pull_events(pullpoint))
+            self._renew_task = self.hass.async_create_background_task(
+                self._async_renew_subscription(pullpoint, _renew_delay(subscription)),
+                f"onvif_renew_{self.host}",
+            )
 
         except Exception as err:
             _LOGGER.error(f"Event subscription failed: {err}")
+            self._subscribed = False
 
-    async def _async_pull_events(self, subscription):
-        """Pull events from subscription."""
-        while self._available:
+    async def _async_pull_events(self, pullpoint):
+        """Pull events from the PullPoint subscription service."""
+        request = pullpoint.create_type('PullMessages')
+        request.Timeout = EVENT_PULL_TIMEOUT
+        request.MessageLimit = EVENT_PULL_LIMIT
+
+        while self._available and self._subscription is pullpoint:
             try:
-                messages = await self.hass.async_add_executor_job(
-                    subscription.PullMessages,
-                    10  # timeout
+                # Long-poll держит поток до 30 с - оставляем его в общем executor HA,
+                # чтобы подписки не занимали пул PTZ команд
+                result = await self.hass.async_add_executor_job(
+                    pullpoint.PullMessages,
+                    request
                 )
+                messages = getattr(result, 'NotificationMessage', result) or []
 
                 for msg in messages:
                     await self._async_process_event(msg)
 
-                await asyncio.sleep(1)
+                # Пока идут события - сразу забираем следующую пачку
+                await asyncio.sleep(0 if messages else 1)
 
             except Exception as err:
                 _LOGGER.debug(f"Event pull error: {err}")
                 await asyncio.sleep(5)
 
+    async def _async_renew_subscription(self, pullpoint, delay: float):
+        """Renew the PullPoint subscription before it expires."""
+        while self._available and self._subscription is pullpoint:
+            await asyncio.sleep(delay)
+            try:
+                result = await self._async_run(
+                    pullpoint.Renew,
+                    {'TerminationTime': datetime.now(timezone.utc) + EVENT_RENEW_TERMINATION}
+                )
+                delay = _renew_delay(result)
+                _LOGGER.debug(f"Event subscription renewed, next renew in {delay:.0f}s")
+            except Exception as err:
+                # Подписку продлить не удалось - создаем новую
+                _LOGGER.warning(f"Event subscription renew failed: {err}")
+                self._subscription = None
+                self._subscribed = False
+                self._renew_task = None
+                await self.async_subscribe_events()
+                return
+
     async def _async_process_event(self, message):
         """Process ONVIF event message."""
         try:
@@ -386,24 +756,32 @@ class OpenIPCOnvifClient:
             event_data = {
                 'source': message.get('Source', {}),
                 'data': message.get('Data', {}),
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': _LazyTimestamp(time.time()),
             }
 
-            # Вызываем колбэки
-            for callback in self._event_callbacks:
-                await callback(event_data)
+            # Вызываем колбэки параллельно - медленный обработчик не задерживает остальных;
+            # снимок защищает от регистрации/отписки во время рассылки
+            callbacks = tuple(self._event_callbacks)
+            results = await asyncio.gather(
+                *(callback(event_data) for callback in callbacks),
+                return_exceptions=True
+            )
+            for callback, result in zip(callbacks, results):
+                if isinstance(result, BaseException):
+                    _LOGGER.error(f"Event callback {callback} failed: {result}")
 
         except Exception as err:
             _LOGGER.error(f"Event processing failed: {err}")
 
     def register_event_callback(self, callback: Callable):
         """Register event callback."""
-        self._event_callbacks.append(callback)
+        self._event_callbacks.add(callback)
+        if self._available and not self._subscribed:
+            self.hass.async_create_task(self.async_subscribe_events())
 
     def unregister_event_callback(self, callback: Callable):
         """Unregister event callback."""
-        if callback in self._event_callbacks:
-            self._event_callbacks.remove(callback)
+        self._event_callbacks.discard(callback)
 
     # ========== Properties ==========
 
@@ -413,9 +791,9 @@ class OpenIPCOnvifClient:
         return self._available
 
     @property
-    def has_ptz(self) -> bool:
-        """Return True if PTZ is supported."""
-        return self._ptz is not None
+    def has_ptz(self) -> Optional[bool]:
+        """Return True if PTZ is supported, None until probed."""
+        return self._has_ptz
 
     @property
     def presets(self) -> Dict[str, str]:
@@ -435,10 +813,4 @@ class OpenIPCOnvifClient:
     @property
     def stream_uri(self) -> Optional[str]:
         """Get RTSP stream URI."""
-        if not self._media or not self._profile:
-            return None
-
-        try:
-            return self._profile.StreamUri
-        except:
-            return None
\ No newline at end of file
+        return self._stream_uri
\ No newline at end of file
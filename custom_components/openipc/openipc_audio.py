@@ -2,7 +2,10 @@
 import logging
 import subprocess
 import os
+import stat
 from typing import Optional
+
+import aiofiles.os
 from homeassistant.core import HomeAssistant
 
 _LOGGER = logging.getLogger(__name__)
@@ -37,9 +40,16 @@ class OpenIPCAudio:
 
     async def async_play_pcm(self, pcm_file_path: str) -> bool:
         """Play PCM file on OpenIPC camera."""
-        if not os.path.exists(pcm_file_path):
+        # stat через aiofiles, чтобы не блокировать event loop (медиа может быть на сетевом диске)
+        try:
+            file_stat = await aiofiles.os.stat(pcm_file_path)
+        except OSError:
             _LOGGER.error("PCM file not found: %s", pcm_file_path)
             return False
+        
+        if not stat.S_ISREG(file_stat.st_mode) or file_stat.st_size == 0:
+            _LOGGER.error("PCM file is not a regular non-empty file: %s", pcm_file_path)
+            return False
 
         _LOGGER.info("🔊 Playing PCM file on OpenIPC camera: %s", pcm_file_path)
         
@@ -113,8 +123,8 @@ class OpenIPCAudio:
             return await self.async_play_pcm(pcm_path)
             
         finally:
-            if os.path.exists(pcm_path):
-                os.unlink(pcm_path)
+            if await aiofiles.os.path.exists(pcm_path):
+                await aiofiles.os.remove(pcm_path)
 
     def _generate_tts_sync(self, message: str, language: str, output_path: str) -> bool:
         """Synchronous method to generate TTS using gTTS and convert to PCM."""
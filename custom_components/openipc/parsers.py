@@ -5,46 +5,78 @@ import time
 
 _LOGGER = logging.getLogger(__name__)
 
+# Числовые поля parsed-данных с фиксированным порядком колонок: (имя, приведение типа)
+NUMERIC_FIELDS = (
+    ("uptime_seconds", int),
+    ("cpu_temp", float),
+    ("sd_free", float),
+    ("sd_total", float),
+    ("sd_used", float),
+    ("wifi_signal", float),
+    ("fps", float),
+    ("isp_fps", float),
+    ("bitrate", float),
+    ("motion_sensitivity", int),
+    ("mem_total", float),
+    ("mem_free", float),
+    ("mem_available", float),
+    ("network_rx_bytes", int),
+    ("network_tx_bytes", int),
+    ("http_requests", int),
+    ("jpeg_requests", int),
+    ("majestic_cpu_user", float),
+    ("majestic_cpu_system", float),
+)
+
+# Индекс колонки по имени поля
+NUMERIC_COLUMNS = {name: col for col, (name, _) in enumerate(NUMERIC_FIELDS)}
+
+# Поля parsed из секций config.json: (секция, ключ, поле parsed, значение по умолчанию).
+# _ONLY_IF_SET - поле заполняется только если ключ есть в секции
+_ONLY_IF_SET = object()
+_CONFIG_FIELDS = (
+    ("video0", "fps", "fps", _ONLY_IF_SET),
+    ("video0", "bitrate", "bitrate", _ONLY_IF_SET),
+    ("video0", "size", "resolution", _ONLY_IF_SET),
+    ("system", "logLevel", "log_level", _ONLY_IF_SET),
+    ("nightMode", "colorToGray", "night_mode_enabled", False),
+    ("motionDetect", "enabled", "motion_enabled", False),
+    ("motionDetect", "sensitivity", "motion_sensitivity", 0),
+    ("audio", "enabled", "audio_enabled", False),
+    ("audio", "codec", "audio_codec", "unknown"),
+    ("audio", "outputEnabled", "speaker_enabled", False),
+    ("records", "enabled", "recording_enabled", False),
+    ("records", "path", "recording_path", ""),
+)
+
+# Строка таблицы статус-страницы: <tr><th>Поле</th><td>значение</td></tr>
+_STATUS_ROW_RE = re.compile(
+    r'<tr>\s*<th[^>]*>(?P<k>Uptime|CPU Temp|Model|Firmware)\s*</th>\s*<td[^>]*>(?P<v>[^<]+)</td>\s*</tr>',
+    re.IGNORECASE,
+)
+_CPU_TEMP_RE = re.compile(r'([0-9.]+)\s*°C')
+
+# Формат uptime: меньше часа, меньше суток, сутки и больше
+_UPTIME_FORMATS = ("{m}m {s}s", "{h}h {m}m {s}s", "{d}d {h}h {m}m")
+
 def parse_camera_data(config, metrics, status):
     """Parse data from JSON config, Prometheus metrics and HTML status."""
     parsed = {}
     
     # Parse from config
     if config and isinstance(config, dict):
-        if "video0" in config:
-            video = config["video0"]
-            if "fps" in video:
-                parsed["fps"] = video["fps"]
-            if "bitrate" in video:
-                parsed["bitrate"] = video["bitrate"]
-            if "size" in video:
-                parsed["resolution"] = video["size"]
-        
-        if "system" in config:
-            system = config["system"]
-            if "logLevel" in system:
-                parsed["log_level"] = system["logLevel"]
+        for section_name, key, field, default in _CONFIG_FIELDS:
+            section = config.get(section_name)
+            if section is None:
+                continue
+            if key in section:
+                parsed[field] = section[key]
+            elif default is not _ONLY_IF_SET:
+                parsed[field] = default
         
-        if "nightMode" in config:
-            night = config["nightMode"]
-            parsed["night_mode_enabled"] = night.get("colorToGray", False)
+        night = config.get("nightMode")
+        if night is not None:
             parsed["ir_cut_pins"] = f"{night.get('irCutPin1', 'N/A')}/{night.get('irCutPin2', 'N/A')}"
-        
-        if "motionDetect" in config:
-            motion = config["motionDetect"]
-            parsed["motion_enabled"] = motion.get("enabled", False)
-            parsed["motion_sensitivity"] = motion.get("sensitivity", 0)
-        
-        if "audio" in config:
-            audio = config["audio"]
-            parsed["audio_enabled"] = audio.get("enabled", False)
-            parsed["audio_codec"] = audio.get("codec", "unknown")
-            parsed["speaker_enabled"] = audio.get("outputEnabled", False)
-        
-        if "records" in config:
-            records = config["records"]
-            parsed["recording_enabled"] = records.get("enabled", False)
-            parsed["recording_path"] = records.get("path", "")
     
     # Parse from metrics
     if metrics and isinstance(metrics, dict):
@@ -56,6 +88,23 @@ def parse_camera_data(config, metrics, status):
     
     return parsed
 
+def parse_numerics(parsed):
+    """Coerce numeric fields of parsed data into a list laid out by NUMERIC_COLUMNS."""
+    values = [0] * len(NUMERIC_FIELDS)
+    for col, (name, cast) in enumerate(NUMERIC_FIELDS):
+        value = parsed.get(name)
+        if value is None:
+            continue
+        # Метрики уже приходят числами нужного типа - приводим только строки и прочее
+        if type(value) is cast:
+            values[col] = value
+            continue
+        try:
+            values[col] = cast(value)
+        except (ValueError, TypeError):
+            pass
+    return values
+
 def _parse_metrics(parsed, metrics):
     """Parse Prometheus metrics."""
     if "node_hwmon_temp_celsius" in metrics:
@@ -78,17 +127,12 @@ def _parse_metrics(parsed, metrics):
         current_time = time.time()
         uptime_seconds = int(current_time - boot_time)
         
-        days = uptime_seconds // 86400
-        hours = (uptime_seconds % 86400) // 3600
-        minutes = (uptime_seconds % 3600) // 60
-        seconds = uptime_seconds % 60
+        days, rem = divmod(uptime_seconds, 86400)
+        hours, rem = divmod(rem, 3600)
+        minutes, seconds = divmod(rem, 60)
         
-        if days > 0:
-            parsed["uptime"] = f"{days}d {hours}h {minutes}m"
-        elif hours > 0:
-            parsed["uptime"] = f"{hours}h {minutes}m {seconds}s"
-        else:
-            parsed["uptime"] = f"{minutes}m {seconds}s"
+        template = _UPTIME_FORMATS[2 if days > 0 else hours > 0]
+        parsed["uptime"] = template.format(d=days, h=hours, m=minutes, s=seconds)
         
         parsed["uptime_seconds"] = uptime_seconds
     
@@ -124,22 +168,21 @@ def _parse_metrics(parsed, metrics):
 
 def _parse_status(parsed, raw):
     """Parse HTML status page."""
-    if "uptime" not in parsed:
-        uptime_match = re.search(r'<tr>\s*<th[^>]*>Uptime\s*</th>\s*<td[^>]*>([^<]+)</td>\s*</tr>', raw, re.IGNORECASE)
-        if uptime_match:
-            parsed["uptime"] = uptime_match.group(1).strip()
+    # Один проход по HTML, берем первое вхождение каждой строки таблицы
+    found = {}
+    for match in _STATUS_ROW_RE.finditer(raw):
+        found.setdefault(match["k"].lower(), match["v"].strip())
+    
+    if "uptime" not in parsed and "uptime" in found:
+        parsed["uptime"] = found["uptime"]
     
-    if "cpu_temp" not in parsed:
-        temp_match = re.search(r'<tr>\s*<th[^>]*>CPU Temp\s*</th>\s*<td[^>]*>([0-9.]+)\s*°C</td>\s*</tr>', raw, re.IGNORECASE)
+    if "cpu_temp" not in parsed and "cpu temp" in found:
+        temp_match = _CPU_TEMP_RE.fullmatch(found["cpu temp"])
         if temp_match:
             parsed["cpu_temp"] = temp_match.group(1)
     
-    if "model" not in parsed:
-        model_match = re.search(r'<tr>\s*<th[^>]*>Model\s*</th>\s*<td[^>]*>([^<]+)</td>\s*</tr>', raw, re.IGNORECASE)
-        if model_match:
-            parsed["model"] = model_match.group(1).strip()
+    if "model" not in parsed and "model" in found:
+        parsed["model"] = found["model"]
     
-    if "firmware" not in parsed:
-        fw_match = re.search(r'<tr>\s*<th[^>]*>Firmware\s*</th>\s*<td[^>]*>([^<]+)</td>\s*</tr>', raw, re.IGNORECASE)
-        if fw_match:
-            parsed["firmware"] = fw_match.group(1).strip()
\ No newline at end of file
+    if "firmware" not in parsed and "firmware" in found:
+        parsed["firmware"] = found["firmware"]
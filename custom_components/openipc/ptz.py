@@ -9,13 +9,13 @@ from homeassistant.components.button import ButtonEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity import EntityCategory
 
-from .const import DOMAIN, DEVICE_TYPE_VIVOTEK
+from .const import DOMAIN, DATA_COORDINATORS, DEVICE_TYPE_VIVOTEK
 
 _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up PTZ entities."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = hass.data[DOMAIN][DATA_COORDINATORS][entry.entry_id]
     
     if entry.data.get("device_type") != DEVICE_TYPE_VIVOTEK:
         return
@@ -8,13 +8,13 @@ from homeassistant.components.button import ButtonEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity import EntityCategory
 
-from .const import DOMAIN
+from .const import DOMAIN, DATA_COORDINATORS
 
 _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up PTZ entities."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = hass.data[DOMAIN][DATA_COORDINATORS][entry.entry_id]
     
     if not hasattr(coordinator, 'onvif') or not coordinator.onvif:
         _LOGGER.debug("ONVIF not configured")
@@ -26,7 +26,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
     entities.append(OpenIPCPtzSpeedNumber(coordinator, entry))
     
     # PTZ presets select
-    if coordinator.onvif.has_ptz:
+    if await coordinator.onvif.async_probe_ptz():
         entities.append(OpenIPCPresetSelect(coordinator, entry))
         entities.append(OpenIPCPresetSetButton(coordinator, entry))
         entities.append(OpenIPCPresetRefreshButton(coordinator, entry))
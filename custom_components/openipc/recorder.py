@@ -5,6 +5,7 @@ import asyncio
 import aiohttp
 import aiofiles
 import time
+from collections import namedtuple
 from datetime import datetime
 from pathlib import Path
 from homeassistant.core import HomeAssistant
@@ -12,7 +13,10 @@ from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 _LOGGER = logging.getLogger(__name__)
 
-from .const import DOMAIN
+from .const import DOMAIN, DATA_CONFIG
+
+# Запись из папки камеры - поля читаются атрибутами, без словаря на каждый файл
+Recording = namedtuple("Recording", "filename path size created url")
 
 class OpenIPCRecorder:
     """Simplified recorder that uses HA's native recording for video."""
@@ -65,7 +69,7 @@ class OpenIPCRecorder:
 
     def _get_telegram_config(self):
         """Get Telegram configuration from hass.data."""
-        yaml_config = self.hass.data.get(DOMAIN, {}).get("config", {})
+        yaml_config = self.hass.data.get(DOMAIN, {}).get(DATA_CONFIG, {})
         bot_token = yaml_config.get("telegram_bot_token")
         chat_id = yaml_config.get("telegram_chat_id")
         
@@ -194,13 +198,13 @@ class OpenIPCRecorder:
             
             for file in files:
                 stat = file.stat()
-                recordings.append({
-                    "filename": file.name,
-                    "path": str(file),
-                    "size": stat.st_size,
-                    "created": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                    "url": f"/local/openipc_recordings/{self.camera_name}/{file.name}"
-                })
+                recordings.append(Recording(
+                    file.name,
+                    str(file),
+                    stat.st_size,
+                    datetime.fromtimestamp(stat.st_ctime).isoformat(),
+                    f"/local/openipc_recordings/{self.camera_name}/{file.name}",
+                ))
         except Exception as err:
             _LOGGER.error("Error getting recordings list: %s", err)
         
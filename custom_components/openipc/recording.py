@@ -1,13 +1,51 @@
 """Recording functions for OpenIPC cameras."""
 import asyncio
 import logging
+
+import aiohttp
 from datetime import datetime
 from pathlib import Path
 
+from homeassistant.components import persistent_notification
+from homeassistant.util.json import json_loads
+
 from .const import RECORD_START, RECORD_STOP, RECORD_STATUS, RECORD_MANUAL
 
 _LOGGER = logging.getLogger(__name__)
 
+# Варианты endpoint'ов записи у разных прошивок (без повторов, порядок сохранен)
+START_ENDPOINTS = tuple(dict.fromkeys((
+    RECORD_START,
+    "/cgi-bin/record.cgi?action=start",
+    "/api/v1/record?action=start",
+)))
+STOP_ENDPOINTS = tuple(dict.fromkeys((
+    RECORD_STOP,
+    "/cgi-bin/record.cgi?action=stop",
+    "/api/v1/record?action=stop",
+)))
+STATUS_ENDPOINTS = tuple(dict.fromkeys((
+    RECORD_STATUS,
+    "/cgi-bin/record.cgi?action=status",
+    "/api/v1/record/status",
+)))
+
+def _endpoints_for(coordinator, action, endpoints):
+    """Return endpoints with the one that last worked for this action first."""
+    cached = coordinator._recording_endpoints.get(action)
+    if cached is None:
+        return endpoints
+    return (cached, *(endpoint for endpoint in endpoints if endpoint != cached))
+
+async def _async_send_recording_command(coordinator, action, endpoints):
+    """Send a recording command, remembering the endpoint that accepted it."""
+    for endpoint in _endpoints_for(coordinator, action, endpoints):
+        if await coordinator.async_send_command(endpoint):
+            coordinator._recording_endpoints[action] = endpoint
+            return endpoint
+    coordinator._recording_endpoints.pop(action, None)
+    return None
+
 async def start_recording(coordinator):
     """Start recording on camera SD card."""
     if coordinator.is_beward or coordinator.is_vivotek:
@@ -16,17 +54,11 @@ async def start_recording(coordinator):
     
     _LOGGER.info("Starting recording on camera %s", coordinator.host)
     
-    endpoints = [
-        RECORD_START,
-        "/cgi-bin/record.cgi?action=start",
-        "/api/v1/record?action=start",
-    ]
-    
-    for endpoint in endpoints:
-        if await coordinator.async_send_command(endpoint):
-            _LOGGER.info("Recording started via %s", endpoint)
-            coordinator._recording_end_time = None
-            return True
+    endpoint = await _async_send_recording_command(coordinator, "start", START_ENDPOINTS)
+    if endpoint:
+        _LOGGER.info("Recording started via %s", endpoint)
+        coordinator._recording_end_time = None
+        return True
     
     _LOGGER.error("Failed to start recording")
     return False
@@ -39,53 +71,74 @@ async def stop_recording(coordinator):
     
     _LOGGER.info("Stopping recording on camera %s", coordinator.host)
     
-    if coordinator._recording_task:
-        coordinator._recording_task.cancel()
-        coordinator._recording_task = None
-    
-    if coordinator._ha_recording_task and not coordinator._ha_recording_task.done():
-        coordinator._ha_recording_task.cancel()
+    coordinator._swap_cancel("_recording_task")
+    coordinator._swap_cancel("_ha_recording_task")
     
-    endpoints = [
-        RECORD_STOP,
-        "/cgi-bin/record.cgi?action=stop",
-        "/api/v1/record?action=stop",
-    ]
-    
-    for endpoint in endpoints:
-        if await coordinator.async_send_command(endpoint):
-            _LOGGER.info("Recording stopped via %s", endpoint)
-            coordinator._recording_end_time = None
-            return True
+    endpoint = await _async_send_recording_command(coordinator, "stop", STOP_ENDPOINTS)
+    if endpoint:
+        _LOGGER.info("Recording stopped via %s", endpoint)
+        coordinator._recording_end_time = None
+        return True
     
     _LOGGER.error("Failed to stop recording")
     return False
 
+async def _async_fetch_recording_status(coordinator, endpoint):
+    """Query one recording status endpoint, None if it did not answer."""
+    try:
+        url = f"http://{coordinator.host}:{coordinator.port}{endpoint}"
+        async with coordinator.poll_session.get(url, headers=coordinator.headers, timeout=3) as response:
+            if response.status == 200:
+                raw = await response.read()
+                try:
+                    return json_loads(raw)
+                except ValueError:
+                    text = raw.decode(errors="replace")
+                    if "recording" in text.lower():
+                        return {
+                            "recording": "active" in text.lower() or "true" in text.lower(),
+                            "raw": text
+                        }
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+        pass
+    return None
+
+async def _async_probe_recording_status(coordinator, endpoints):
+    """Query status endpoints concurrently, return the first (endpoint, data) answered."""
+    tasks = {
+        asyncio.create_task(_async_fetch_recording_status(coordinator, endpoint)): endpoint
+        for endpoint in endpoints
+    }
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                data = task.result()
+                if data is not None:
+                    return tasks[task], data
+    finally:
+        for task in pending:
+            task.cancel()
+    return None, None
+
 async def get_recording_status(coordinator):
     """Get recording status."""
-    endpoints = [
-        RECORD_STATUS,
-        "/cgi-bin/record.cgi?action=status",
-        "/api/v1/record/status",
-    ]
+    # Сначала опрашиваем endpoint, ответивший в прошлый раз - обычно он и работает
+    cached = coordinator._recording_endpoints.get("status")
+    if cached is not None:
+        data = await _async_fetch_recording_status(coordinator, cached)
+        if data is not None:
+            return data
+        coordinator._recording_endpoints.pop("status", None)
     
-    for endpoint in endpoints:
-        try:
-            url = f"http://{coordinator.host}:{coordinator.port}{endpoint}"
-            async with coordinator.session.get(url, auth=coordinator.auth, timeout=3) as response:
-                if response.status == 200:
-                    try:
-                        data = await response.json()
-                        return data
-                    except:
-                        text = await response.text()
-                        if "recording" in text.lower():
-                            return {
-                                "recording": "active" in text.lower() or "true" in text.lower(),
-                                "raw": text
-                            }
-        except:
-            continue
+    # Остальные варианты опрашиваем одновременно, первый ответивший запоминаем
+    endpoint, data = await _async_probe_recording_status(
+        coordinator, [endpoint for endpoint in STATUS_ENDPOINTS if endpoint != cached]
+    )
+    if endpoint is not None:
+        coordinator._recording_endpoints["status"] = endpoint
+        return data
     
     if coordinator._recording_end_time:
         remaining = coordinator._recording_end_time - coordinator.hass.loop.time()
@@ -158,8 +211,7 @@ async def start_timed_recording(coordinator, duration: int, save_to_ha: bool = T
                  duration, coordinator.host, save_to_ha)
     
     if save_to_ha:
-        if coordinator._ha_recording_task and not coordinator._ha_recording_task.done():
-            coordinator._ha_recording_task.cancel()
+        coordinator._swap_cancel("_ha_recording_task")
         
         coordinator._ha_recording_task = asyncio.create_task(
             record_to_ha_media(coordinator, duration, method)
@@ -196,6 +248,26 @@ async def start_timed_recording(coordinator, duration: int, save_to_ha: bool = T
         
         return False
 
+async def _async_send_recording_to_telegram(coordinator, full_path, caption, chat_id,
+                                            duration: int, file_size: int) -> None:
+    """Upload a finished recording to Telegram and notify about it."""
+    try:
+        telegram_sent = await coordinator.recorder.send_to_telegram(full_path, caption, chat_id)
+    except Exception as err:
+        _LOGGER.error(f"❌ Failed to send {full_path.name} to Telegram: {err}")
+        return
+    
+    if telegram_sent:
+        persistent_notification.async_create(
+            coordinator.hass,
+            f"✅ Запись завершена и отправлена\n"
+            f"📁 {full_path.name}\n"
+            f"⏱ Длительность: {duration} сек\n"
+            f"📊 Размер: {file_size / 1024:.1f} KB",
+            title="📹 Видео отправлено в Telegram",
+            notification_id=f"openipc_telegram_{coordinator.entry.entry_id}",
+        )
+
 async def record_and_send_telegram(coordinator, duration: int, method: str = "snapshots",
                                   caption: str = None, chat_id: str = None) -> dict:
     """Record video and send to Telegram using camera.record service."""
@@ -241,34 +313,17 @@ async def record_and_send_telegram(coordinator, duration: int, method: str = "sn
         file_size = full_path.stat().st_size
         _LOGGER.info(f"✅ File created: {full_path} ({file_size} bytes)")
         
-        # Отправляем в Telegram
-        telegram_sent = False
-        if hasattr(coordinator, 'recorder') and coordinator.recorder:
-            telegram_sent = await coordinator.recorder.send_to_telegram(
-                full_path, 
-                caption, 
-                chat_id
-            )
-        
-        # Показываем уведомление
-        if telegram_sent:
-            await coordinator.hass.services.async_call(
-                "persistent_notification",
-                "create",
-                {
-                    "title": f"📹 Видео отправлено в Telegram",
-                    "message": f"✅ Запись завершена и отправлена\n"
-                              f"📁 {filename}\n"
-                              f"⏱ Длительность: {duration} сек\n"
-                              f"📊 Размер: {file_size / 1024:.1f} KB",
-                    "notification_id": f"openipc_telegram_{coordinator.entry.entry_id}"
-                },
-                blocking=True
-            )
+        # Отправка в Telegram и уведомление идут в фоне - сервис возвращается сразу после записи
+        coordinator.hass.async_create_background_task(
+            _async_send_recording_to_telegram(
+                coordinator, full_path, caption, chat_id, duration, file_size
+            ),
+            f"openipc_telegram_{coordinator.entry.entry_id}",
+        )
         
         return {
             "success": True,
-            "telegram_sent": telegram_sent,
+            "telegram_queued": True,
             "filename": str(filename),
             "filepath": str(full_path),
             "size": file_size,
@@ -4,7 +4,7 @@ from homeassistant.components.select import SelectEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.restore_state import RestoreEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, DATA_COORDINATORS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,7 +27,7 @@ RECORDING_OPTIONS = list(RECORDING_DURATIONS.keys())
 
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up OpenIPC select entities."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = hass.data[DOMAIN][DATA_COORDINATORS][entry.entry_id]
     
     entities = [
         OpenIPCRecordingDurationSelect(coordinator, entry),
@@ -79,11 +79,4 @@ class OpenIPCRecordingDurationSelect(CoordinatorEntity, SelectEntity, RestoreEnt
     @property
     def device_info(self):
         """Return device info."""
-        parsed = self.coordinator.data.get("parsed", {})
-        return {
-            "identifiers": {(DOMAIN, self.entry.entry_id)},
-            "name": self.entry.data.get("name", "OpenIPC Camera"),
-            "manufacturer": "OpenIPC",
-            "model": parsed.get("model", "Camera"),
-            "sw_version": parsed.get("firmware", "Unknown"),
-        }
\ No newline at end of file
+        return self.coordinator.device_info()
\ No newline at end of file
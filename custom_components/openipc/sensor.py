@@ -16,6 +16,7 @@ import aiohttp
 
 from .const import (
     DOMAIN, 
+    DATA_COORDINATORS,
     SENSOR_TYPES,
     BINARY_SENSOR_TYPES,
     CONF_DEVICE_TYPE,
@@ -25,12 +26,23 @@ from .const import (
     LNPR_STATE,
     LNPR_LIST,
 )
+from .parsers import NUMERIC_COLUMNS
 
 _LOGGER = logging.getLogger(__name__)
 
+# Сенсоры, читающие чужую числовую колонку
+_NUMERIC_ALIASES = {"uptime": "uptime_seconds"}
+
+# Группы сенсоров для выбора device class / единиц измерения
+_LNPR_TEXT = frozenset({"lnpr_last_number", "lnpr_last_direction", "lnpr_last_time"})
+_DATA_SIZE_MB = frozenset({"mem_total", "mem_free", "mem_available", "sd_free", "sd_total", "sd_used"})
+_DATA_SIZE_B = frozenset({"network_rx_bytes", "network_tx_bytes"})
+_TOTAL_INCREASING = frozenset({"http_requests", "jpeg_requests"})
+_FPS = frozenset({"fps", "isp_fps"})
+
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up OpenIPC sensors."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = hass.data[DOMAIN][DATA_COORDINATORS][entry.entry_id]
     device_type = entry.data.get(CONF_DEVICE_TYPE, "openipc")
     
     entities = []
@@ -119,9 +131,9 @@ class OpenIPCSensor(CoordinatorEntity, SensorEntity):
     def __init__(self, coordinator, entry, sensor_type, sensor_config):
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self.coordinator = coordinator
         self.entry = entry
         self.sensor_type = sensor_type
+        self._col = NUMERIC_COLUMNS.get(_NUMERIC_ALIASES.get(sensor_type, sensor_type))
         self._attr_name = f"{entry.data.get('name', 'OpenIPC')} {sensor_config['name']}"
         self._attr_unique_id = f"{entry.entry_id}_{sensor_type}"
         self._attr_native_unit_of_measurement = sensor_config.get("unit")
@@ -131,7 +143,7 @@ class OpenIPCSensor(CoordinatorEntity, SensorEntity):
         if sensor_type.startswith("lnpr_"):
             self._attr_entity_category = EntityCategory.DIAGNOSTIC
             self._attr_device_class = None
-            if sensor_type in ["lnpr_last_number", "lnpr_last_direction", "lnpr_last_time"]:
+            if sensor_type in _LNPR_TEXT:
                 self._attr_native_unit_of_measurement = None
             self._attr_state_class = None
         
@@ -145,15 +157,15 @@ class OpenIPCSensor(CoordinatorEntity, SensorEntity):
         elif sensor_type == "uptime_seconds":
             self._attr_device_class = SensorDeviceClass.DURATION
             self._attr_native_unit_of_measurement = UnitOfTime.SECONDS
-        elif sensor_type in ["mem_total", "mem_free", "mem_available", "sd_free", "sd_total", "sd_used"]:
+        elif sensor_type in _DATA_SIZE_MB:
             self._attr_device_class = SensorDeviceClass.DATA_SIZE
             self._attr_native_unit_of_measurement = "MB"
-        elif sensor_type in ["network_rx_bytes", "network_tx_bytes"]:
+        elif sensor_type in _DATA_SIZE_B:
             self._attr_device_class = SensorDeviceClass.DATA_SIZE
             self._attr_native_unit_of_measurement = "B"
-        elif sensor_type in ["http_requests", "jpeg_requests"]:
+        elif sensor_type in _TOTAL_INCREASING:
             self._attr_state_class = "total_increasing"
-        elif sensor_type in ["fps", "isp_fps"]:
+        elif sensor_type in _FPS:
             self._attr_device_class = None
             self._attr_native_unit_of_measurement = "fps"
         elif sensor_type == "bitrate":
@@ -189,154 +201,19 @@ class OpenIPCSensor(CoordinatorEntity, SensorEntity):
             lnpr_data = self.coordinator.data.get("lnpr", {})
             return lnpr_data.get("authorized_count", 0)
         
-        _LOGGER.debug("Sensor %s raw value: %s", self.sensor_type, parsed.get(self.sensor_type))
-        
-        if self.sensor_type == "uptime":
-            value = parsed.get("uptime_seconds", 0)
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                return 0
-            
-        elif self.sensor_type == "uptime_seconds":
-            value = parsed.get("uptime_seconds", 0)
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                return 0
-            
-        elif self.sensor_type == "cpu_temp":
-            value = parsed.get("cpu_temp", 0)
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return 0
-                
-        elif self.sensor_type == "sd_free":
-            value = parsed.get("sd_free", 0)
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return 0
-            
-        elif self.sensor_type == "sd_total":
-            value = parsed.get("sd_total", 0)
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return 0
-            
-        elif self.sensor_type == "sd_used":
-            value = parsed.get("sd_used", 0)
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return 0
+        # Числовые сенсоры - значение уже приведено координатором
+        if self._col is not None:
+            num = self.coordinator.data.get("num")
+            if num is not None:
+                return num[self._col]
+            return 0
             
-        elif self.sensor_type == "wifi_signal":
-            value = parsed.get("wifi_signal", 0)
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return 0
-                
-        elif self.sensor_type == "fps":
-            value = parsed.get("fps", 0)
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return 0
-                
-        elif self.sensor_type == "isp_fps":
-            value = parsed.get("isp_fps", 0)
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return 0
-                
-        elif self.sensor_type == "bitrate":
-            value = parsed.get("bitrate", 0)
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return 0
-                
-        elif self.sensor_type == "resolution":
+        if self.sensor_type == "resolution":
             return parsed.get("resolution", "unknown")
             
         elif self.sensor_type == "audio_codec":
             return parsed.get("audio_codec", "unknown")
             
-        elif self.sensor_type == "motion_sensitivity":
-            value = parsed.get("motion_sensitivity", 0)
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                return 0
-                
-        elif self.sensor_type == "mem_total":
-            value = parsed.get("mem_total", 0)
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return 0
-                
-        elif self.sensor_type == "mem_free":
-            value = parsed.get("mem_free", 0)
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return 0
-                
-        elif self.sensor_type == "mem_available":
-            value = parsed.get("mem_available", 0)
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return 0
-                
-        elif self.sensor_type == "network_rx_bytes":
-            value = parsed.get("network_rx_bytes", 0)
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                return 0
-                
-        elif self.sensor_type == "network_tx_bytes":
-            value = parsed.get("network_tx_bytes", 0)
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                return 0
-                
-        elif self.sensor_type == "http_requests":
-            value = parsed.get("http_requests", 0)
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                return 0
-                
-        elif self.sensor_type == "jpeg_requests":
-            value = parsed.get("jpeg_requests", 0)
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                return 0
-                
-        elif self.sensor_type == "majestic_cpu_user":
-            value = parsed.get("majestic_cpu_user", 0)
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return 0
-                
-        elif self.sensor_type == "majestic_cpu_system":
-            value = parsed.get("majestic_cpu_system", 0)
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return 0
-                
         elif self.sensor_type == "hostname":
             return parsed.get("hostname", "unknown")
             
@@ -8,13 +8,13 @@ from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, Upda
 from homeassistant.helpers.entity import DeviceInfo
 import aiohttp
 
-from .const import DOMAIN
+from .const import DOMAIN, DATA_COORDINATORS
 
 _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up QR scanner sensor."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = hass.data[DOMAIN][DATA_COORDINATORS][entry.entry_id]
     
     # Проверяем, есть ли аддон
     if coordinator.use_addon and coordinator.addon.available:
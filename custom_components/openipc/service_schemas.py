@@ -5,6 +5,15 @@ from homeassistant.helpers import config_validation as cv
 
 from .const import OSD_POSITIONS, OSD_COLORS, DEFAULT_OSD_TEMPLATE
 
+# Допустимые значения вычисляем один раз при импорте
+OSD_POSITION_KEYS = frozenset(OSD_POSITIONS)
+OSD_COLOR_KEYS = frozenset(OSD_COLORS)
+IR_MODES = frozenset(("0", "1", "2"))
+RECORDING_METHODS = frozenset(("snapshots", "rtsp"))
+
+# Длительность записи в секундах
+RECORDING_DURATION = vol.All(vol.Coerce(int), vol.Range(min=1, max=3600))
+
 # Basic schemas
 PLAY_AUDIO_SCHEMA = vol.Schema({
     vol.Required(CONF_ENTITY_ID): cv.entity_id,
@@ -23,26 +32,26 @@ REBOOT_SCHEMA = vol.Schema({
 
 SET_IR_MODE_SCHEMA = vol.Schema({
     vol.Required(CONF_ENTITY_ID): cv.entity_id,
-    vol.Required("mode"): vol.In(["0", "1", "2"]),
+    vol.Required("mode"): vol.In(IR_MODES),
 })
 
 # Recording schemas
 START_RECORDING_SCHEMA = vol.Schema({
-    vol.Required(CONF_ENTITY_ID): cv.entity_id,
-    vol.Optional("duration"): vol.Coerce(int),
+    vol.Required(CONF_ENTITY_ID): cv.entity_ids,
+    vol.Optional("duration"): RECORDING_DURATION,
     vol.Optional("save_to_ha", default=True): cv.boolean,
-    vol.Optional("method", default="snapshots"): vol.In(["snapshots", "rtsp"]),
+    vol.Optional("method", default="snapshots"): vol.In(RECORDING_METHODS),
 })
 
 STOP_RECORDING_SCHEMA = vol.Schema({
-    vol.Required(CONF_ENTITY_ID): cv.entity_id,
+    vol.Required(CONF_ENTITY_ID): cv.entity_ids,
 })
 
 TIMED_RECORDING_SCHEMA = vol.Schema({
-    vol.Required(CONF_ENTITY_ID): cv.entity_id,
-    vol.Required("duration"): vol.Coerce(int),
+    vol.Required(CONF_ENTITY_ID): cv.entity_ids,
+    vol.Required("duration"): RECORDING_DURATION,
     vol.Optional("save_to_ha", default=True): cv.boolean,
-    vol.Optional("method", default="snapshots"): vol.In(["snapshots", "rtsp"]),
+    vol.Optional("method", default="snapshots"): vol.In(RECORDING_METHODS),
 })
 
 GET_RECORDINGS_SCHEMA = vol.Schema({
@@ -56,9 +65,9 @@ DELETE_RECORDING_SCHEMA = vol.Schema({
 })
 
 RECORD_AND_SEND_TELEGRAM_SCHEMA = vol.Schema({
-    vol.Required(CONF_ENTITY_ID): cv.entity_id,
-    vol.Required("duration"): vol.Coerce(int),
-    vol.Optional("method", default="snapshots"): vol.In(["snapshots", "rtsp"]),
+    vol.Required(CONF_ENTITY_ID): cv.entity_ids,
+    vol.Required("duration"): RECORDING_DURATION,
+    vol.Optional("method", default="snapshots"): vol.In(RECORDING_METHODS),
     vol.Optional("caption"): cv.string,
     vol.Optional("chat_id"): cv.string,
 })
@@ -93,12 +102,12 @@ GET_VIDEO_THUMBNAIL_SCHEMA = vol.Schema({
 
 # OSD recording schema
 RECORD_WITH_OSD_SCHEMA = vol.Schema({
-    vol.Required(CONF_ENTITY_ID): cv.entity_id,
-    vol.Required("duration"): vol.Coerce(int),
+    vol.Required(CONF_ENTITY_ID): cv.entity_ids,
+    vol.Required("duration"): RECORDING_DURATION,
     vol.Optional("template", default=DEFAULT_OSD_TEMPLATE): cv.string,
-    vol.Optional("position", default="top_left"): vol.In(OSD_POSITIONS.keys()),
+    vol.Optional("position", default="top_left"): vol.In(OSD_POSITION_KEYS),
     vol.Optional("font_size", default=24): vol.Coerce(int),
-    vol.Optional("color", default="white"): vol.In(OSD_COLORS.keys()),
+    vol.Optional("color", default="white"): vol.In(OSD_COLOR_KEYS),
     vol.Optional("send_telegram", default=False): cv.boolean,
 })
 
@@ -241,4 +250,51 @@ OSD_UPLOAD_IMAGE_SCHEMA = vol.Schema({
 
 OSD_GET_CONFIG_SCHEMA = vol.Schema({
     vol.Required(CONF_ENTITY_ID): cv.entity_id,
-})
\ No newline at end of file
+})
+
+# Схема для каждого сервиса (None - без валидации)
+SERVICE_SCHEMAS = {
+    "play_audio": PLAY_AUDIO_SCHEMA,
+    "test_audio": TEST_AUDIO_SCHEMA,
+    "reboot": REBOOT_SCHEMA,
+    "set_ir_mode": SET_IR_MODE_SCHEMA,
+    "scan_devices": SCAN_DEVICES_SCHEMA,
+    "start_recording": START_RECORDING_SCHEMA,
+    "stop_recording": STOP_RECORDING_SCHEMA,
+    "timed_recording": TIMED_RECORDING_SCHEMA,
+    "get_recordings": GET_RECORDINGS_SCHEMA,
+    "delete_recording": DELETE_RECORDING_SCHEMA,
+    "record_and_send_telegram": RECORD_AND_SEND_TELEGRAM_SCHEMA,
+    "diagnose_rtsp": DIAGNOSE_RTSP_SCHEMA,
+    "diagnose_telegram": DIAGNOSE_TELEGRAM_SCHEMA,
+    "test_telegram": TEST_TELEGRAM_SCHEMA,
+    "get_recordings_stats": GET_RECORDINGS_STATS_SCHEMA,
+    "delete_all_recordings": DELETE_ALL_RECORDINGS_SCHEMA,
+    "get_video_thumbnail": GET_VIDEO_THUMBNAIL_SCHEMA,
+    "record_with_osd": RECORD_WITH_OSD_SCHEMA,
+    "list_fonts": None,
+    "beward_open_door": BEWARD_OPEN_DOOR_SCHEMA,
+    "beward_play_beep": BEWARD_PLAY_BEEP_SCHEMA,
+    "beward_play_ringtone": BEWARD_PLAY_RINGTONE_SCHEMA,
+    "beward_enable_audio": BEWARD_ENABLE_AUDIO_SCHEMA,
+    "beward_test": BEWARD_TEST_SCHEMA,
+    "lnpr_get_list": LNPR_GET_LIST_SCHEMA,
+    "lnpr_add_plate": LNPR_ADD_PLATE_SCHEMA,
+    "lnpr_delete_plate": LNPR_DELETE_PLATE_SCHEMA,
+    "lnpr_export_events": LNPR_EXPORT_EVENTS_SCHEMA,
+    "lnpr_clear_events": LNPR_CLEAR_EVENTS_SCHEMA,
+    "lnpr_clear_list": LNPR_CLEAR_LIST_SCHEMA,
+    "lnpr_get_picture": LNPR_GET_PICTURE_SCHEMA,
+    "ptz_move": PTZ_MOVE_SCHEMA,
+    "ptz_goto_preset": PTZ_GOTO_PRESET_SCHEMA,
+    "ptz_set_preset": PTZ_SET_PRESET_SCHEMA,
+    "qr_scan": QR_SCAN_SCHEMA,
+    "qr_set_mode": QR_SET_MODE_SCHEMA,
+    "qr_stop": QR_STOP_SCHEMA,
+    "start_qr_scan": START_QR_SCAN_SCHEMA,
+    "osd_set_text": OSD_SET_TEXT_SCHEMA,
+    "osd_clear": OSD_CLEAR_SCHEMA,
+    "osd_set_time_format": OSD_SET_TIME_FORMAT_SCHEMA,
+    "osd_upload_image": OSD_UPLOAD_IMAGE_SCHEMA,
+    "osd_get_config": OSD_GET_CONFIG_SCHEMA,
+}
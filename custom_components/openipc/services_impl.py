@@ -1,25 +1,25 @@
 """Service implementations for OpenIPC integration."""
+from homeassistant.components import persistent_notification
 from homeassistant.core import ServiceCall, HomeAssistant
 import logging
-import aiohttp
 import os
 import time
 import asyncio
 from pathlib import Path
 from datetime import datetime
 
-from homeassistant.const import CONF_ENTITY_ID
-
 from .const import (
     DOMAIN,
+    DATA_LAST_SCAN,
+    DISCOVERY_CACHE_TTL,
     DEFAULT_OSD_TEMPLATE,
     DEFAULT_OSD_POSITION,
     DEFAULT_OSD_FONT_SIZE,
     DEFAULT_OSD_COLOR,
-    OSD_POSITIONS,
-    OSD_COLORS,
 )
 from .helpers import (
+    extract_entity_id,
+    extract_entity_ids,
     find_coordinator_by_entity_id,
     find_media_player,
     find_button,
@@ -28,11 +28,26 @@ from .helpers import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_MB = 1 << 20
+_DOT_TO_UNDERSCORE = str.maketrans(".", "_")
+_DBG_BORDER = "=" * 60
+
+async def _async_for_each_entity(service: str, handler, entity_ids: list, *args) -> None:
+    """Run handler(*args, entity_id) for every camera concurrently."""
+    # Ошибка одной камеры не отменяет остальные, но и не теряется молча
+    results = await asyncio.gather(
+        *(handler(*args, entity_id) for entity_id in entity_ids),
+        return_exceptions=True,
+    )
+    for entity_id, result in zip(entity_ids, results):
+        if isinstance(result, Exception):
+            _LOGGER.error("❌ %s failed for %s: %s", service, entity_id, result)
+
 # ==================== Basic Services ====================
 
 async def async_play_audio(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle play audio service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_id = extract_entity_id(call)
     media_id = call.data.get("media_id", "beep")
     
     entity = await find_media_player(hass, entity_id)
@@ -44,7 +59,7 @@ async def async_play_audio(call: ServiceCall, hass: HomeAssistant) -> None:
 
 async def async_test_audio(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle test audio service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_id = extract_entity_id(call)
     
     entity = await find_media_player(hass, entity_id)
     if entity:
@@ -55,7 +70,7 @@ async def async_test_audio(call: ServiceCall, hass: HomeAssistant) -> None:
 
 async def async_reboot(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle reboot service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_id = extract_entity_id(call)
     
     entity = await find_button(hass, entity_id)
     if entity:
@@ -66,7 +81,7 @@ async def async_reboot(call: ServiceCall, hass: HomeAssistant) -> None:
 
 async def async_set_ir_mode(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle set IR mode service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_id = extract_entity_id(call)
     mode = call.data["mode"]
     
     entity = await find_switch(hass, entity_id)
@@ -83,37 +98,45 @@ async def async_set_ir_mode(call: ServiceCall, hass: HomeAssistant) -> None:
     else:
         _LOGGER.error("Switch entity %s not found", entity_id)
 
+def _format_discovered_device(device: dict) -> str:
+    """Format one discovered camera for the scan notification."""
+    mac = device.get('mac')
+    verified_by = device.get('verified_by')
+    return (
+        f"📍 **{device.get('name', 'OpenIPC Camera')}**\n"
+        f"   IP: {device['ip']}\n"
+        f"   Port: {device.get('port', 80)}\n"
+        f"   Source: {device.get('source', 'unknown')}\n"
+        + (f"   MAC: {mac}\n" if mac else "")
+        + (f"   Verified: {verified_by}\n" if verified_by else "")
+        + "\n"
+    )
+
 async def async_scan_devices(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle scan devices service."""
     try:
-        from .discovery import OpenICPCDiscovery
-        discovery = OpenICPCDiscovery(hass)
-        devices = await discovery.discover_all()
+        domain_data = hass.data.setdefault(DOMAIN, {})
+        last_scan = domain_data.get(DATA_LAST_SCAN)
+        if last_scan and time.monotonic() - last_scan[0] < DISCOVERY_CACHE_TTL:
+            # Частые повторные вызовы (ретраи из UI) не гоняют сканирование сети заново
+            devices = last_scan[1]
+        else:
+            from .discovery import async_get_discovery
+            devices = await async_get_discovery(hass).discover_all()
+            domain_data[DATA_LAST_SCAN] = (time.monotonic(), devices)
         
         if devices:
-            message = f"Found {len(devices)} OpenIPC camera(s):\n\n"
-            for device in devices:
-                message += f"📍 **{device.get('name', 'OpenIPC Camera')}**\n"
-                message += f"   IP: {device['ip']}\n"
-                message += f"   Port: {device.get('port', 80)}\n"
-                message += f"   Source: {device.get('source', 'unknown')}\n"
-                if device.get('mac'):
-                    message += f"   MAC: {device['mac']}\n"
-                if device.get('verified_by'):
-                    message += f"   Verified: {device['verified_by']}\n"
-                message += "\n"
+            message = f"Found {len(devices)} OpenIPC camera(s):\n\n" + "".join(
+                _format_discovered_device(device) for device in devices
+            )
         else:
             message = "No OpenIPC cameras found on the network"
         
-        await hass.services.async_call(
-            "persistent_notification",
-            "create",
-            {
-                "title": "OpenIPC Discovery Results",
-                "message": message,
-                "notification_id": "openipc_discovery"
-            },
-            blocking=True
+        persistent_notification.async_create(
+            hass,
+            message,
+            title="OpenIPC Discovery Results",
+            notification_id="openipc_discovery",
         )
     except Exception as err:
         _LOGGER.error("Scan devices error: %s", err)
@@ -122,25 +145,32 @@ async def async_scan_devices(call: ServiceCall, hass: HomeAssistant) -> None:
 
 async def async_start_recording(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle start recording service using HA's native recording."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_ids = extract_entity_ids(call)
+    if not entity_ids:
+        _LOGGER.error("No entity_id provided")
+        return
+    
+    # Несколько камер записываются параллельно
+    await _async_for_each_entity("start_recording", _async_start_recording, entity_ids, call, hass)
+
+async def _async_start_recording(call: ServiceCall, hass: HomeAssistant, entity_id: str) -> None:
+    """Start recording on a single camera."""
     duration = call.data.get("duration")
     filename = call.data.get("filename")
     save_to_ha = call.data.get("save_to_ha", True)
-    
-    if not entity_id:
-        _LOGGER.error("No entity_id provided")
-        return
+    coordinator = None
     
     _LOGGER.info(f"🎥 Starting recording on {entity_id} via HA native recorder")
     
     if not filename and save_to_ha:
-        camera_name = entity_id.replace("camera.", "").replace(".", "_")
+        camera_name = entity_id.replace("camera.", "").translate(_DOT_TO_UNDERSCORE)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         coordinator = await find_coordinator_by_entity_id(hass, entity_id)
-        if coordinator and hasattr(coordinator, 'recorder'):
-            await coordinator.recorder.ensure_folder_exists()
-            folder = coordinator.recorder.record_folder
+        if coordinator:
+            recorder = coordinator.recorder
+            await recorder.ensure_folder_exists()
+            folder = recorder.record_folder
             filename = f"{folder}/{camera_name}_{timestamp}.mp4"
         else:
             filename = f"/config/media/openipc_recordings/{camera_name}/{camera_name}_{timestamp}.mp4"
@@ -164,7 +194,7 @@ async def async_start_recording(call: ServiceCall, hass: HomeAssistant) -> None:
         )
         _LOGGER.info(f"✅ Recording started via HA native recorder: {filename}")
         
-        if coordinator and hasattr(coordinator, 'recorder'):
+        if coordinator:
             coordinator.recorder._current_recording = {
                 "filename": filename.split('/')[-1] if filename else None,
                 "filepath": filename,
@@ -178,12 +208,15 @@ async def async_start_recording(call: ServiceCall, hass: HomeAssistant) -> None:
 
 async def async_stop_recording(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle stop recording service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
-    
-    if not entity_id:
+    entity_ids = extract_entity_ids(call)
+    if not entity_ids:
         _LOGGER.error("No entity_id provided")
         return
     
+    await _async_for_each_entity("stop_recording", _async_stop_recording, entity_ids, hass)
+
+async def _async_stop_recording(hass: HomeAssistant, entity_id: str) -> None:
+    """Stop recording on a single camera."""
     _LOGGER.info(f"⏹️ Stopping recording on {entity_id}")
     
     try:
@@ -204,24 +237,29 @@ async def async_stop_recording(call: ServiceCall, hass: HomeAssistant) -> None:
 
 async def async_timed_recording(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle timed recording service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
-    duration = call.data["duration"]
-    filename = call.data.get("filename")
-    
-    if not entity_id:
+    entity_ids = extract_entity_ids(call)
+    if not entity_ids:
         _LOGGER.error("No entity_id provided")
         return
     
+    await _async_for_each_entity("timed_recording", _async_timed_recording, entity_ids, call, hass)
+
+async def _async_timed_recording(call: ServiceCall, hass: HomeAssistant, entity_id: str) -> None:
+    """Start a timed recording on a single camera."""
+    duration = call.data["duration"]
+    filename = call.data.get("filename")
+    
     _LOGGER.info(f"🎥 Starting timed recording on {entity_id} for {duration}s")
     
     if not filename:
-        camera_name = entity_id.replace("camera.", "").replace(".", "_")
+        camera_name = entity_id.replace("camera.", "").translate(_DOT_TO_UNDERSCORE)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         coordinator = await find_coordinator_by_entity_id(hass, entity_id)
-        if coordinator and hasattr(coordinator, 'recorder'):
-            await coordinator.recorder.ensure_folder_exists()
-            folder = coordinator.recorder.record_folder
+        if coordinator:
+            recorder = coordinator.recorder
+            await recorder.ensure_folder_exists()
+            folder = recorder.record_folder
             filename = f"{folder}/{camera_name}_{timestamp}_{duration}s.mp4"
         else:
             filename = f"/config/media/openipc_recordings/{camera_name}/{camera_name}_{timestamp}_{duration}s.mp4"
@@ -248,43 +286,42 @@ async def async_timed_recording(call: ServiceCall, hass: HomeAssistant) -> None:
 
 async def async_get_recordings(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle get recordings service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_id = extract_entity_id(call)
     limit = call.data.get("limit", 20)
     
     coordinator = await find_coordinator_by_entity_id(hass, entity_id)
-    if coordinator and hasattr(coordinator, 'recorder'):
-        recordings = await coordinator.recorder.get_recordings_list(limit)
+    if coordinator:
+        recorder = coordinator.recorder
+        recordings = await recorder.get_recordings_list(limit)
         
         if recordings:
-            message = f"📹 **Recordings for {coordinator.recorder.camera_name}**\n\n"
-            for rec in recordings[:10]:
-                size_mb = rec['size'] / 1024 / 1024
-                message += f"• {rec['filename']}\n"
-                message += f"  📊 {size_mb:.1f} MB\n"
-                message += f"  📅 {rec['created']}\n\n"
+            parts = [f"📹 **Recordings for {recorder.camera_name}**\n\n"]
+            parts.extend(
+                f"• {rec.filename}\n"
+                f"  📊 {rec.size / _MB:.1f} MB\n"
+                f"  📅 {rec.created}\n\n"
+                for rec in recordings[:10]
+            )
+            message = "".join(parts)
         else:
             message = "No recordings found"
         
-        await hass.services.async_call(
-            "persistent_notification",
-            "create",
-            {
-                "title": f"OpenIPC Recordings",
-                "message": message,
-                "notification_id": f"openipc_recordings_{coordinator.entry.entry_id}"
-            },
-            blocking=True
+        persistent_notification.async_create(
+            hass,
+            message,
+            title=f"OpenIPC Recordings",
+            notification_id=f"openipc_recordings_{coordinator.entry.entry_id}",
         )
     else:
         _LOGGER.error("Coordinator or recorder not found for entity %s", entity_id)
 
 async def async_delete_recording(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle delete recording service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_id = extract_entity_id(call)
     filename = call.data["filename"]
     
     coordinator = await find_coordinator_by_entity_id(hass, entity_id)
-    if coordinator and hasattr(coordinator, 'recorder'):
+    if coordinator:
         success = await coordinator.recorder.delete_recording(filename)
         if success:
             _LOGGER.info("Deleted recording %s", filename)
@@ -295,24 +332,31 @@ async def async_delete_recording(call: ServiceCall, hass: HomeAssistant) -> None
 
 async def async_record_and_send_telegram(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle record and send to Telegram service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_ids = extract_entity_ids(call)
+    if not entity_ids:
+        _LOGGER.error("No entity_id provided")
+        return
+    
+    await _async_for_each_entity(
+        "record_and_send_telegram", _async_record_and_send_telegram, entity_ids, call, hass
+    )
+
+async def _async_record_and_send_telegram(call: ServiceCall, hass: HomeAssistant, entity_id: str) -> None:
+    """Record a clip on a single camera and send it to Telegram."""
     duration = call.data["duration"]
     caption = call.data.get("caption")
     chat_id = call.data.get("chat_id")
     
-    if not entity_id:
-        _LOGGER.error("No entity_id provided")
-        return
-    
     _LOGGER.info(f"📹 Recording and sending to Telegram for {duration}s")
     
-    camera_name = entity_id.replace("camera.", "").replace(".", "_")
+    camera_name = entity_id.replace("camera.", "").translate(_DOT_TO_UNDERSCORE)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
     coordinator = await find_coordinator_by_entity_id(hass, entity_id)
-    if coordinator and hasattr(coordinator, 'recorder'):
-        await coordinator.recorder.ensure_folder_exists()
-        folder = coordinator.recorder.record_folder
+    if coordinator:
+        recorder = coordinator.recorder
+        await recorder.ensure_folder_exists()
+        folder = recorder.record_folder
         filename = f"{folder}/{camera_name}_{timestamp}_{duration}s.mp4"
     else:
         filename = f"/config/media/openipc_recordings/{camera_name}/{camera_name}_{timestamp}_{duration}s.mp4"
@@ -333,22 +377,18 @@ async def async_record_and_send_telegram(call: ServiceCall, hass: HomeAssistant)
         
         filepath = Path(filename)
         if filepath.exists():
-            if coordinator and hasattr(coordinator, 'recorder'):
-                success = await coordinator.recorder.send_to_telegram(filepath, caption, chat_id)
+            if coordinator:
+                success = await recorder.send_to_telegram(filepath, caption, chat_id)
                 if success:
                     _LOGGER.info(f"✅ Video recorded and sent to Telegram")
                     
-                    await hass.services.async_call(
-                        "persistent_notification",
-                        "create",
-                        {
-                            "title": f"📹 Видео отправлено",
-                            "message": f"✅ Видео успешно записано и отправлено в Telegram\n"
-                                      f"📁 {filepath.name}\n"
-                                      f"⏱ Длительность: {duration} сек",
-                            "notification_id": f"openipc_telegram_{coordinator.entry.entry_id}"
-                        },
-                        blocking=True
+                    persistent_notification.async_create(
+                        hass,
+                        f"✅ Видео успешно записано и отправлено в Telegram\n"
+                        f"📁 {filepath.name}\n"
+                        f"⏱ Длительность: {duration} сек",
+                        title=f"📹 Видео отправлено",
+                        notification_id=f"openipc_telegram_{coordinator.entry.entry_id}",
                     )
                 else:
                     _LOGGER.warning(f"⚠️ Video recorded but failed to send to Telegram")
@@ -364,31 +404,31 @@ async def async_record_and_send_telegram(call: ServiceCall, hass: HomeAssistant)
 
 async def async_diagnose_rtsp(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle diagnose RTSP service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_id = extract_entity_id(call)
     
     coordinator = await find_coordinator_by_entity_id(hass, entity_id)
-    if coordinator and hasattr(coordinator, 'recorder'):
+    if coordinator:
         await coordinator.async_diagnose_rtsp()
     else:
         _LOGGER.error("Coordinator not found for entity %s", entity_id)
 
 async def async_diagnose_telegram(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle diagnose Telegram service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_id = extract_entity_id(call)
     
     coordinator = await find_coordinator_by_entity_id(hass, entity_id)
-    if coordinator and hasattr(coordinator, 'recorder'):
+    if coordinator:
         await coordinator.async_diagnose_telegram()
     else:
         _LOGGER.error("Coordinator not found for entity %s", entity_id)
 
 async def async_test_telegram(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle test Telegram service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_id = extract_entity_id(call)
     chat_id = call.data.get("chat_id")
     
     coordinator = await find_coordinator_by_entity_id(hass, entity_id)
-    if coordinator and hasattr(coordinator, 'recorder'):
+    if coordinator:
         await coordinator.async_test_telegram(chat_id)
     else:
         _LOGGER.error("Coordinator not found for entity %s", entity_id)
@@ -397,67 +437,69 @@ async def async_test_telegram(call: ServiceCall, hass: HomeAssistant) -> None:
 
 async def async_get_recordings_stats(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle get recordings statistics service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_id = extract_entity_id(call)
     
     coordinator = await find_coordinator_by_entity_id(hass, entity_id)
-    if coordinator and hasattr(coordinator, 'recorder'):
-        stats = await coordinator.recorder.get_recordings_stats()
+    if coordinator:
+        recorder = coordinator.recorder
+        stats = await recorder.get_recordings_stats()
         
-        message = f"📊 **Recordings Statistics for {coordinator.recorder.camera_name}**\n\n"
-        message += f"**Total recordings:** {stats['count']}\n"
-        message += f"**Total size:** {stats['total_size_mb']:.1f} MB\n"
+        lines = [
+            f"📊 **Recordings Statistics for {recorder.camera_name}**",
+            "",
+            f"**Total recordings:** {stats['count']}",
+            f"**Total size:** {stats['total_size_mb']:.1f} MB",
+        ]
         if stats['oldest']:
-            message += f"**Oldest:** {stats['oldest']}\n"
+            lines.append(f"**Oldest:** {stats['oldest']}")
         if stats['newest']:
-            message += f"**Newest:** {stats['newest']}\n"
+            lines.append(f"**Newest:** {stats['newest']}")
         
         if stats['by_date']:
-            message += "\n**By date:**\n"
-            for date, data in sorted(stats['by_date'].items()):
-                message += f"• {date}: {data['count']} files ({data['size_mb']:.1f} MB)\n"
+            lines.append("")
+            lines.append("**By date:**")
+            lines.extend(
+                f"• {date}: {data['count']} files ({data['size_mb']:.1f} MB)"
+                for date, data in sorted(stats['by_date'].items())
+            )
+        lines.append("")
+        message = "\n".join(lines)
         
-        await hass.services.async_call(
-            "persistent_notification",
-            "create",
-            {
-                "title": "Recordings Statistics",
-                "message": message,
-                "notification_id": f"openipc_stats_{coordinator.entry.entry_id}"
-            },
-            blocking=True
+        persistent_notification.async_create(
+            hass,
+            message,
+            title="Recordings Statistics",
+            notification_id=f"openipc_stats_{coordinator.entry.entry_id}",
         )
     else:
         _LOGGER.error("Coordinator not found for entity %s", entity_id)
 
 async def async_delete_all_recordings(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle delete all recordings service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_id = extract_entity_id(call)
     
     coordinator = await find_coordinator_by_entity_id(hass, entity_id)
-    if coordinator and hasattr(coordinator, 'recorder'):
-        success = await coordinator.recorder.delete_all_recordings()
+    if coordinator:
+        recorder = coordinator.recorder
+        success = await recorder.delete_all_recordings()
         
         if success:
-            await hass.services.async_call(
-                "persistent_notification",
-                "create",
-                {
-                    "title": "Recordings Deleted",
-                    "message": f"✅ All recordings for {coordinator.recorder.camera_name} have been deleted.",
-                    "notification_id": f"openipc_delete_{coordinator.entry.entry_id}"
-                },
-                blocking=True
+            persistent_notification.async_create(
+                hass,
+                f"✅ All recordings for {recorder.camera_name} have been deleted.",
+                title="Recordings Deleted",
+                notification_id=f"openipc_delete_{coordinator.entry.entry_id}",
             )
     else:
         _LOGGER.error("Coordinator not found for entity %s", entity_id)
 
 async def async_get_video_thumbnail(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle get video thumbnail service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_id = extract_entity_id(call)
     filename = call.data["filename"]
     
     coordinator = await find_coordinator_by_entity_id(hass, entity_id)
-    if coordinator and hasattr(coordinator, 'recorder'):
+    if coordinator:
         thumbnail = await coordinator.recorder.get_video_thumbnail(filename)
         if thumbnail:
             _LOGGER.info("Thumbnail created for %s", filename)
@@ -468,44 +510,37 @@ async def async_get_video_thumbnail(call: ServiceCall, hass: HomeAssistant) -> N
 
 async def async_record_with_osd(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle record with OSD service."""
-    _LOGGER.debug("=" * 60)
+    _LOGGER.debug(_DBG_BORDER)
     _LOGGER.debug("📹 RECORD WITH OSD CALLED")
     _LOGGER.debug("Call data: %s", call.data)
     
-    entity_id = call.data.get(CONF_ENTITY_ID)
-    duration = call.data.get("duration")
+    entity_ids = extract_entity_ids(call)
+    if not entity_ids:
+        _LOGGER.error("❌ No entity_id provided for record_with_osd service")
+        return
+    
+    await _async_for_each_entity("record_with_osd", _async_record_with_osd, entity_ids, call, hass)
+    
+    _LOGGER.debug(_DBG_BORDER)
+
+async def _async_record_with_osd(call: ServiceCall, hass: HomeAssistant, entity_id: str) -> None:
+    """Record video with OSD on a single camera."""
+    duration = call.data["duration"]
     template = call.data.get("template", DEFAULT_OSD_TEMPLATE)
     position = call.data.get("position", DEFAULT_OSD_POSITION)
     font_size = call.data.get("font_size", DEFAULT_OSD_FONT_SIZE)
     color = call.data.get("color", DEFAULT_OSD_COLOR)
     send_telegram = call.data.get("send_telegram", False)
     
-    if not entity_id:
-        _LOGGER.error("❌ No entity_id provided for record_with_osd service")
-        return
-    
-    if not duration:
-        _LOGGER.error("No duration provided for record_with_osd service")
-        return
-    
-    try:
-        duration = int(duration)
-    except (ValueError, TypeError):
-        _LOGGER.error("Invalid duration value: %s", duration)
-        return
-    
     coordinator = await find_coordinator_by_entity_id(hass, entity_id)
     
     if not coordinator:
         _LOGGER.error("❌ No camera found with entity_id: %s", entity_id)
         return
         
-    if not hasattr(coordinator, 'recorder'):
-        _LOGGER.error("❌ Coordinator has no recorder for %s", entity_id)
-        return
-    
+    recorder = coordinator.recorder
     _LOGGER.info("✅ Using camera - Name: %s, Host: %s", 
-                coordinator.recorder.camera_name, coordinator.host)
+                recorder.camera_name, coordinator.host)
     
     osd_config = {
         "template": template,
@@ -515,13 +550,13 @@ async def async_record_with_osd(call: ServiceCall, hass: HomeAssistant) -> None:
         "bg_color": "black@0.5",
     }
     
-    camera_name = entity_id.replace("camera.", "").replace(".", "_")
+    camera_name = entity_id.replace("camera.", "").translate(_DOT_TO_UNDERSCORE)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{coordinator.recorder.record_folder}/{camera_name}_{timestamp}_{duration}s.mp4"
+    filename = f"{recorder.record_folder}/{camera_name}_{timestamp}_{duration}s.mp4"
     
     try:
         if coordinator.osd_manager and coordinator.osd_manager.available:
-            _LOGGER.info(f"🎯 OSD would be set on camera: {template}")
+            _LOGGER.info("🎯 OSD would be set on camera: %s", template)
         
         await hass.services.async_call(
             "camera",
@@ -541,13 +576,13 @@ async def async_record_with_osd(call: ServiceCall, hass: HomeAssistant) -> None:
             "filepath": filename,
             "filename": Path(filename).name,
             "duration": duration,
-            "camera": coordinator.recorder.camera_name,
+            "camera": recorder.camera_name,
         }
         
         if send_telegram:
             filepath = Path(filename)
             if filepath.exists():
-                await coordinator.recorder.send_to_telegram(filepath, f"📹 Запись с OSD\n⏱ {duration} секунд")
+                await recorder.send_to_telegram(filepath, f"📹 Запись с OSD\n⏱ {duration} секунд")
                 _LOGGER.info("Video with OSD sent to Telegram")
         
         _LOGGER.info("Video with OSD recorded: %s", result["filename"])
@@ -555,17 +590,15 @@ async def async_record_with_osd(call: ServiceCall, hass: HomeAssistant) -> None:
     except Exception as err:
         _LOGGER.error("Failed to record video with OSD: %s", err)
         result = {"success": False, "error": str(err)}
-    
-    _LOGGER.debug("=" * 60)
 
 # ==================== Font Management ====================
 
 async def async_list_fonts(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle the list_fonts service call."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_id = extract_entity_id(call)
     coordinator = await find_coordinator_by_entity_id(hass, entity_id)
     
-    if hasattr(coordinator, 'recorder') and coordinator.recorder:
+    if coordinator:
         fonts = await coordinator.recorder.list_available_fonts()
         if fonts:
             message = f"📚 Найдено {len(fonts)} шрифтов:\n\n"
@@ -580,15 +613,11 @@ async def async_list_fonts(call: ServiceCall, hass: HomeAssistant) -> None:
             message += "Шрифты можно скачать с:\n"
             message += "https://github.com/dejavu-fonts/dejavu-fonts"
         
-        await hass.services.async_call(
-            "persistent_notification",
-            "create",
-            {
-                "title": "OpenIPC - Доступные шрифты",
-                "message": message,
-                "notification_id": "openipc_fonts"
-            },
-            blocking=True
+        persistent_notification.async_create(
+            hass,
+            message,
+            title="OpenIPC - Доступные шрифты",
+            notification_id="openipc_fonts",
         )
     else:
         _LOGGER.error("Recorder not initialized")
@@ -597,7 +626,7 @@ async def async_list_fonts(call: ServiceCall, hass: HomeAssistant) -> None:
 
 async def async_beward_open_door(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle Beward open door service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_id = extract_entity_id(call)
     main = call.data.get("main", True)
     
     coordinator = await find_coordinator_by_entity_id(hass, entity_id)
@@ -609,7 +638,7 @@ async def async_beward_open_door(call: ServiceCall, hass: HomeAssistant) -> None
 
 async def async_beward_play_beep(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle Beward play beep service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_id = extract_entity_id(call)
     
     coordinator = await find_coordinator_by_entity_id(hass, entity_id)
     if coordinator and hasattr(coordinator, 'beward') and coordinator.beward:
@@ -620,7 +649,7 @@ async def async_beward_play_beep(call: ServiceCall, hass: HomeAssistant) -> None
 
 async def async_beward_play_ringtone(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle Beward play ringtone service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_id = extract_entity_id(call)
     
     coordinator = await find_coordinator_by_entity_id(hass, entity_id)
     if coordinator and hasattr(coordinator, 'beward') and coordinator.beward:
@@ -631,7 +660,7 @@ async def async_beward_play_ringtone(call: ServiceCall, hass: HomeAssistant) ->
 
 async def async_beward_enable_audio(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle Beward enable audio service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_id = extract_entity_id(call)
     enable = call.data.get("enable", True)
     
     coordinator = await find_coordinator_by_entity_id(hass, entity_id)
@@ -643,7 +672,7 @@ async def async_beward_enable_audio(call: ServiceCall, hass: HomeAssistant) -> N
 
 async def async_beward_test(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle Beward test service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_id = extract_entity_id(call)
     
     coordinator = await find_coordinator_by_entity_id(hass, entity_id)
     if coordinator and hasattr(coordinator, 'beward') and coordinator.beward:
@@ -658,15 +687,11 @@ async def async_beward_test(call: ServiceCall, hass: HomeAssistant) -> None:
                 message += f"   Response: `{result['response'][:100]}`\n"
             message += "\n"
         
-        await hass.services.async_call(
-            "persistent_notification",
-            "create",
-            {
-                "title": "Beward Device Test",
-                "message": message,
-                "notification_id": "beward_test"
-            },
-            blocking=True
+        persistent_notification.async_create(
+            hass,
+            message,
+            title="Beward Device Test",
+            notification_id="beward_test",
         )
     else:
         _LOGGER.error("Beward device not available for entity %s", entity_id)
@@ -675,7 +700,7 @@ async def async_beward_test(call: ServiceCall, hass: HomeAssistant) -> None:
 
 async def async_lnpr_get_list(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle LNPR get list service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_id = extract_entity_id(call)
     
     coordinator = await find_coordinator_by_entity_id(hass, entity_id)
     if not coordinator:
@@ -693,15 +718,11 @@ async def async_lnpr_get_list(call: ServiceCall, hass: HomeAssistant) -> None:
             else:
                 message += "Список пуст"
             
-            await hass.services.async_call(
-                "persistent_notification",
-                "create",
-                {
-                    "title": f"LNPR Whitelist - {coordinator.recorder.camera_name}",
-                    "message": message,
-                    "notification_id": f"openipc_lnpr_list_{coordinator.entry.entry_id}"
-                },
-                blocking=True
+            persistent_notification.async_create(
+                hass,
+                message,
+                title=f"LNPR Whitelist - {coordinator.recorder.camera_name}",
+                notification_id=f"openipc_lnpr_list_{coordinator.entry.entry_id}",
             )
             return
     
@@ -729,15 +750,11 @@ async def async_lnpr_get_list(call: ServiceCall, hass: HomeAssistant) -> None:
                 else:
                     message += "Список пуст"
                 
-                await hass.services.async_call(
-                    "persistent_notification",
-                    "create",
-                    {
-                        "title": f"LNPR Whitelist - {coordinator.recorder.camera_name}",
-                        "message": message,
-                        "notification_id": f"openipc_lnpr_list_{coordinator.entry.entry_id}"
-                    },
-                    blocking=True
+                persistent_notification.async_create(
+                    hass,
+                    message,
+                    title=f"LNPR Whitelist - {coordinator.recorder.camera_name}",
+                    notification_id=f"openipc_lnpr_list_{coordinator.entry.entry_id}",
                 )
             else:
                 _LOGGER.error("Failed to get LNPR list: HTTP %d", response.status)
@@ -746,7 +763,7 @@ async def async_lnpr_get_list(call: ServiceCall, hass: HomeAssistant) -> None:
 
 async def async_lnpr_add_plate(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle LNPR add plate service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_id = extract_entity_id(call)
     number = call.data.get("number")
     begin = call.data.get("begin", "")
     end = call.data.get("end", "")
@@ -767,15 +784,11 @@ async def async_lnpr_add_plate(call: ServiceCall, hass: HomeAssistant) -> None:
             note=note
         )
         if success:
-            await hass.services.async_call(
-                "persistent_notification",
-                "create",
-                {
-                    "title": f"✅ Номер добавлен - {coordinator.recorder.camera_name}",
-                    "message": f"Номер {number} успешно добавлен в белый список",
-                    "notification_id": f"openipc_lnpr_add_{coordinator.entry.entry_id}"
-                },
-                blocking=True
+            persistent_notification.async_create(
+                hass,
+                f"Номер {number} успешно добавлен в белый список",
+                title=f"✅ Номер добавлен - {coordinator.recorder.camera_name}",
+                notification_id=f"openipc_lnpr_add_{coordinator.entry.entry_id}",
             )
             await coordinator.async_request_refresh()
             return
@@ -799,15 +812,11 @@ async def async_lnpr_add_plate(call: ServiceCall, hass: HomeAssistant) -> None:
         full_url = url + params
         async with coordinator.session.get(full_url, auth=coordinator.auth, timeout=10) as response:
             if response.status == 200:
-                await hass.services.async_call(
-                    "persistent_notification",
-                    "create",
-                    {
-                        "title": f"✅ Номер добавлен - {coordinator.recorder.camera_name}",
-                        "message": f"Номер {number} успешно добавлен в белый список",
-                        "notification_id": f"openipc_lnpr_add_{coordinator.entry.entry_id}"
-                    },
-                    blocking=True
+                persistent_notification.async_create(
+                    hass,
+                    f"Номер {number} успешно добавлен в белый список",
+                    title=f"✅ Номер добавлен - {coordinator.recorder.camera_name}",
+                    notification_id=f"openipc_lnpr_add_{coordinator.entry.entry_id}",
                 )
                 await coordinator.async_request_refresh()
             else:
@@ -817,7 +826,7 @@ async def async_lnpr_add_plate(call: ServiceCall, hass: HomeAssistant) -> None:
 
 async def async_lnpr_delete_plate(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle LNPR delete plate service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_id = extract_entity_id(call)
     number = call.data.get("number")
     
     coordinator = await find_coordinator_by_entity_id(hass, entity_id)
@@ -828,15 +837,11 @@ async def async_lnpr_delete_plate(call: ServiceCall, hass: HomeAssistant) -> Non
     if coordinator.use_addon and coordinator.addon.available:
         success = await coordinator.addon.async_lnpr_delete(coordinator.recorder.camera_name, number)
         if success:
-            await hass.services.async_call(
-                "persistent_notification",
-                "create",
-                {
-                    "title": f"✅ Номер удален - {coordinator.recorder.camera_name}",
-                    "message": f"Номер {number} успешно удален из белого списка",
-                    "notification_id": f"openipc_lnpr_delete_{coordinator.entry.entry_id}"
-                },
-                blocking=True
+            persistent_notification.async_create(
+                hass,
+                f"Номер {number} успешно удален из белого списка",
+                title=f"✅ Номер удален - {coordinator.recorder.camera_name}",
+                notification_id=f"openipc_lnpr_delete_{coordinator.entry.entry_id}",
             )
             await coordinator.async_request_refresh()
             return
@@ -849,15 +854,11 @@ async def async_lnpr_delete_plate(call: ServiceCall, hass: HomeAssistant) -> Non
         url = f"http://{coordinator.host}:{coordinator.port}/cgi-bin/lnpr_cgi?action=remove&Number={number}"
         async with coordinator.session.get(url, auth=coordinator.auth, timeout=10) as response:
             if response.status == 200:
-                await hass.services.async_call(
-                    "persistent_notification",
-                    "create",
-                    {
-                        "title": f"✅ Номер удален - {coordinator.recorder.camera_name}",
-                        "message": f"Номер {number} успешно удален из белого списка",
-                        "notification_id": f"openipc_lnpr_delete_{coordinator.entry.entry_id}"
-                    },
-                    blocking=True
+                persistent_notification.async_create(
+                    hass,
+                    f"Номер {number} успешно удален из белого списка",
+                    title=f"✅ Номер удален - {coordinator.recorder.camera_name}",
+                    notification_id=f"openipc_lnpr_delete_{coordinator.entry.entry_id}",
                 )
                 await coordinator.async_request_refresh()
             else:
@@ -867,7 +868,7 @@ async def async_lnpr_delete_plate(call: ServiceCall, hass: HomeAssistant) -> Non
 
 async def async_lnpr_export_events(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle LNPR export events service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_id = extract_entity_id(call)
     days = call.data.get("days", 7)
     
     coordinator = await find_coordinator_by_entity_id(hass, entity_id)
@@ -893,18 +894,14 @@ async def async_lnpr_export_events(call: ServiceCall, hass: HomeAssistant) -> No
                 with open(filename, 'w') as f:
                     f.write(text)
                 
-                await hass.services.async_call(
-                    "persistent_notification",
-                    "create",
-                    {
-                        "title": f"📊 LNPR Events - {coordinator.recorder.camera_name}",
-                        "message": f"✅ Экспорт завершен\n\n"
-                                  f"📁 Файл: {filename}\n"
-                                  f"📅 Период: {start_date.strftime('%Y-%m-%d')} - {end_date.strftime('%Y-%m-%d')}\n"
-                                  f"Размер: {len(text)} байт",
-                        "notification_id": f"openipc_lnpr_export_{coordinator.entry.entry_id}"
-                    },
-                    blocking=True
+                persistent_notification.async_create(
+                    hass,
+                    f"✅ Экспорт завершен\n\n"
+                    f"📁 Файл: {filename}\n"
+                    f"📅 Период: {start_date.strftime('%Y-%m-%d')} - {end_date.strftime('%Y-%m-%d')}\n"
+                    f"Размер: {len(text)} байт",
+                    title=f"📊 LNPR Events - {coordinator.recorder.camera_name}",
+                    notification_id=f"openipc_lnpr_export_{coordinator.entry.entry_id}",
                 )
             else:
                 _LOGGER.error("Failed to export LNPR events: HTTP %d", response.status)
@@ -913,7 +910,7 @@ async def async_lnpr_export_events(call: ServiceCall, hass: HomeAssistant) -> No
 
 async def async_lnpr_clear_events(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle LNPR clear events service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_id = extract_entity_id(call)
     
     coordinator = await find_coordinator_by_entity_id(hass, entity_id)
     if not coordinator or not coordinator.beward:
@@ -924,15 +921,11 @@ async def async_lnpr_clear_events(call: ServiceCall, hass: HomeAssistant) -> Non
         url = f"http://{coordinator.host}:{coordinator.port}/cgi-bin/lnprevent_cgi?action=clear"
         async with coordinator.session.get(url, auth=coordinator.auth, timeout=10) as response:
             if response.status == 200:
-                await hass.services.async_call(
-                    "persistent_notification",
-                    "create",
-                    {
-                        "title": f"✅ LNPR Events Cleared - {coordinator.recorder.camera_name}",
-                        "message": "Журнал событий LNPR успешно очищен",
-                        "notification_id": f"openipc_lnpr_clear_events_{coordinator.entry.entry_id}"
-                    },
-                    blocking=True
+                persistent_notification.async_create(
+                    hass,
+                    "Журнал событий LNPR успешно очищен",
+                    title=f"✅ LNPR Events Cleared - {coordinator.recorder.camera_name}",
+                    notification_id=f"openipc_lnpr_clear_events_{coordinator.entry.entry_id}",
                 )
             else:
                 _LOGGER.error("Failed to clear LNPR events: HTTP %d", response.status)
@@ -941,7 +934,7 @@ async def async_lnpr_clear_events(call: ServiceCall, hass: HomeAssistant) -> Non
 
 async def async_lnpr_clear_list(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle LNPR clear list service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_id = extract_entity_id(call)
     
     coordinator = await find_coordinator_by_entity_id(hass, entity_id)
     if not coordinator or not coordinator.beward:
@@ -952,15 +945,11 @@ async def async_lnpr_clear_list(call: ServiceCall, hass: HomeAssistant) -> None:
         url = f"http://{coordinator.host}:{coordinator.port}/cgi-bin/lnpr_cgi?action=clear"
         async with coordinator.session.get(url, auth=coordinator.auth, timeout=10) as response:
             if response.status == 200:
-                await hass.services.async_call(
-                    "persistent_notification",
-                    "create",
-                    {
-                        "title": f"✅ LNPR List Cleared - {coordinator.recorder.camera_name}",
-                        "message": "Список разрешенных номеров успешно очищен",
-                        "notification_id": f"openipc_lnpr_clear_list_{coordinator.entry.entry_id}"
-                    },
-                    blocking=True
+                persistent_notification.async_create(
+                    hass,
+                    "Список разрешенных номеров успешно очищен",
+                    title=f"✅ LNPR List Cleared - {coordinator.recorder.camera_name}",
+                    notification_id=f"openipc_lnpr_clear_list_{coordinator.entry.entry_id}",
                 )
                 await coordinator.async_request_refresh()
             else:
@@ -970,7 +959,7 @@ async def async_lnpr_clear_list(call: ServiceCall, hass: HomeAssistant) -> None:
 
 async def async_lnpr_get_picture(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle LNPR get picture service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_id = extract_entity_id(call)
     time_str = call.data.get("time")
     filename = call.data.get("filename")
     
@@ -990,15 +979,11 @@ async def async_lnpr_get_picture(call: ServiceCall, hass: HomeAssistant) -> None
                 with open(filename, 'wb') as f:
                     f.write(data)
                 
-                await hass.services.async_call(
-                    "persistent_notification",
-                    "create",
-                    {
-                        "title": f"✅ LNPR Picture Saved - {coordinator.recorder.camera_name}",
-                        "message": f"Изображение сохранено:\n{filename}\n\nРазмер: {len(data)} байт",
-                        "notification_id": f"openipc_lnpr_picture_{coordinator.entry.entry_id}"
-                    },
-                    blocking=True
+                persistent_notification.async_create(
+                    hass,
+                    f"Изображение сохранено:\n{filename}\n\nРазмер: {len(data)} байт",
+                    title=f"✅ LNPR Picture Saved - {coordinator.recorder.camera_name}",
+                    notification_id=f"openipc_lnpr_picture_{coordinator.entry.entry_id}",
                 )
             else:
                 _LOGGER.error("Failed to get LNPR picture: HTTP %d", response.status)
@@ -1009,7 +994,7 @@ async def async_lnpr_get_picture(call: ServiceCall, hass: HomeAssistant) -> None
 
 async def async_ptz_move(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle PTZ move service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_id = extract_entity_id(call)
     direction = call.data["direction"]
     speed = call.data.get("speed", 50)
     
@@ -1036,7 +1021,7 @@ async def async_ptz_move(call: ServiceCall, hass: HomeAssistant) -> None:
 
 async def async_ptz_goto_preset(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle PTZ goto preset service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_id = extract_entity_id(call)
     preset_id = call.data["preset_id"]
     
     coordinator = await find_coordinator_by_entity_id(hass, entity_id)
@@ -1062,7 +1047,7 @@ async def async_ptz_goto_preset(call: ServiceCall, hass: HomeAssistant) -> None:
 
 async def async_ptz_set_preset(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle PTZ set preset service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_id = extract_entity_id(call)
     preset_id = call.data["preset_id"]
     name = call.data.get("name", f"Preset {preset_id}")
     
@@ -1092,7 +1077,7 @@ async def async_ptz_set_preset(call: ServiceCall, hass: HomeAssistant) -> None:
 
 async def async_qr_scan(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle QR scan service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_id = extract_entity_id(call)
     timeout = call.data.get("timeout", 30)
     
     coordinator = await find_coordinator_by_entity_id(hass, entity_id)
@@ -1111,7 +1096,7 @@ async def async_qr_scan(call: ServiceCall, hass: HomeAssistant) -> None:
 
 async def async_qr_set_mode(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle QR set mode service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_id = extract_entity_id(call)
     mode = call.data["mode"]
     
     coordinator = await find_coordinator_by_entity_id(hass, entity_id)
@@ -1134,7 +1119,7 @@ async def async_qr_set_mode(call: ServiceCall, hass: HomeAssistant) -> None:
 
 async def async_qr_stop(call: ServiceCall, hass: HomeAssistant) -> None:
     """Handle QR stop service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_id = extract_entity_id(call)
     
     coordinator = await find_coordinator_by_entity_id(hass, entity_id)
     if not coordinator:
@@ -1153,7 +1138,7 @@ async def async_start_qr_scan(call: ServiceCall, hass: HomeAssistant) -> None:
     """Start continuous QR scanning for a camera."""
     _LOGGER.error(f"🔥🔥🔥 START_QR_SCAN CALLED with data: {call.data}")
     
-    entity_id = call.data.get('entity_id')
+    entity_id = extract_entity_id(call)
     expected_code = call.data.get('expected_code', 'a4625vol')
     timeout = call.data.get('timeout', 300)
     
@@ -1195,30 +1180,22 @@ async def async_start_qr_scan(call: ServiceCall, hass: HomeAssistant) -> None:
     if result and result.get('success'):
         _LOGGER.info(f"✅ Scan started with ID: {result.get('scan_id')}")
         
-        await hass.services.async_call(
-            "persistent_notification",
-            "create",
-            {
-                "title": "🔍 QR сканирование запущено",
-                "message": f"Сканирование запущено для камеры {entity_id}\n"
-                          f"Ожидаемый код: {expected_code}\n"
-                          f"Таймаут: {timeout} сек\n"
-                          f"ID: {result.get('scan_id')}",
-                "notification_id": f"qr_scan_start_{int(time.time())}"
-            },
-            blocking=True
+        persistent_notification.async_create(
+            hass,
+            f"Сканирование запущено для камеры {entity_id}\n"
+            f"Ожидаемый код: {expected_code}\n"
+            f"Таймаут: {timeout} сек\n"
+            f"ID: {result.get('scan_id')}",
+            title="🔍 QR сканирование запущено",
+            notification_id=f"qr_scan_start_{int(time.time())}",
         )
     else:
         _LOGGER.error(f"❌ Failed to start scan")
-        await hass.services.async_call(
-            "persistent_notification",
-            "create",
-            {
-                "title": "❌ Ошибка QR сканирования",
-                "message": f"Ошибка запуска сканирования для камеры {entity_id}",
-                "notification_id": f"qr_scan_error_{int(time.time())}"
-            },
-            blocking=True
+        persistent_notification.async_create(
+            hass,
+            f"Ошибка запуска сканирования для камеры {entity_id}",
+            title="❌ Ошибка QR сканирования",
+            notification_id=f"qr_scan_error_{int(time.time())}",
         )
 
 # ==================== OSD Services ====================
@@ -1228,7 +1205,7 @@ async def async_osd_set_text(call: ServiceCall, hass: HomeAssistant) -> None:
     _LOGGER.error(f"🔥🔥🔥 OSD_SET_TEXT CALLED in services_impl")
     _LOGGER.error(f"🔥 Full call.data: {call.data}")
     
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_id = extract_entity_id(call)
     region = call.data.get("region", 0)
     text = call.data.get("text", "")
     font = call.data.get("font", "UbuntuMono-Regular")
@@ -1291,7 +1268,7 @@ async def async_osd_set_text(call: ServiceCall, hass: HomeAssistant) -> None:
 
 async def async_osd_clear(call: ServiceCall, hass: HomeAssistant) -> None:
     """Clear OSD region service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_id = extract_entity_id(call)
     region = call.data.get("region", 0)
     save = call.data.get("save", True)
     
@@ -1315,7 +1292,7 @@ async def async_osd_clear(call: ServiceCall, hass: HomeAssistant) -> None:
 
 async def async_osd_set_time_format(call: ServiceCall, hass: HomeAssistant) -> None:
     """Set OSD time format service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_id = extract_entity_id(call)
     format_str = call.data.get("format", "%d.%m.%Y %H:%M:%S")
     
     coordinator = await find_coordinator_by_entity_id(hass, entity_id)
@@ -1336,7 +1313,7 @@ async def async_osd_set_time_format(call: ServiceCall, hass: HomeAssistant) -> N
 
 async def async_osd_upload_image(call: ServiceCall, hass: HomeAssistant) -> None:
     """Upload image to OSD region service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_id = extract_entity_id(call)
     region = call.data.get("region", 0)
     image_path = call.data.get("image_path")
     opacity = call.data.get("opacity", 255)
@@ -1371,7 +1348,7 @@ async def async_osd_upload_image(call: ServiceCall, hass: HomeAssistant) -> None
 
 async def async_osd_get_config(call: ServiceCall, hass: HomeAssistant) -> None:
     """Get OSD configuration service."""
-    entity_id = call.data.get(CONF_ENTITY_ID)
+    entity_id = extract_entity_id(call)
     
     coordinator = await find_coordinator_by_entity_id(hass, entity_id)
     if not coordinator or not hasattr(coordinator, 'osd_manager') or not coordinator.osd_manager:
@@ -1393,13 +1370,9 @@ async def async_osd_get_config(call: ServiceCall, hass: HomeAssistant) -> None:
         message += f"  • Font: {config.get('font', 'default')} ({config.get('size', 0)}px)\n"
         message += f"  • Color: {config.get('color', '#ffffff')}\n\n"
     
-    await hass.services.async_call(
-        "persistent_notification",
-        "create",
-        {
-            "title": f"OSD Configuration",
-            "message": message,
-            "notification_id": f"openipc_osd_config_{int(time.time())}"
-        },
-        blocking=True
+    persistent_notification.async_create(
+        hass,
+        message,
+        title=f"OSD Configuration",
+        notification_id=f"openipc_osd_config_{int(time.time())}",
     )
\ No newline at end of file
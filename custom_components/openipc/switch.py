@@ -2,13 +2,13 @@
 import logging
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from .const import DOMAIN, SWITCH_TYPES, NIGHT_ON, NIGHT_OFF, NIGHT_IRCUT, NIGHT_LIGHT, DEVICE_TYPE_BEWARD
+from .const import DOMAIN, DATA_COORDINATORS, SWITCH_TYPES, NIGHT_ON, NIGHT_OFF, NIGHT_IRCUT, NIGHT_LIGHT, DEVICE_TYPE_BEWARD
 
 _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up OpenIPC switches."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = hass.data[DOMAIN][DATA_COORDINATORS][entry.entry_id]
     device_type = entry.data.get("device_type", "openipc")
     
     entities = []
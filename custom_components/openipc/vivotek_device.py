@@ -2,6 +2,7 @@
 import logging
 import aiohttp
 import asyncio
+import base64
 import os
 import tempfile
 from typing import Optional, Dict, Any
@@ -12,6 +13,14 @@ import aiofiles
 
 _LOGGER = logging.getLogger(__name__)
 
+# Маркеры начала/конца JPEG кадра в MJPEG потоке
+JPEG_SOI = b"\xff\xd8\xff"
+JPEG_EOI = b"\xff\xd9"
+MJPEG_MAX_BUFFER = 2_000_000
+
+# Запросы идут через общую сессию HA - явно просим держать соединение с камерой
+KEEPALIVE_HEADERS = {"Connection": "keep-alive"}
+
 class OpenIPCVivotekDevice:
     """Vivotek device handler for SD9364-EHL based on actual camera configuration."""
 
@@ -27,6 +36,11 @@ class OpenIPCVivotekDevice:
         self._available = False
         self._auth = aiohttp.BasicAuth(username, password)
         
+        # Заголовок авторизации кодируем один раз, а не на каждый запрос
+        auth_str = f"{username}:{password}"
+        self._auth_header = "Basic " + base64.b64encode(auth_str.encode("utf-8")).decode("ascii")
+        self._headers = {**KEEPALIVE_HEADERS, "Authorization": self._auth_header}
+        
         # Настройки из конфигурации камеры
         self.http_port = 80
         self.rtsp_port = 554
@@ -58,7 +72,7 @@ class OpenIPCVivotekDevice:
         try:
             async with self.session.get(
                 f"http://{self.host}:{self.http_port}/cgi-bin/hello",
-                auth=self._auth,
+                headers=self._headers,
                 timeout=5
             ) as response:
                 self._available = response.status == 200
@@ -148,12 +162,23 @@ class OpenIPCVivotekDevice:
         _LOGGER.info("Trying HTTP snapshot as fallback")
         try:
             url = f"http://{self.host}:{self.http_port}/cgi-bin/viewer/video.mjpg"
-            async with self.session.get(url, auth=self._auth, timeout=5) as response:
+            async with self.session.get(url, headers=self._headers, timeout=5) as response:
                 if response.status == 200:
-                    data = await response.read()
-                    if len(data) > 1000:
-                        _LOGGER.info(f"✅ HTTP snapshot successful ({len(data)} bytes)")
-                        return data
+                    # video.mjpg - бесконечный поток, читаем до первого полного JPEG кадра
+                    buf = bytearray()
+                    async for chunk in response.content.iter_chunked(8192):
+                        buf.extend(chunk)
+                        start = buf.find(JPEG_SOI)
+                        end = buf.find(JPEG_EOI, start + 3) if start >= 0 else -1
+                        if start >= 0 and end >= 0:
+                            data = bytes(buf[start:end + 2])
+                            if len(data) > 1000:
+                                _LOGGER.info(f"✅ HTTP snapshot successful ({len(data)} bytes)")
+                                return data
+                            # Слишком маленький кадр - отбрасываем и ждем следующий
+                            del buf[:end + 2]
+                        if len(buf) > MJPEG_MAX_BUFFER:
+                            break
         except Exception as err:
             _LOGGER.debug(f"HTTP snapshot failed: {err}")
         